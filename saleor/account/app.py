@@ -1,16 +1,47 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save
 
 
 class AccountAppConfig(AppConfig):
     name = "saleor.account"
 
     def ready(self):
-        from .models import User
-        from .signals import delete_avatar
+        from ..permission.models import Permission
+        from .models import Group, User
+        from .signals import (
+            delete_avatar,
+            invalidate_group_permissions_auth_cache,
+            invalidate_permission_groups_cache,
+            invalidate_user_auth_cache,
+            invalidate_user_permissions_auth_cache,
+        )
 
         post_delete.connect(
             delete_avatar,
             sender=User,
             dispatch_uid="delete_user_avatar",
         )
+        # Drop users resolved from access tokens cached in `auth_cache`.
+        for signal in [post_save, post_delete]:
+            signal.connect(
+                invalidate_user_auth_cache,
+                sender=User,
+                dispatch_uid="invalidate_user_auth_cache",
+            )
+        for through in [User.groups.through, User.user_permissions.through]:
+            m2m_changed.connect(
+                invalidate_user_permissions_auth_cache,
+                sender=through,
+                dispatch_uid=f"invalidate_{through.__name__}_auth_cache",
+            )
+        m2m_changed.connect(
+            invalidate_group_permissions_auth_cache,
+            sender=Group.permissions.through,
+            dispatch_uid="invalidate_group_permissions_auth_cache",
+        )
+        for model in [Group, Permission]:
+            post_delete.connect(
+                invalidate_permission_groups_cache,
+                sender=model,
+                dispatch_uid=f"invalidate_{model.__name__}_auth_cache",
+            )
@@ -0,0 +1,131 @@
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import graphene
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from ..core.utils.cache_version import get_cache_version, invalidate_cache_version
+from ..permission.models import Permission
+from .models import User
+
+USER_CACHE_KEY_PREFIX = "jwt-user"
+PERMISSION_GROUPS_VERSION_KEY = "jwt-user-permission-groups-version"
+
+
+def get_user_cache_key(user_id: int) -> str:
+    return f"{USER_CACHE_KEY_PREFIX}:{user_id}"
+
+
+def _get_user_id_from_payload(payload: Dict[str, Any]) -> Optional[int]:
+    try:
+        _, user_id = graphene.Node.from_global_id(payload["user_id"])
+        return int(user_id)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def get_cached_user(payload: Dict[str, Any]) -> Optional[User]:
+    """Return the user of the access token payload with cached permissions.
+
+    Only the user's pk, token key and effective permissions are cached, the user
+    is loaded for each request, so the instance is never shared between requests.
+    The user is returned only if it matches the email and the token key of the
+    payload, and its permissions were cached after the last change of permission
+    groups. The returned user has the effective permissions already set.
+    """
+    if not settings.JWT_USER_CACHE_TIMEOUT:
+        return None
+    user_id = _get_user_id_from_payload(payload)
+    if user_id is None:
+        return None
+    user_key = get_user_cache_key(user_id)
+    cached = cache.get_many([user_key, PERMISSION_GROUPS_VERSION_KEY])
+    entry = cached.get(user_key)
+    version = cached.get(PERMISSION_GROUPS_VERSION_KEY)
+    if not entry or version is None or entry["version"] != version:
+        return None
+    if entry["jwt_token_key"] != payload.get("token"):
+        return None
+    user = User.objects.filter(pk=user_id, is_active=True).first()
+    if (
+        not user
+        or user.email != payload.get("email")
+        or user.jwt_token_key != entry["jwt_token_key"]
+        # Permissions aren't cached for superusers.
+        or user.is_superuser != (entry["permission_ids"] is None)
+    ):
+        return None
+    _set_effective_permissions(user, entry)
+    return user
+
+
+def cache_user(user: User, payload: Dict[str, Any]):
+    """Store the effective permissions of the user resolved from the access token.
+
+    The entry expires with the token at the latest.
+    """
+    if not settings.JWT_USER_CACHE_TIMEOUT:
+        return
+    if _get_user_id_from_payload(payload) != user.pk:
+        return
+    timeout = settings.JWT_USER_CACHE_TIMEOUT
+    if exp := payload.get("exp"):
+        timeout = min(timeout, int(exp - time.time()))
+    version = get_cache_version(PERMISSION_GROUPS_VERSION_KEY)
+    if timeout <= 0 or version is None:
+        return
+    entry: Dict[str, Any] = {
+        "version": version,
+        "user_id": user.pk,
+        "jwt_token_key": user.jwt_token_key,
+        "permission_ids": None,
+        "permissions": None,
+    }
+    # Superusers have all permissions, which don't have to be loaded to check them.
+    if not user.is_superuser:
+        permissions = list(
+            user.effective_permissions.values_list(
+                "pk", "content_type__app_label", "codename"
+            )
+        )
+        entry["permission_ids"] = [pk for pk, _, _ in permissions]
+        entry["permissions"] = {
+            f"{app_label}.{codename}" for _, app_label, codename in permissions
+        }
+    cache.set(get_user_cache_key(user.pk), entry, timeout)
+    _set_effective_permissions(user, entry)
+
+
+def _set_effective_permissions(user: User, entry: Dict[str, Any]):
+    if entry["permission_ids"] is None:
+        return
+    user.effective_permissions = (
+        Permission.objects.filter(pk__in=entry["permission_ids"])
+        .prefetch_related("content_type")
+        .order_by("codename")
+    )
+    user._effective_permissions_cache = entry["permissions"]
+
+
+def _run_now_and_on_commit(func: Callable[[], Any]):
+    func()
+    # Users could be cached again by other processes before the transaction is
+    # committed, so the changes have to be invalidated after the commit too.
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(func)
+
+
+def invalidate_users_auth_cache(user_ids: Iterable[int]):
+    if not settings.JWT_USER_CACHE_TIMEOUT:
+        return
+    keys = [get_user_cache_key(user_id) for user_id in user_ids]
+    _run_now_and_on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_permission_groups_auth_cache():
+    """Drop the cached permissions of all users."""
+    if not settings.JWT_USER_CACHE_TIMEOUT:
+        return
+    invalidate_cache_version(PERMISSION_GROUPS_VERSION_KEY)
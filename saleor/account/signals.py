@@ -1,6 +1,34 @@
 from ..core.tasks import delete_from_storage_task
+from .auth_cache import (
+    invalidate_permission_groups_auth_cache,
+    invalidate_users_auth_cache,
+)
+from .models import User
 
 
 def delete_avatar(sender, instance, **kwargs):
     if avatar := instance.avatar:
         delete_from_storage_task.delay(avatar.name)
+
+
+def invalidate_user_auth_cache(sender, instance, **kwargs):
+    invalidate_users_auth_cache([instance.pk])
+
+
+def invalidate_user_permissions_auth_cache(sender, instance, action, reverse, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse and isinstance(instance, User):
+        invalidate_users_auth_cache([instance.pk])
+    else:
+        # Users of a group or a permission were changed.
+        invalidate_permission_groups_auth_cache()
+
+
+def invalidate_group_permissions_auth_cache(sender, action, **kwargs):
+    if action.startswith("post_"):
+        invalidate_permission_groups_auth_cache()
+
+
+def invalidate_permission_groups_cache(sender, instance, **kwargs):
+    invalidate_permission_groups_auth_cache()
@@ -0,0 +1,112 @@
+import pytest
+from django.core.cache import cache
+from jwt import InvalidTokenError
+
+from ...core.auth_backend import JSONWebTokenBackend
+from ...core.jwt import create_access_token
+from ...permission.enums import ProductPermissions
+from ..auth_cache import get_user_cache_key
+from ..models import User
+
+
+@pytest.fixture
+def user_auth_cache_enabled(settings):
+    settings.JWT_USER_CACHE_TIMEOUT = 60
+    cache.clear()
+    yield settings
+    cache.clear()
+
+
+def _authenticate(rf, user):
+    access_token = create_access_token(user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    return JSONWebTokenBackend().authenticate(request), access_token
+
+
+def test_user_resolved_from_cache(
+    user_auth_cache_enabled, rf, staff_user, permission_manage_products
+):
+    # given
+    staff_user.user_permissions.add(permission_manage_products)
+    user, access_token = _authenticate(rf, staff_user)
+    assert user.has_perm(ProductPermissions.MANAGE_PRODUCTS)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+
+    # when
+    user = JSONWebTokenBackend().authenticate(request)
+
+    # then
+    assert user == staff_user
+    assert user.has_perm(ProductPermissions.MANAGE_PRODUCTS)
+    assert cache.get(get_user_cache_key(staff_user.pk))
+
+
+def test_cached_user_loaded_for_each_request(user_auth_cache_enabled, rf, staff_user):
+    # given
+    _, access_token = _authenticate(rf, staff_user)
+    # Updates made without signals don't invalidate the cache.
+    User.objects.filter(pk=staff_user.pk).update(first_name="Changed")
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+
+    # when
+    user = JSONWebTokenBackend().authenticate(request)
+
+    # then
+    assert user.first_name == "Changed"
+    entry = cache.get(get_user_cache_key(staff_user.pk))
+    assert entry["user_id"] == staff_user.pk
+    assert entry["jwt_token_key"] == staff_user.jwt_token_key
+    assert not any(isinstance(value, User) for value in entry.values())
+
+
+def test_cached_user_invalidated_on_token_key_rotation(
+    user_auth_cache_enabled, rf, staff_user
+):
+    # given
+    _, access_token = _authenticate(rf, staff_user)
+    staff_user.jwt_token_key = "new-token-key"
+    staff_user.save(update_fields=["jwt_token_key"])
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+
+    # when & then
+    with pytest.raises(InvalidTokenError):
+        JSONWebTokenBackend().authenticate(request)
+
+
+def test_cached_user_invalidated_on_deactivation(
+    user_auth_cache_enabled, rf, staff_user
+):
+    # given
+    _, access_token = _authenticate(rf, staff_user)
+    staff_user.is_active = False
+    staff_user.save(update_fields=["is_active"])
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+
+    # when & then
+    with pytest.raises(InvalidTokenError):
+        JSONWebTokenBackend().authenticate(request)
+
+
+def test_cached_user_invalidated_on_permission_group_change(
+    user_auth_cache_enabled, rf, staff_user, permission_group_manage_users
+):
+    # given
+    permission_group_manage_users.user_set.add(staff_user)
+    _, access_token = _authenticate(rf, staff_user)
+    permission_group_manage_users.permissions.clear()
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+
+    # when
+    user = JSONWebTokenBackend().authenticate(request)
+
+    # then
+    assert not user.effective_permissions.exists()
+
+
+def test_user_not_cached_when_cache_disabled(rf, staff_user):
+    # when
+    user, _ = _authenticate(rf, staff_user)
+
+    # then
+    assert user == staff_user
+    assert cache.get(get_user_cache_key(staff_user.pk)) is None
@@ -36,6 +36,12 @@ def cors_handler(application: ASGI3Application) -> ASGI3Application:
                     break
         if scope["method"] == "OPTIONS":
             scope = cast(HTTPScope, scope)
+            # Persisted queries can be sent with GET, so CDNs can cache them.
+            allowed_methods = (
+                b"GET, POST, OPTIONS"
+                if settings.GRAPHQL_PERSISTED_QUERIES_ENABLED
+                else b"POST, OPTIONS"
+            )
             response_headers: list[Tuple[bytes, bytes]] = [
                 (b"access-control-allow-credentials", b"true"),
                 (
@@ -43,7 +49,7 @@ def cors_handler(application: ASGI3Application) -> ASGI3Application:
                     b"Origin, Content-Type, Accept, Authorization, "
                     b"Authorization-Bearer",
                 ),
-                (b"access-control-allow-methods", b"POST, OPTIONS"),
+                (b"access-control-allow-methods", allowed_methods),
                 (b"access-control-max-age", b"600"),
                 (b"vary", b"Origin"),
             ]
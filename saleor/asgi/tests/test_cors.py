@@ -77,6 +77,18 @@ async def test_access_control_header_preflight(asgi_app: ASGI3Application, setti
     ]
 
 
+async def test_access_control_header_preflight_with_persisted_queries(
+    asgi_app: ASGI3Application, settings
+):
+    settings.ALLOWED_GRAPHQL_ORIGINS = ["*"]
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = True
+    cors_app = cors_handler(asgi_app)
+    events = await run_app(cors_app, build_scope("http://localhost:3000", "OPTIONS"))
+    assert (b"access-control-allow-methods", b"GET, POST, OPTIONS") in events[0][
+        "headers"
+    ]
+
+
 async def test_access_control_header_simple(asgi_app: ASGI3Application, settings):
     settings.ALLOWED_GRAPHQL_ORIGINS = ["*"]
     cors_app = cors_handler(asgi_app)
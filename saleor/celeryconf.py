@@ -35,6 +35,7 @@ app.autodiscover_tasks(
 )
 app.autodiscover_tasks(
     packages=[
+        "saleor.core.migrations.tasks",
         "saleor.discount.migrations.tasks",
     ],
     related_name="saleor3_17",
@@ -1,5 +1,6 @@
 import jwt
 
+from ..account.auth_cache import cache_user, get_cached_user
 from ..account.models import User
 from ..graphql.account.dataloaders import UserByEmailLoader
 from ..graphql.plugins.dataloaders import AnonymousPluginManagerLoader
@@ -127,20 +128,23 @@ def load_user_from_request(request):
         )
     permissions = payload.get(PERMISSIONS_FIELD, None)
 
-    user = UserByEmailLoader(request).load(payload["email"]).get()
     user_jwt_token = payload.get("token")
     if not user_jwt_token:
         raise jwt.InvalidTokenError(
             "Invalid token. Create new one by using tokenCreate mutation."
         )
-    elif not user:
-        raise jwt.InvalidTokenError(
-            "Invalid token. User does not exist or is inactive."
-        )
-    if user.jwt_token_key != user_jwt_token:
-        raise jwt.InvalidTokenError(
-            "Invalid token. Create new one by using tokenCreate mutation."
-        )
+    user = get_cached_user(payload)
+    if user is None:
+        user = UserByEmailLoader(request).load(payload["email"]).get()
+        if not user:
+            raise jwt.InvalidTokenError(
+                "Invalid token. User does not exist or is inactive."
+            )
+        if user.jwt_token_key != user_jwt_token:
+            raise jwt.InvalidTokenError(
+                "Invalid token. Create new one by using tokenCreate mutation."
+            )
+        cache_user(user, payload)
 
     if permissions is not None:
         token_permissions = get_permissions_from_names(permissions)
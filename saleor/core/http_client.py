@@ -1,8 +1,90 @@
+import os
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+
 import requests_hardened
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from requests_hardened.host_header_adapter import HostHeaderSSLAdapter
 
 from .. import user_agent_version
 
+
+class PooledManager(requests_hardened.Manager):
+    """Send requests through keep-alive sessions reused by each thread.
+
+    Requests are still filtered by `requests_hardened` before they are sent, and
+    the filter replaces the host with its resolved IP address, so connections are
+    pooled by allowed addresses only. Sessions aren't shared between threads,
+    because `HostHeaderSSLAdapter` keeps the host of the current request in its
+    connection pool arguments. Sessions don't keep cookies, as they would be sent
+    to all hosts resolved to the same address.
+    """
+
+    __slots__ = ("pool_connections", "pool_maxsize", "idle_timeout", "_local")
+
+    def __init__(
+        self,
+        config: requests_hardened.Config,
+        pool_connections: int,
+        pool_maxsize: int,
+        idle_timeout: float,
+    ):
+        super().__init__(config)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+        self._local = threading.local()
+
+    def get_session(self):
+        session = requests_hardened.HTTPSession(self.config)
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        session.mount(
+            "https://",
+            HostHeaderSSLAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+            ),
+        )
+        session.mount(
+            "http://",
+            HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+            ),
+        )
+        return session
+
+    def get_pooled_session(self):
+        now = time.monotonic()
+        session = getattr(self._local, "session", None)
+        # Connections of a session inherited from the parent of a forked worker
+        # are shared with the parent.
+        if session is not None and (
+            self._local.pid != os.getpid()
+            or now - self._local.last_used > self.idle_timeout
+        ):
+            session.close()
+            session = None
+        if session is None:
+            session = self._local.session = self.get_session()
+            self._local.pid = os.getpid()
+        self._local.last_used = now
+        return session
+
+    def close_pooled_session(self):
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            session.close()
+            self._local.session = None
+
+    def send_request(self, method: str, url: str, **kwargs):
+        if self.idle_timeout <= 0:
+            return super().send_request(method, url, **kwargs)
+        return self.get_pooled_session().request(method, url, **kwargs)
+
+
 HTTPConfig = requests_hardened.Config(
     ip_filter_enable=settings.HTTP_IP_FILTER_ENABLED,
     ip_filter_allow_loopback_ips=settings.HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS,
@@ -11,4 +93,9 @@ HTTPConfig = requests_hardened.Config(
     user_agent_override=user_agent_version,
 )
 
-HTTPClient = requests_hardened.Manager(HTTPConfig)
+HTTPClient = PooledManager(
+    HTTPConfig,
+    pool_connections=settings.HTTP_POOL_CONNECTIONS,
+    pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+    idle_timeout=settings.HTTP_POOL_IDLE_TIMEOUT,
+)
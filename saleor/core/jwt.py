@@ -1,3 +1,5 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, Iterable, Optional
 
@@ -5,6 +7,7 @@ import graphene
 import jwt
 from django.conf import settings
 
+from ..account.auth_cache import cache_user, get_cached_user
 from ..account.models import User
 from ..app.models import App, AppExtension
 from ..permission.enums import (
@@ -14,6 +17,7 @@ from ..permission.enums import (
 )
 from ..permission.models import Permission
 from .jwt_manager import get_jwt_manager
+from .utils.lru import LRUCache
 
 JWT_ACCESS_TYPE = "access"
 JWT_REFRESH_TYPE = "refresh"
@@ -27,6 +31,16 @@ JWT_SALEOR_OWNER_NAME = "saleor"
 JWT_OWNER_FIELD = "owner"
 
 
+def _get_decoded_token_cache_size() -> int:
+    return settings.JWT_DECODED_TOKEN_CACHE_SIZE
+
+
+# Per-process cache of verified token payloads, so the signature of a token sent
+# with many requests is checked only once. Entries are not used after the token
+# expires.
+decoded_token_cache: LRUCache[Dict[str, Any]] = LRUCache(_get_decoded_token_cache_size)
+
+
 def jwt_base_payload(
     exp_delta: Optional[timedelta], token_owner: str
 ) -> Dict[str, Any]:
@@ -81,8 +95,17 @@ def jwt_decode_with_exception_handler(
 def jwt_decode(
     token: str, verify_expiration=settings.JWT_EXPIRE, verify_aud: bool = False
 ) -> Dict[str, Any]:
+    token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    cache_key = (token_hash, bool(verify_expiration), verify_aud)
+    payload = decoded_token_cache.get(cache_key)
+    if payload is not None and not (
+        verify_expiration and "exp" in payload and payload["exp"] <= time.time()
+    ):
+        return payload.copy()
     jwt_manager = get_jwt_manager()
-    return jwt_manager.decode(token, verify_expiration, verify_aud=verify_aud)
+    payload = jwt_manager.decode(token, verify_expiration, verify_aud=verify_aud)
+    decoded_token_cache.set(cache_key, payload.copy())
+    return payload
 
 
 def create_token(payload: Dict[str, Any], exp_delta: timedelta) -> str:
@@ -112,6 +135,8 @@ def create_refresh_token(
 
 
 def get_user_from_payload(payload: Dict[str, Any], request=None) -> Optional[User]:
+    if user := get_cached_user(payload):
+        return user
     # TODO: dataloader
     user = User.objects.filter(email=payload["email"], is_active=True).first()
     user_jwt_token = payload.get("token")
@@ -123,6 +148,7 @@ def get_user_from_payload(payload: Dict[str, Any], request=None) -> Optional[Use
         raise jwt.InvalidTokenError(
             "Invalid token. Create new one by using tokenCreate mutation."
         )
+    cache_user(user, payload)
     return user
 
 
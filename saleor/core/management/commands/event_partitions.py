@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.core.management.base import CommandParser
+
+from ...partitions import maintain_event_partitions, partition_event_tables
+
+
+class Command(BaseCommand):
+    help = (
+        "Create upcoming partitions of event payloads, deliveries and attempts, and "
+        "drop partitions older than EVENT_PAYLOAD_DELETE_PERIOD. Requires "
+        "EVENT_PARTITIONING_ENABLED."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help="Convert the event tables to partitioned tables first. Writes to "
+            "the tables are locked while they are converted.",
+        )
+
+    def handle(self, **options):
+        if not settings.EVENT_PARTITIONING_ENABLED:
+            raise CommandError(
+                "Set EVENT_PARTITIONING_ENABLED for all Saleor processes "
+                "before partitioning the event tables."
+            )
+        if options["convert"]:
+            for table in partition_event_tables():
+                self.stdout.write(f"Partitioned {table}")
+        created, dropped = maintain_event_partitions()
+        for name in created:
+            self.stdout.write(f"Created partition {name}")
+        for name in dropped:
+            self.stdout.write(f"Dropped partition {name}")
@@ -1,8 +1,10 @@
+import asyncio
 import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Union
 
 from django.conf import settings
+from django.utils.decorators import sync_and_async_middleware
 
 from .jwt import JWT_REFRESH_TOKEN_COOKIE_NAME, jwt_decode_with_exception_handler
 
@@ -15,28 +17,39 @@ Requestor = Union["User", "App"]
 logger = logging.getLogger(__name__)
 
 
+@sync_and_async_middleware
 def jwt_refresh_token_middleware(get_response):
+    if asyncio.iscoroutinefunction(get_response):
+
+        async def async_middleware(request):
+            response = await get_response(request)
+            return set_refresh_token_cookie(request, response)
+
+        return async_middleware
+
     def middleware(request):
-        """Append generated refresh_token to response object."""
         response = get_response(request)
-        jwt_refresh_token = getattr(request, "refresh_token", None)
-        if jwt_refresh_token:
-            expires = None
-            secure = not settings.DEBUG
-            if settings.JWT_EXPIRE:
-                refresh_token_payload = jwt_decode_with_exception_handler(
-                    jwt_refresh_token
-                )
-                if refresh_token_payload and refresh_token_payload.get("exp"):
-                    expires = datetime.utcfromtimestamp(refresh_token_payload["exp"])
-            response.set_cookie(
-                JWT_REFRESH_TOKEN_COOKIE_NAME,
-                jwt_refresh_token,
-                expires=expires,
-                httponly=True,  # protects token from leaking
-                secure=secure,
-                samesite="None" if secure else "Lax",
-            )
-        return response
+        return set_refresh_token_cookie(request, response)
 
     return middleware
+
+
+def set_refresh_token_cookie(request, response):
+    """Append generated refresh_token to response object."""
+    jwt_refresh_token = getattr(request, "refresh_token", None)
+    if jwt_refresh_token:
+        expires = None
+        secure = not settings.DEBUG
+        if settings.JWT_EXPIRE:
+            refresh_token_payload = jwt_decode_with_exception_handler(jwt_refresh_token)
+            if refresh_token_payload and refresh_token_payload.get("exp"):
+                expires = datetime.utcfromtimestamp(refresh_token_payload["exp"])
+        response.set_cookie(
+            JWT_REFRESH_TOKEN_COOKIE_NAME,
+            jwt_refresh_token,
+            expires=expires,
+            httponly=True,  # protects token from leaking
+            secure=secure,
+            samesite="None" if secure else "Lax",
+        )
+    return response
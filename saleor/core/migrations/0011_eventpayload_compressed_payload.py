@@ -0,0 +1,36 @@
+# Generated by Django 3.2.22 on 2023-11-06 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0010_drop_vatlayer_tables"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RenameField(
+                    model_name="eventpayload",
+                    old_name="payload",
+                    new_name="legacy_payload",
+                ),
+                migrations.AlterField(
+                    model_name="eventpayload",
+                    name="legacy_payload",
+                    field=models.TextField(blank=True, db_column="payload", default=""),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="eventpayload",
+            name="compressed_payload",
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AddField(
+            model_name="eventpayload",
+            name="payload_hash",
+            field=models.CharField(max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 3.2.22 on 2023-11-06 10:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("core", "0011_eventpayload_compressed_payload"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    """
+                    CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS
+                    core_eventpayload_payload_hash_uniq
+                    ON core_eventpayload (payload_hash);
+                    """,
+                    """
+                    DROP INDEX CONCURRENTLY IF EXISTS
+                    core_eventpayload_payload_hash_uniq;
+                    """,
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name="eventpayload",
+                    constraint=models.UniqueConstraint(
+                        fields=("payload_hash",),
+                        name="core_eventpayload_payload_hash_uniq",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.22 on 2023-11-06 10:16
+
+from django.apps import apps as registry
+from django.db import migrations
+from django.db.models.signals import post_migrate
+
+from .tasks.saleor3_17 import compress_event_payloads_task
+
+
+def compress_event_payloads(apps, _schema_editor):
+    def on_migrations_complete(sender=None, **kwargs):
+        compress_event_payloads_task.delay()
+
+    sender = registry.get_app_config("core")
+    post_migrate.connect(on_migrations_complete, weak=False, sender=sender)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0012_eventpayload_payload_hash_uniq"),
+    ]
+
+    operations = [
+        migrations.RunPython(compress_event_payloads, migrations.RunPython.noop),
+    ]
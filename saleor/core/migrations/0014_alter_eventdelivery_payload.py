@@ -0,0 +1,23 @@
+# Generated by Django 3.2.22 on 2023-11-08 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0013_compress_event_payloads"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="eventdelivery",
+            name="payload",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="deliveries",
+                to="core.eventpayload",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import transaction
+
+from ....celeryconf import app
+from ...models import EventPayload
+
+# Batch of uncompressed payloads compressed by one task.
+BATCH_SIZE = 500
+
+
+@app.task
+def compress_event_payloads_task(start_pk=0):
+    """Compress payloads stored before `compressed_payload` was added."""
+    with transaction.atomic():
+        payloads = list(
+            EventPayload.objects.select_for_update(skip_locked=True)
+            .filter(pk__gt=start_pk, compressed_payload__isnull=True)
+            .order_by("pk")[:BATCH_SIZE]
+        )
+        for payload in payloads:
+            payload.payload = payload.legacy_payload
+        EventPayload.objects.bulk_update(
+            payloads, ["legacy_payload", "compressed_payload"]
+        )
+    if payloads:
+        compress_event_payloads_task.delay(payloads[-1].pk)
@@ -1,10 +1,14 @@
 import datetime
-from typing import Any, TypeVar
+import hashlib
+import zlib
+from typing import Any, List, TypeVar
 
 import pytz
+from django.conf import settings
 from django.contrib.postgres.indexes import GinIndex
-from django.db import models, transaction
-from django.db.models import F, JSONField, Max, Q
+from django.db import IntegrityError, connections, models, transaction
+from django.db.models import Exists, F, JSONField, Max, OuterRef, Q
+from django.utils import timezone
 
 from . import EventDeliveryStatus, JobStatus
 from .utils.json_serializer import CustomJsonEncoder
@@ -142,10 +146,134 @@ class Job(models.Model):
         abstract = True
 
 
+def compress_payload(payload: str) -> bytes:
+    return zlib.compress(payload.encode("utf-8"))
+
+
+def get_payload_hash(payload: str) -> str:
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EventPayloadQueryset(models.QuerySet["EventPayload"]):
+    def create_with_payloads(self, payloads: List[str]) -> List["EventPayload"]:
+        """Store compressed payloads, reusing stored payloads with the same content.
+
+        Return an event payload for each of the given payloads. Stored payloads are
+        locked until the transaction is committed, so they aren't deleted as unused
+        before deliveries created in the same transaction reference them.
+
+        Partitioned payloads are dropped with the partition of their creation date,
+        so they are reused only by payloads given in the same call.
+        """
+        hashes = [get_payload_hash(payload) for payload in payloads]
+        if not hashes:
+            return []
+        compressed_payloads = {
+            payload_hash: compress_payload(payload)
+            for payload_hash, payload in zip(hashes, payloads)
+        }
+        partitioned = settings.EVENT_PARTITIONING_ENABLED
+        self._for_write = True
+        connection = connections[self.db]
+        qn = connection.ops.quote_name
+        opts = self.model._meta
+        columns = [
+            qn(opts.get_field(name).column)
+            for name in [
+                "legacy_payload",
+                "compressed_payload",
+                "payload_hash",
+                "created_at",
+            ]
+        ]
+        hash_column, created_at_column = columns[-2:]
+        # Rows are sorted, so transactions lock stored payloads in the same order.
+        sorted_hashes = sorted(compressed_payloads)
+        params: List[Any] = []
+        now = timezone.now()
+        for payload_hash in sorted_hashes:
+            stored_hash = None if partitioned else payload_hash
+            params.extend(["", compressed_payloads[payload_hash], stored_hash, now])
+        values = ", ".join(["(%s, %s, %s, %s)"] * len(sorted_hashes))
+        sql = f"INSERT INTO {qn(opts.db_table)} ({', '.join(columns)}) VALUES {values} "
+        if not partitioned:
+            # Updating a conflicting row locks it, unlike `DO NOTHING`.
+            sql += (
+                f"ON CONFLICT ({hash_column}) "
+                f"DO UPDATE SET {hash_column} = EXCLUDED.{hash_column} "
+            )
+        sql += f"RETURNING {qn(opts.pk.column)}, {created_at_column}"
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+
+        event_payloads = {}
+        for payload_hash, (pk, created_at) in zip(sorted_hashes, rows):
+            event_payload = self.model(
+                pk=pk,
+                legacy_payload="",
+                compressed_payload=compressed_payloads[payload_hash],
+                payload_hash=None if partitioned else payload_hash,
+                created_at=created_at,
+            )
+            event_payload._state.adding = False
+            event_payload._state.db = self.db
+            event_payloads[payload_hash] = event_payload
+        return [event_payloads[payload_hash] for payload_hash in hashes]
+
+    def create_with_payload(self, payload: str) -> "EventPayload":
+        return self.create_with_payloads([payload])[0]
+
+    def delete_unused(self) -> int:
+        """Delete the payloads not referenced by any delivery in a single query.
+
+        Payloads are shared by deliveries, so they aren't deleted with them.
+        Return the number of deleted payloads.
+        """
+        deliveries = EventDelivery.objects.filter(payload_id=OuterRef("pk"))
+        unused = self.filter(~Exists(deliveries))
+        try:
+            with transaction.atomic(using=self.db):
+                deleted = unused._raw_delete(self.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+                # Check the deferred foreign keys before leaving the savepoint.
+                connections[self.db].check_constraints()
+        except IntegrityError:
+            # Deliveries referencing the payload were committed by concurrent
+            # transactions after the query started.
+            return 0
+        return deleted
+
+
+EventPayloadManager = models.Manager.from_queryset(EventPayloadQueryset)
+
+
 class EventPayload(models.Model):
-    payload = models.TextField()
+    # Uncompressed payloads stored before `compressed_payload` was added.
+    legacy_payload = models.TextField(db_column="payload", blank=True, default="")
+    compressed_payload = models.BinaryField(null=True)
+    payload_hash = models.CharField(max_length=64, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = EventPayloadManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["payload_hash"], name="core_eventpayload_payload_hash_uniq"
+            ),
+        ]
+
+    @property
+    def payload(self) -> str:
+        if self.compressed_payload is None:
+            return self.legacy_payload
+        return zlib.decompress(self.compressed_payload).decode("utf-8")
+
+    @payload.setter
+    def payload(self, value: str):
+        self.legacy_payload = ""
+        self.compressed_payload = compress_payload(value)
+
 
 class EventDelivery(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -156,7 +284,7 @@ class EventDelivery(models.Model):
     )
     event_type = models.CharField(max_length=255)
     payload = models.ForeignKey(
-        EventPayload, related_name="deliveries", null=True, on_delete=models.CASCADE
+        EventPayload, related_name="deliveries", null=True, on_delete=models.DO_NOTHING
     )
     webhook = models.ForeignKey("webhook.Webhook", on_delete=models.CASCADE)
 
@@ -183,3 +311,11 @@ class EventDeliveryAttempt(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+
+
+class PersistedQuery(models.Model):
+    """GraphQL query registered by its hash with `register_persisted_queries`."""
+
+    query_hash = models.CharField(max_length=64, unique=True)
+    query = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
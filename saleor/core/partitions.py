@@ -0,0 +1,336 @@
+"""Range partitioning of event delivery tables by the date of creation.
+
+Partitioned tables have a partition for each day, dropped when the day is older
+than `EVENT_PAYLOAD_DELETE_PERIOD`. Primary keys of partitioned tables include
+`created_at`, so foreign keys between the event tables are dropped when they are
+partitioned. Rows of each table expire by their own creation date, as payloads
+are shared by deliveries created later.
+"""
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.backends.utils import truncate_name
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import EventDelivery, EventDeliveryAttempt, EventPayload
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_MODELS = [EventPayload, EventDelivery, EventDeliveryAttempt]
+
+# Number of days ahead for which partitions are created.
+PARTITIONS_AHEAD = 7
+
+# Number of expired rows deleted from a default partition in one query.
+DEFAULT_PARTITION_DELETE_BATCH_SIZE = 1000
+
+PARTITION_BOUND_RE = re.compile(
+    r"FROM \((?:MINVALUE|'(?P<start>[^']+)')\) TO \((?:MAXVALUE|'(?P<end>[^']+)')\)"
+)
+
+
+class Partition(NamedTuple):
+    name: str
+    start: Optional[datetime]
+    end: Optional[datetime]
+
+
+def qn(name: str) -> str:
+    return connection.ops.quote_name(name)
+
+
+def get_name(name: str) -> str:
+    return truncate_name(name, connection.ops.max_name_length())
+
+
+def get_day_start(value: datetime) -> datetime:
+    return value.astimezone(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def get_partition_name(table: str, day: datetime) -> str:
+    return f"{table}_p{day:%Y%m%d}"
+
+
+def get_default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def get_legacy_partition_name(table: str) -> str:
+    return f"{table}_legacy"
+
+
+def is_partitioned(table: str) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS ("
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))",
+            [table],
+        )
+        return cursor.fetchone()[0]
+
+
+def get_partitioned_tables() -> List[str]:
+    tables = [model._meta.db_table for model in PARTITIONED_MODELS]
+    return [table for table in tables if is_partitioned(table)]
+
+
+def parse_partition_bound(bound: str) -> Optional[Tuple[datetime, datetime]]:
+    """Return the range of a partition bound, or None for the default partition."""
+    match = PARTITION_BOUND_RE.search(bound)
+    if not match:
+        return None
+    start, end = match.group("start", "end")
+    return (
+        parse_datetime(start) if start else None,
+        parse_datetime(end) if end else None,
+    )
+
+
+def get_partitions(table: str) -> List[Partition]:
+    """Return the partitions of a table, without its default partition."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = %s::regclass",
+            [table],
+        )
+        rows = cursor.fetchall()
+    partitions = []
+    for name, bound in rows:
+        bound_range = parse_partition_bound(bound)
+        if bound_range is not None:
+            partitions.append(Partition(name, *bound_range))
+    return partitions
+
+
+def has_default_partition_rows(cursor, table: str, start: datetime, end: datetime):
+    cursor.execute(
+        f"SELECT EXISTS (SELECT 1 FROM {qn(get_default_partition_name(table))} "
+        "WHERE created_at >= %s AND created_at < %s)",
+        [start, end],
+    )
+    return cursor.fetchone()[0]
+
+
+def create_event_partitions(now: Optional[datetime] = None) -> List[str]:
+    """Create missing daily partitions up to `PARTITIONS_AHEAD` days from now.
+
+    Days skipped before, because the default partition contained their rows, are
+    created once the rows are deleted.
+    """
+    today = get_day_start(now or timezone.now())
+    last_day = today + timedelta(days=PARTITIONS_AHEAD)
+    created = []
+    for table in get_partitioned_tables():
+        partitions = get_partitions(table)
+        names = {partition.name for partition in partitions}
+        # Days before the end of the legacy partition are stored in it.
+        day = max(
+            [today]
+            + [p.end for p in partitions if p.start is None and p.end is not None]
+        )
+        with connection.cursor() as cursor:
+            while day <= last_day:
+                next_day = day + timedelta(days=1)
+                name = get_partition_name(table, day)
+                if name in names:
+                    day = next_day
+                    continue
+                if has_default_partition_rows(cursor, table, day, next_day):
+                    # Rows of missing partitions are stored in the default one, and
+                    # the partition can't be created until they are deleted.
+                    logger.warning(
+                        "Partition %s not created, the default partition contains "
+                        "its rows.",
+                        name,
+                    )
+                else:
+                    cursor.execute(
+                        f"CREATE TABLE IF NOT EXISTS {qn(name)} "
+                        f"PARTITION OF {qn(table)} FOR VALUES FROM (%s) TO (%s)",
+                        [day, next_day],
+                    )
+                    created.append(name)
+                day = next_day
+    return created
+
+
+def drop_expired_event_partitions(now: Optional[datetime] = None) -> List[str]:
+    """Drop partitions with rows older than `EVENT_PAYLOAD_DELETE_PERIOD`."""
+    delete_period_start = (now or timezone.now()) - settings.EVENT_PAYLOAD_DELETE_PERIOD
+    dropped = []
+    for table in get_partitioned_tables():
+        with connection.cursor() as cursor:
+            for partition in get_partitions(table):
+                if partition.end is None or partition.end > delete_period_start:
+                    continue
+                cursor.execute(f"DROP TABLE {qn(partition.name)}")
+                dropped.append(partition.name)
+    return dropped
+
+
+def delete_expired_default_partition_rows(now: Optional[datetime] = None) -> int:
+    """Delete rows older than `EVENT_PAYLOAD_DELETE_PERIOD` from default partitions.
+
+    Rows are stored in the default partition when the partition of their day is
+    missing, so they aren't dropped with it.
+    """
+    delete_period_start = (now or timezone.now()) - settings.EVENT_PAYLOAD_DELETE_PERIOD
+    deleted = 0
+    for table in get_partitioned_tables():
+        default_partition = qn(get_default_partition_name(table))
+        with connection.cursor() as cursor:
+            while True:
+                cursor.execute(
+                    f"DELETE FROM {default_partition} WHERE ctid IN ("
+                    f"SELECT ctid FROM {default_partition} "
+                    "WHERE created_at <= %s LIMIT %s)",
+                    [delete_period_start, DEFAULT_PARTITION_DELETE_BATCH_SIZE],
+                )
+                deleted += cursor.rowcount
+                if cursor.rowcount < DEFAULT_PARTITION_DELETE_BATCH_SIZE:
+                    break
+    return deleted
+
+
+def maintain_event_partitions(
+    now: Optional[datetime] = None,
+) -> Tuple[List[str], List[str]]:
+    """Create upcoming partitions and drop or delete expired rows."""
+    deleted = delete_expired_default_partition_rows(now)
+    if deleted:
+        logger.info("Deleted %s expired rows of default event partitions.", deleted)
+    return create_event_partitions(now), drop_expired_event_partitions(now)
+
+
+def prepare_table_for_partitioning(cursor, table: str, first_day: datetime):
+    """Build indexes and constraints needed to attach the table as a partition.
+
+    They are built without locking writes to the table, so the table is locked
+    only while it is converted. Indexes can't be built concurrently in a
+    transaction, so there they lock writes.
+    """
+    concurrently = "" if connection.in_atomic_block else "CONCURRENTLY "
+    cursor.execute(
+        f"CREATE UNIQUE INDEX {concurrently}IF NOT EXISTS "
+        f"{qn(get_name(f'{table}_id_created_at_uniq'))} "
+        f"ON {qn(table)} (id, created_at)"
+    )
+    check = qn(get_name(f"{table}_created_at_check"))
+    cursor.execute(f"ALTER TABLE {qn(table)} DROP CONSTRAINT IF EXISTS {check}")
+    cursor.execute(
+        f"ALTER TABLE {qn(table)} ADD CONSTRAINT {check} "
+        "CHECK (created_at < %s) NOT VALID",
+        [first_day],
+    )
+    cursor.execute(f"ALTER TABLE {qn(table)} VALIDATE CONSTRAINT {check}")
+
+
+def drop_event_foreign_keys(cursor, tables: List[str]):
+    cursor.execute(
+        "SELECT conrelid::regclass::text, conname FROM pg_constraint "
+        "WHERE contype = 'f' AND confrelid = ANY(%s::regclass[])",
+        [tables],
+    )
+    for table, name in cursor.fetchall():
+        cursor.execute(f"ALTER TABLE {table} DROP CONSTRAINT {qn(name)}")
+
+
+def convert_table_to_partitioned(cursor, table: str, first_day: datetime):
+    """Replace the table with a partitioned table and attach it as a partition.
+
+    The attached partition keeps rows created before the first daily partition.
+    """
+    legacy_table = get_legacy_partition_name(table)
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [table])
+    (sequence,) = cursor.fetchone()
+    cursor.execute(
+        "SELECT index.relname, pg_get_indexdef(pg_index.indexrelid), "
+        "pg_index.indisunique "
+        "FROM pg_index JOIN pg_class index ON index.oid = pg_index.indexrelid "
+        "WHERE pg_index.indrelid = %s::regclass",
+        [table],
+    )
+    indexes = cursor.fetchall()
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE contype = 'f' AND conrelid = %s::regclass",
+        [table],
+    )
+    foreign_keys = cursor.fetchall()
+
+    cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(legacy_table)}")
+    # Indexes of the partitioned table are created with the names Django expects.
+    for name, _, _ in indexes:
+        cursor.execute(
+            f"ALTER INDEX {qn(name)} RENAME TO {qn(get_name(f'{name}_legacy'))}"
+        )
+    cursor.execute(
+        f"CREATE TABLE {qn(table)} "
+        f"(LIKE {qn(legacy_table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    cursor.execute(
+        f"ALTER TABLE {qn(table)} DROP CONSTRAINT "
+        f"{qn(get_name(f'{table}_created_at_check'))}"
+    )
+    cursor.execute(f"ALTER TABLE {qn(table)} ADD PRIMARY KEY (id, created_at)")
+    # Unique indexes of the partitioned table must contain the partition key,
+    # payloads partitioned by the date aren't unique by their hash.
+    for _, definition, unique in indexes:
+        if not unique:
+            cursor.execute(definition)
+    for name, definition in foreign_keys:
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}"
+        )
+    # Otherwise the sequence would be dropped with the legacy partition.
+    cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {qn(table)}.id")
+    cursor.execute(
+        f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(legacy_table)} "
+        "FOR VALUES FROM (MINVALUE) TO (%s)",
+        [first_day],
+    )
+    cursor.execute(
+        f"CREATE TABLE {qn(get_default_partition_name(table))} "
+        f"PARTITION OF {qn(table)} DEFAULT"
+    )
+
+
+def partition_event_tables(now: Optional[datetime] = None) -> List[str]:
+    """Convert event tables to tables partitioned by the date of creation.
+
+    Existing rows are kept in a partition of dates before the first daily
+    partition, dropped as others when it's older than `EVENT_PAYLOAD_DELETE_PERIOD`.
+    """
+    # Rows are written to the tables until they are converted, so the first day
+    # isn't the current one.
+    first_day = get_day_start(now or timezone.now()) + timedelta(days=2)
+    tables = [
+        model._meta.db_table
+        for model in PARTITIONED_MODELS
+        if not is_partitioned(model._meta.db_table)
+    ]
+    if not tables:
+        return []
+    with connection.cursor() as cursor:
+        for table in tables:
+            prepare_table_for_partitioning(cursor, table, first_day)
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            drop_event_foreign_keys(
+                cursor, [model._meta.db_table for model in PARTITIONED_MODELS]
+            )
+            for table in tables:
+                convert_table_to_partitioned(cursor, table, first_day)
+    create_event_partitions(now)
+    return tables
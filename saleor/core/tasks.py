@@ -1,5 +1,6 @@
 import datetime
 import logging
+from typing import Collection, List
 
 from botocore.exceptions import ClientError
 from celery.utils.log import get_task_logger
@@ -9,7 +10,12 @@ from django.db.models import Exists, OuterRef
 from django.utils import timezone
 
 from ..celeryconf import app
-from .models import EventDelivery, EventPayload
+from .models import EventDelivery, EventDeliveryAttempt, EventPayload
+from .partitions import (
+    PARTITIONED_MODELS,
+    get_partitioned_tables,
+    maintain_event_partitions,
+)
 
 task_logger: logging.Logger = get_task_logger(__name__)
 
@@ -24,22 +30,73 @@ def delete_from_storage_task(path):
     default_storage.delete(path)
 
 
+def is_expired_by_rows(model, partitioned_tables: Collection[str]) -> bool:
+    return model._meta.db_table not in partitioned_tables
+
+
+def delete_expired_event_rows(
+    delete_period: datetime.datetime, partitioned_tables: Collection[str] = ()
+) -> int:
+    """Delete a batch of attempts, deliveries and unused payloads created before.
+
+    Rows expire by their own creation date, as payloads are shared by deliveries
+    created later. Rows of partitioned tables are dropped with their partitions
+    instead. Return the number of deleted rows.
+    """
+    deleted = 0
+    if is_expired_by_rows(EventDeliveryAttempt, partitioned_tables):
+        attempt_ids = list(
+            EventDeliveryAttempt.objects.filter(created_at__lte=delete_period)
+            .order_by()
+            .values_list("pk", flat=True)[:BATCH_SIZE]
+        )
+        deleted_attempts, _ = EventDeliveryAttempt.objects.filter(
+            pk__in=attempt_ids
+        ).delete()
+        deleted += deleted_attempts
+    if is_expired_by_rows(EventDelivery, partitioned_tables):
+        delivery_ids = list(
+            EventDelivery.objects.filter(created_at__lte=delete_period)
+            .order_by()
+            .values_list("pk", flat=True)[:BATCH_SIZE]
+        )
+        deleted_deliveries, _ = EventDelivery.objects.filter(
+            pk__in=delivery_ids
+        ).delete()
+        deleted += deleted_deliveries
+    if is_expired_by_rows(EventPayload, partitioned_tables):
+        deliveries = EventDelivery.objects.filter(payload_id=OuterRef("pk"))
+        payload_ids = list(
+            EventPayload.objects.filter(
+                ~Exists(deliveries), created_at__lte=delete_period
+            )
+            .order_by()
+            .values_list("pk", flat=True)[:BATCH_SIZE]
+        )
+        deleted += EventPayload.objects.filter(pk__in=payload_ids).delete_unused()
+    return deleted
+
+
 @app.task
 def delete_event_payloads_task(expiration_date=None):
+    partitioned_tables: List[str] = []
+    if settings.EVENT_PARTITIONING_ENABLED:
+        if expiration_date is None:
+            _, dropped = maintain_event_partitions()
+            if dropped:
+                task_logger.info("Dropped event partitions: %s", ", ".join(dropped))
+        # Tables not converted yet by `event_partitions --convert` are still
+        # cleared by deleting rows.
+        partitioned_tables = get_partitioned_tables()
+        if len(partitioned_tables) == len(PARTITIONED_MODELS):
+            return
     expiration_date = expiration_date or timezone.now() + datetime.timedelta(minutes=60)
+    if expiration_date <= timezone.now():
+        task_logger.warning("Task invocation time limit reached, aborting task")
+        return
     delete_period = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
-    valid_deliveries = EventDelivery.objects.filter(created_at__gt=delete_period)
-    payloads_to_delete = EventPayload.objects.filter(
-        ~Exists(valid_deliveries.filter(payload_id=OuterRef("id")))
-    ).order_by("-pk")
-    ids = payloads_to_delete.values_list("pk", flat=True)[:BATCH_SIZE]
-    qs = EventPayload.objects.filter(pk__in=ids)
-    if ids:
-        if expiration_date > timezone.now():
-            qs.delete()
-            delete_event_payloads_task.delay(expiration_date)
-        else:
-            task_logger.warning("Task invocation time limit reached, aborting task")
+    if delete_expired_event_rows(delete_period, partitioned_tables):
+        delete_event_payloads_task.delay(expiration_date)
 
 
 @app.task(
@@ -0,0 +1,55 @@
+import pytest
+from django.core.cache import cache
+
+from ..utils.cache_version import (
+    get_cache_version,
+    get_cache_versions,
+    invalidate_cache_version,
+)
+
+VERSION_KEY = "test-version"
+
+
+@pytest.fixture(autouse=True)
+def clear_version():
+    cache.delete(VERSION_KEY)
+    yield
+    cache.delete(VERSION_KEY)
+
+
+def test_get_cache_version_stored_once():
+    # given
+    version = get_cache_version(VERSION_KEY)
+
+    # when
+    stored_version = get_cache_version(VERSION_KEY)
+
+    # then
+    assert version is not None
+    assert stored_version == version
+    assert get_cache_versions([VERSION_KEY]) == {VERSION_KEY: version}
+
+
+def test_get_cache_version_after_eviction():
+    # given
+    version = get_cache_version(VERSION_KEY)
+    invalidate_cache_version(VERSION_KEY)
+    cache.delete(VERSION_KEY)
+
+    # when
+    new_version = get_cache_version(VERSION_KEY)
+
+    # then
+    assert new_version > version + 1
+
+
+def test_invalidate_cache_version_after_commit(django_capture_on_commit_callbacks):
+    # given
+    version = get_cache_version(VERSION_KEY)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_cache_version(VERSION_KEY)
+
+    # then
+    assert get_cache_version(VERSION_KEY) == version + 2
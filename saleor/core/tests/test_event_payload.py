@@ -0,0 +1,82 @@
+from ...webhook.event_types import WebhookEventAsyncType
+from ..migrations.tasks.saleor3_17 import compress_event_payloads_task
+from ..models import EventDelivery, EventPayload, get_payload_hash
+
+PAYLOAD = '{"key": "data"}'
+
+
+def test_create_with_payloads():
+    # when
+    first, second, third = EventPayload.objects.create_with_payloads(
+        [PAYLOAD, '{"key": "other"}', PAYLOAD]
+    )
+
+    # then
+    assert first.pk == third.pk
+    assert first.pk != second.pk
+    assert EventPayload.objects.count() == 2
+    stored = EventPayload.objects.get(pk=first.pk)
+    assert stored.payload == PAYLOAD
+    assert stored.legacy_payload == ""
+    assert stored.payload_hash == get_payload_hash(PAYLOAD)
+
+
+def test_create_with_payload_reuses_stored_payload():
+    # given
+    event_payload = EventPayload.objects.create_with_payload(PAYLOAD)
+
+    # when
+    reused_payload = EventPayload.objects.create_with_payload(PAYLOAD)
+
+    # then
+    assert reused_payload.pk == event_payload.pk
+    assert reused_payload.payload == PAYLOAD
+    assert EventPayload.objects.count() == 1
+
+
+def test_legacy_payload():
+    # given
+    event_payload = EventPayload.objects.create(legacy_payload=PAYLOAD)
+
+    # when
+    event_payload.refresh_from_db()
+
+    # then
+    assert event_payload.compressed_payload is None
+    assert event_payload.payload == PAYLOAD
+
+
+def test_compress_event_payloads_task():
+    # given
+    legacy_payloads = [
+        EventPayload.objects.create(legacy_payload=PAYLOAD) for _ in range(2)
+    ]
+
+    # when
+    compress_event_payloads_task()
+
+    # then
+    for event_payload in legacy_payloads:
+        event_payload.refresh_from_db()
+        assert event_payload.legacy_payload == ""
+        assert event_payload.compressed_payload is not None
+        assert event_payload.payload == PAYLOAD
+
+
+def test_delete_unused(webhook):
+    # given
+    unused_payload = EventPayload.objects.create_with_payload(PAYLOAD)
+    used_payload = EventPayload.objects.create_with_payload('{"key": "other"}')
+    delivery = EventDelivery.objects.create(
+        event_type=WebhookEventAsyncType.ANY, payload=used_payload, webhook=webhook
+    )
+
+    # when
+    deleted = EventPayload.objects.filter(
+        pk__in=[unused_payload.pk, used_payload.pk]
+    ).delete_unused()
+
+    # then
+    assert deleted == 1
+    assert list(EventPayload.objects.values_list("pk", flat=True)) == [used_payload.pk]
+    assert EventDelivery.objects.filter(pk=delivery.pk).exists()
@@ -1,8 +1,17 @@
+import dataclasses
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
+
+import pytest
 import requests_hardened
 from django.conf import settings
 from requests import Request
+from requests_hardened.ip_filter import InvalidIPAddress
 
 from ... import user_agent_version
+from ..http_client import PooledManager
 
 HTTPConfig = requests_hardened.Config(
     ip_filter_enable=settings.HTTP_IP_FILTER_ENABLED,
@@ -13,6 +22,29 @@ HTTPConfig = requests_hardened.Config(
 )
 
 
+class CookieRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.cookie_headers.append(self.headers.get("Cookie"))
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=secret; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def cookie_server():
+    server = HTTPServer(("127.0.0.1", 0), CookieRequestHandler)
+    server.cookie_headers = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
 def test_user_agent_override():
     # given
     request = Request("GET", "http://www.example.com")
@@ -25,3 +57,87 @@ def test_user_agent_override():
 
     # then
     assert request.headers.get("User-Agent") == user_agent_version
+
+
+def test_pooled_manager_reuses_session_of_thread():
+    # given
+    manager = PooledManager(
+        HTTPConfig, pool_connections=1, pool_maxsize=1, idle_timeout=30
+    )
+    session = manager.get_pooled_session()
+
+    # when
+    reused_session = manager.get_pooled_session()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        thread_session = executor.submit(manager.get_pooled_session).result()
+
+    # then
+    assert reused_session is session
+    assert thread_session is not session
+
+
+def test_pooled_manager_replaces_idle_session():
+    # given
+    manager = PooledManager(
+        HTTPConfig, pool_connections=1, pool_maxsize=1, idle_timeout=30
+    )
+    session = manager.get_pooled_session()
+
+    # when
+    with mock.patch("saleor.core.http_client.time.monotonic") as mocked_monotonic:
+        mocked_monotonic.return_value = manager._local.last_used + 31
+        new_session = manager.get_pooled_session()
+
+    # then
+    assert new_session is not session
+
+
+def test_pooled_manager_filters_ips_of_pooled_session():
+    # given
+    config = dataclasses.replace(
+        HTTPConfig, ip_filter_enable=True, ip_filter_allow_loopback_ips=False
+    )
+    manager = PooledManager(config, pool_connections=1, pool_maxsize=1, idle_timeout=30)
+    session = manager.get_pooled_session()
+
+    # when
+    with pytest.raises(InvalidIPAddress):
+        manager.send_request("GET", "http://127.0.0.1/")
+
+    # then
+    assert manager.get_pooled_session() is session
+
+
+@mock.patch.object(requests_hardened.HTTPSession, "request")
+def test_pooled_manager_without_idle_timeout_uses_session_per_request(
+    mocked_request,
+):
+    # given
+    manager = PooledManager(
+        HTTPConfig, pool_connections=1, pool_maxsize=1, idle_timeout=0
+    )
+
+    # when
+    manager.send_request("GET", "http://www.example.com")
+
+    # then
+    mocked_request.assert_called_once_with("GET", "http://www.example.com")
+    assert getattr(manager._local, "session", None) is None
+
+
+def test_pooled_manager_doesnt_send_cookies_to_hosts_with_same_ip(cookie_server):
+    # given
+    config = dataclasses.replace(
+        HTTPConfig, ip_filter_enable=True, ip_filter_allow_loopback_ips=True
+    )
+    manager = PooledManager(config, pool_connections=1, pool_maxsize=1, idle_timeout=30)
+    port = cookie_server.server_port
+    response = manager.send_request("GET", f"http://localhost:{port}/")
+    assert response.headers["Set-Cookie"] == "session=secret; Path=/"
+
+    # when
+    manager.send_request("GET", f"http://127.0.0.1:{port}/")
+
+    # then
+    assert cookie_server.cookie_headers == [None, None]
+    assert not manager.get_pooled_session().cookies
@@ -1,14 +1,22 @@
+from datetime import timedelta
+
 import graphene
 import jwt
+import pytest
 from cryptography.hazmat.primitives import serialization
 from django.urls import reverse
+from django.utils import timezone
+from freezegun import freeze_time
 
 from ..jwt import (
+    create_access_token,
     create_access_token_for_app,
     create_access_token_for_app_extension,
+    decoded_token_cache,
     jwt_decode,
     jwt_encode,
 )
+from ..jwt_manager import JWTManager
 from ..utils import build_absolute_uri
 
 
@@ -187,3 +195,41 @@ def test_jwt_encode_creates_token_signed_with_rs256(settings):
     # then
     headers = jwt.get_unverified_header(token)
     assert headers.get("alg") == "RS256"
+
+
+@pytest.fixture
+def decoded_token_cache_enabled(settings):
+    settings.JWT_DECODED_TOKEN_CACHE_SIZE = 10
+    decoded_token_cache.clear()
+    yield settings
+    decoded_token_cache.clear()
+
+
+def test_jwt_decode_verifies_token_once(
+    decoded_token_cache_enabled, staff_user, mocker
+):
+    # given
+    token = create_access_token(staff_user)
+    decode_spy = mocker.spy(JWTManager, "decode")
+    payload = jwt_decode(token)
+
+    # when
+    cached_payload = jwt_decode(token)
+
+    # then
+    assert cached_payload == payload
+    assert cached_payload is not payload
+    assert decode_spy.call_count == 1
+
+
+def test_jwt_decode_doesnt_return_cached_expired_token(
+    decoded_token_cache_enabled, staff_user, settings
+):
+    # given
+    token = create_access_token(staff_user)
+    jwt_decode(token)
+
+    # when & then
+    with freeze_time(timezone.now() + settings.JWT_TTL_ACCESS + timedelta(seconds=1)):
+        with pytest.raises(jwt.ExpiredSignatureError):
+            jwt_decode(token)
@@ -0,0 +1,224 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+import pytest
+import pytz
+from django.db import connection
+from django.utils import timezone
+from freezegun import freeze_time
+
+from ...webhook.event_types import WebhookEventAsyncType
+from ..models import EventDelivery, EventPayload
+from ..partitions import (
+    PARTITIONED_MODELS,
+    PARTITIONS_AHEAD,
+    create_event_partitions,
+    drop_expired_event_partitions,
+    get_day_start,
+    get_legacy_partition_name,
+    get_partition_name,
+    get_partitions,
+    is_partitioned,
+    maintain_event_partitions,
+    parse_partition_bound,
+    partition_event_tables,
+)
+from ..tasks import delete_event_payloads_task
+
+PAYLOAD = '{"key": "data"}'
+
+
+def test_parse_partition_bound():
+    # when
+    bound_range = parse_partition_bound(
+        "FOR VALUES FROM ('2023-11-06 00:00:00+00') TO ('2023-11-07 00:00:00+00')"
+    )
+
+    # then
+    assert bound_range == (
+        datetime(2023, 11, 6, tzinfo=pytz.utc),
+        datetime(2023, 11, 7, tzinfo=pytz.utc),
+    )
+
+
+def test_parse_partition_bound_of_legacy_partition():
+    # when
+    bound_range = parse_partition_bound(
+        "FOR VALUES FROM (MINVALUE) TO ('2023-11-08 00:00:00+00')"
+    )
+
+    # then
+    assert bound_range == (None, datetime(2023, 11, 8, tzinfo=pytz.utc))
+
+
+def test_parse_partition_bound_of_default_partition():
+    # when
+    bound_range = parse_partition_bound("DEFAULT")
+
+    # then
+    assert bound_range is None
+
+
+def test_create_with_payloads_when_partitioning_enabled(settings):
+    # given
+    settings.EVENT_PARTITIONING_ENABLED = True
+    (event_payload,) = EventPayload.objects.create_with_payloads([PAYLOAD])
+
+    # when
+    first, second = EventPayload.objects.create_with_payloads([PAYLOAD, PAYLOAD])
+
+    # then
+    assert first.pk == second.pk
+    assert first.pk != event_payload.pk
+    assert first.payload_hash is None
+    assert EventPayload.objects.get(pk=first.pk).payload == PAYLOAD
+
+
+@pytest.fixture
+def partitioned_event_tables(settings):
+    settings.EVENT_PARTITIONING_ENABLED = True
+    # Deferred foreign keys of rows created by other fixtures are checked first,
+    # as tables with pending checks can't be altered.
+    connection.check_constraints()
+    return partition_event_tables()
+
+
+def create_event_delivery(webhook):
+    payload = EventPayload.objects.create_with_payload(PAYLOAD)
+    return EventDelivery.objects.create(
+        event_type=WebhookEventAsyncType.ANY, payload=payload, webhook=webhook
+    )
+
+
+def test_partition_event_tables(partitioned_event_tables):
+    # given
+    today = get_day_start(timezone.now())
+    first_day = today + timedelta(days=2)
+    last_day = today + timedelta(days=PARTITIONS_AHEAD)
+
+    # then
+    assert partitioned_event_tables == [
+        model._meta.db_table for model in PARTITIONED_MODELS
+    ]
+    for table in partitioned_event_tables:
+        assert is_partitioned(table)
+        partitions = sorted(get_partitions(table), key=lambda p: p.end)
+        assert partitions[0] == (get_legacy_partition_name(table), None, first_day)
+        assert partitions[1].start == first_day
+        assert partitions[-1].start == last_day
+
+
+def test_create_event_partitions(partitioned_event_tables):
+    # given
+    tomorrow = get_day_start(timezone.now()) + timedelta(days=1)
+
+    # when
+    created = create_event_partitions(tomorrow)
+
+    # then
+    next_day = tomorrow + timedelta(days=PARTITIONS_AHEAD)
+    assert created == [
+        get_partition_name(table, next_day) for table in partitioned_event_tables
+    ]
+
+
+def test_drop_expired_event_partitions(partitioned_event_tables, webhook, settings):
+    # given
+    settings.EVENT_PAYLOAD_DELETE_PERIOD = timedelta(days=1)
+    now = timezone.now()
+    # Stored in the legacy partitions.
+    expired_delivery = create_event_delivery(webhook)
+    with freeze_time(now + timedelta(days=3)):
+        delivery = create_event_delivery(webhook)
+
+    # when
+    dropped = drop_expired_event_partitions(now + timedelta(days=3))
+
+    # then
+    for table in partitioned_event_tables:
+        assert get_legacy_partition_name(table) in dropped
+    assert list(EventDelivery.objects.all()) == [delivery]
+    assert list(EventPayload.objects.all()) == [delivery.payload]
+    assert not EventPayload.objects.filter(pk=expired_delivery.payload_id).exists()
+
+
+def test_create_event_partitions_after_rows_of_default_partition_deleted(
+    partitioned_event_tables, webhook
+):
+    # given
+    today = get_day_start(timezone.now())
+    day = today + timedelta(days=10)
+    # Stored in the default partitions.
+    with freeze_time(day):
+        create_event_delivery(webhook)
+    create_event_partitions(today + timedelta(days=3))
+    EventDelivery.objects.all().delete()
+    EventPayload.objects.all().delete()
+
+    # when
+    created = create_event_partitions(today + timedelta(days=3))
+
+    # then
+    assert created == [
+        get_partition_name(table, day)
+        for table in [EventPayload._meta.db_table, EventDelivery._meta.db_table]
+    ]
+
+
+def test_maintain_event_partitions_deletes_expired_rows_of_default_partition(
+    partitioned_event_tables, webhook, settings
+):
+    # given
+    settings.EVENT_PAYLOAD_DELETE_PERIOD = timedelta(days=1)
+    today = get_day_start(timezone.now())
+    # Stored in the default partitions, as partitions of the days are missing.
+    with freeze_time(today + timedelta(days=20)):
+        create_event_delivery(webhook)
+    with freeze_time(today + timedelta(days=30)):
+        delivery = create_event_delivery(webhook)
+
+    # when
+    maintain_event_partitions(today + timedelta(days=22))
+
+    # then
+    assert list(EventDelivery.objects.all()) == [delivery]
+    assert list(EventPayload.objects.all()) == [delivery.payload]
+
+
+@mock.patch("saleor.core.tasks.maintain_event_partitions")
+def test_delete_event_payloads_task_when_tables_not_partitioned(
+    mocked_maintain_partitions, event_delivery, settings
+):
+    # given
+    settings.EVENT_PARTITIONING_ENABLED = True
+    settings.EVENT_PAYLOAD_DELETE_PERIOD = timedelta(0)
+    mocked_maintain_partitions.return_value = ([], [])
+
+    # when
+    delete_event_payloads_task()
+
+    # then
+    mocked_maintain_partitions.assert_called_once_with()
+    assert not EventDelivery.objects.filter(pk=event_delivery.pk).exists()
+    assert not EventPayload.objects.filter(pk=event_delivery.payload_id).exists()
+
+
+def test_delete_event_payloads_task_when_tables_partitioned(
+    partitioned_event_tables, webhook, settings
+):
+    # given
+    settings.EVENT_PAYLOAD_DELETE_PERIOD = timedelta(days=1)
+    now = timezone.now()
+    create_event_delivery(webhook)
+    with freeze_time(now + timedelta(days=2)):
+        delivery = create_event_delivery(webhook)
+
+    # when
+    with freeze_time(now + timedelta(days=3)):
+        delete_event_payloads_task()
+
+    # then
+    # Rows of partitions which aren't expired aren't deleted, even if they're
+    # older than the delete period.
+    assert list(EventDelivery.objects.all()) == [delivery]
+    assert list(EventPayload.objects.all()) == [delivery.payload]
@@ -1,9 +1,16 @@
+import datetime
 import json
+import uuid
+from decimal import Decimal
+from unittest import mock
 
+import pytest
+import pytz
 from measurement.measures import Weight
+from prices import Money
 
 from ..taxes import zero_money
-from ..utils.json_serializer import CustomJsonEncoder
+from ..utils.json_serializer import CustomJsonEncoder, fast_json_dumps, json_dumps
 
 
 def test_custom_json_encoder_dumps_money_objects():
@@ -31,3 +38,53 @@ def test_custom_json_encoder_dumps_weight_objects():
     # then
     data = json.loads(serialized_data)
     assert data["weight"] == "5.0:kg"
+
+
+SERIALIZER_INPUT = {
+    "decimal": Decimal("10.50"),
+    "datetime": datetime.datetime(2023, 1, 2, 3, 4, 5, 678901, tzinfo=pytz.UTC),
+    "date": datetime.date(2023, 1, 2),
+    "uuid": uuid.UUID("0b8a1b0a-7b5d-4f3e-9b1a-3e0f2c1d4e5f"),
+    "money": Money(Decimal("12.30"), "USD"),
+    "nested": [{"weight": Weight(kg=5)}],
+    1: "non-string key",
+}
+
+
+@pytest.mark.parametrize("serializer", [fast_json_dumps, json_dumps])
+def test_json_serializers_output(serializer):
+    # when
+    serialized_data = serializer(SERIALIZER_INPUT)
+
+    # then
+    assert isinstance(serialized_data, bytes)
+    assert json.loads(serialized_data) == {
+        "decimal": "10.50",
+        "datetime": "2023-01-02T03:04:05.678Z",
+        "date": "2023-01-02",
+        "uuid": "0b8a1b0a-7b5d-4f3e-9b1a-3e0f2c1d4e5f",
+        "money": {"_type": "Money", "amount": "12.30", "currency": "USD"},
+        "nested": [{"weight": "5.0:kg"}],
+        "1": "non-string key",
+    }
+
+
+def test_fast_json_dumps_falls_back_for_big_integers():
+    # given
+    data = {"value": 2**70}
+
+    # when
+    serialized_data = fast_json_dumps(data)
+
+    # then
+    assert json.loads(serialized_data) == data
+
+
+@mock.patch("saleor.core.utils.json_serializer.json_dumps")
+def test_fast_json_dumps_uses_orjson(mocked_json_dumps):
+    # when
+    serialized_data = fast_json_dumps({"decimal": Decimal("1.5")})
+
+    # then
+    assert json.loads(serialized_data) == {"decimal": "1.5"}
+    mocked_json_dumps.assert_not_called()
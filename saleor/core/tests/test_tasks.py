@@ -59,6 +59,53 @@ def test_delete_event_payloads_task(webhook, settings):
     assert EventDeliveryAttempt.objects.count() == 1
 
 
+def test_delete_event_payloads_task_with_reused_payload(webhook, settings):
+    # given
+    delete_period = settings.EVENT_PAYLOAD_DELETE_PERIOD
+    start_time = timezone.now()
+    before_delete_period = start_time - delete_period - timedelta(seconds=1)
+    with freeze_time(before_delete_period):
+        payload = EventPayload.objects.create_with_payload('{"key": "data"}')
+        expired_delivery = EventDelivery.objects.create(
+            event_type=WebhookEventAsyncType.ANY, payload=payload, webhook=webhook
+        )
+        EventDeliveryAttempt.objects.create(delivery=expired_delivery)
+    pending_delivery = EventDelivery.objects.create(
+        event_type=WebhookEventAsyncType.ANY, payload=payload, webhook=webhook
+    )
+
+    # when
+    with freeze_time(start_time):
+        delete_event_payloads_task()
+
+    # then
+    assert list(EventDelivery.objects.all()) == [pending_delivery]
+    assert not EventDeliveryAttempt.objects.exists()
+    assert list(EventPayload.objects.all()) == [payload]
+
+    # when
+    EventDelivery.objects.filter(pk=pending_delivery.pk).update(
+        created_at=before_delete_period
+    )
+    with freeze_time(start_time):
+        delete_event_payloads_task()
+
+    # then
+    assert not EventDelivery.objects.exists()
+    assert not EventPayload.objects.exists()
+
+
+def test_delete_event_payloads_task_keeps_recent_unused_payload(settings):
+    # given
+    payload = EventPayload.objects.create_with_payload('{"key": "data"}')
+
+    # when
+    delete_event_payloads_task()
+
+    # then
+    assert list(EventPayload.objects.all()) == [payload]
+
+
 def test_delete_files_from_storage_task(
     product_with_image, variant_with_image, media_root
 ):
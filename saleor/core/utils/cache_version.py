@@ -0,0 +1,46 @@
+"""Versions of cached data shared by all processes.
+
+Data stored with a version is valid until the version is incremented. Versions
+start from the current time, so data stored before a version was evicted from the
+cache isn't valid again.
+"""
+import time
+from typing import Dict, Iterable, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_cache_versions(keys: Iterable[str]) -> Dict[str, int]:
+    keys = list(keys)
+    versions = cache.get_many(keys)
+    missing_keys = [key for key in keys if key not in versions]
+    if missing_keys:
+        version = time.time_ns()
+        for key in missing_keys:
+            cache.add(key, version, timeout=None)
+        versions.update(cache.get_many(missing_keys))
+    return versions
+
+
+def get_cache_version(key: str) -> Optional[int]:
+    return get_cache_versions([key]).get(key)
+
+
+def increment_cache_version(key: str):
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, time.time_ns(), timeout=None):
+            cache.incr(key)
+
+
+def invalidate_cache_version(key: str):
+    """Increment the version now and after the current transaction is committed.
+
+    Other processes could store data of the previous state again before the
+    transaction is committed.
+    """
+    increment_cache_version(key)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: increment_cache_version(key))
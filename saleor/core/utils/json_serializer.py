@@ -1,3 +1,7 @@
+import json
+from typing import Any
+
+import orjson
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.serializers.json import Serializer as JsonSerializer
 from draftjs_sanitizer import SafeJSONEncoder
@@ -29,3 +33,34 @@ class HTMLSafeJSON(SafeJSONEncoder, DjangoJSONEncoder):
     It is used for integrating JSON into HTML content in addition to
     serializing Django objects.
     """
+
+
+_custom_json_encoder = CustomJsonEncoder()
+
+
+def _orjson_default(obj):
+    # Types not supported natively by orjson, as well as dates and times
+    # (see `OPT_PASSTHROUGH_DATETIME`), are serialized the same way as by
+    # `CustomJsonEncoder` to keep the output of both serializers consistent.
+    return _custom_json_encoder.default(obj)
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to JSON with `CustomJsonEncoder`."""
+    return json.dumps(data, cls=CustomJsonEncoder).encode("utf-8")
+
+
+def fast_json_dumps(data: Any) -> bytes:
+    """Serialize data to JSON with orjson, falling back to `json_dumps`.
+
+    The fallback is used when orjson can't serialize the data, e.g. integers
+    exceeding 64 bits.
+    """
+    try:
+        return orjson.dumps(
+            data,
+            default=_orjson_default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+    except TypeError:
+        return json_dumps(data)
@@ -2,6 +2,7 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from ....account import models
+from ....account.auth_cache import invalidate_users_auth_cache
 from ....account.error_codes import AccountErrorCode
 from ....permission.enums import AccountPermissions
 from ...core import ResolveInfo
@@ -56,4 +57,6 @@ class UserBulkSetActive(BaseBulkMutation):
     def bulk_action(  # type: ignore[override]
         cls, _info: ResolveInfo, queryset, /, *, is_active
     ):
+        user_ids = list(queryset.values_list("pk", flat=True))
         queryset.update(is_active=is_active)
+        invalidate_users_auth_cache(user_ids)
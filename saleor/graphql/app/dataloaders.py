@@ -2,7 +2,10 @@ from collections import defaultdict
 from functools import partial, wraps
 from typing import Optional
 
+from django.conf import settings
 from django.contrib.auth.hashers import check_password
+from django.core.cache import cache
+from django.utils.crypto import salted_hmac
 from django.utils.functional import LazyObject
 from promise import Promise
 
@@ -72,12 +75,53 @@ class AppTokensByAppIdLoader(DataLoader):
         return [tokens_by_app_map.get(app_id, []) for app_id in keys]
 
 
+APP_TOKEN_CACHE_KEY_PREFIX = "app-token"
+
+
+def get_app_token_cache_key(raw_token: str) -> str:
+    # Raw tokens are never used as cache keys, only their keyed hashes.
+    token_hash = salted_hmac(APP_TOKEN_CACHE_KEY_PREFIX, raw_token).hexdigest()
+    return f"{APP_TOKEN_CACHE_KEY_PREFIX}:{token_hash}"
+
+
 class AppByTokenLoader(DataLoader):
+    """Authenticate apps by their raw tokens.
+
+    Checking the token against the stored hash is expensive, so the ids of
+    verified tokens are cached for `APP_TOKEN_CACHE_TIMEOUT` seconds. Cached
+    tokens are still fetched by id, so deleted tokens are checked against
+    the hashes again and deactivated apps are rejected right away.
+    """
+
     context_key = "app_by_token"
 
     def batch_load(self, keys):
+        authed_apps = {}
+        raw_tokens = set(keys)
+        cache_keys = {}
+        if settings.APP_TOKEN_CACHE_TIMEOUT:
+            cache_keys = {
+                raw_token: get_app_token_cache_key(raw_token) for raw_token in keys
+            }
+            cached_token_ids = cache.get_many(cache_keys.values())
+            token_ids = {
+                raw_token: cached_token_ids[cache_key]
+                for raw_token, cache_key in cache_keys.items()
+                if cache_key in cached_token_ids
+            }
+            if token_ids:
+                app_ids = dict(
+                    AppToken.objects.using(self.database_connection_name)
+                    .filter(id__in=token_ids.values())
+                    .values_list("id", "app_id")
+                )
+                for raw_token, token_id in token_ids.items():
+                    if token_id in app_ids:
+                        authed_apps[raw_token] = app_ids[token_id]
+                        raw_tokens.discard(raw_token)
+
         last_4s_to_raw_token_map = defaultdict(list)
-        for raw_token in keys:
+        for raw_token in raw_tokens:
             last_4s_to_raw_token_map[raw_token[-4:]].append(raw_token)
 
         # The app should always be taken from the default database.
@@ -91,13 +135,17 @@ class AppByTokenLoader(DataLoader):
         tokens = (
             AppToken.objects.using(self.database_connection_name)
             .filter(token_last_4__in=last_4s_to_raw_token_map.keys())
-            .values_list("auth_token", "token_last_4", "app_id")
+            .values_list("id", "auth_token", "token_last_4", "app_id")
         )
-        authed_apps = {}
-        for auth_token, token_last_4, app_id in tokens:
+        verified_token_ids = {}
+        for token_id, auth_token, token_last_4, app_id in tokens:
             for raw_token in last_4s_to_raw_token_map[token_last_4]:
                 if check_password(raw_token, auth_token):
                     authed_apps[raw_token] = app_id
+                    if raw_token in cache_keys:
+                        verified_token_ids[cache_keys[raw_token]] = token_id
+        if verified_token_ids:
+            cache.set_many(verified_token_ids, settings.APP_TOKEN_CACHE_TIMEOUT)
 
         apps = (
             App.objects.using(self.database_connection_name)
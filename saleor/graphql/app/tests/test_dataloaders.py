@@ -0,0 +1,89 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.http import HttpRequest
+
+from ....app.models import AppToken
+from ..dataloaders import AppByTokenLoader, get_app_token_cache_key
+
+
+def _load_app(raw_token):
+    return AppByTokenLoader(HttpRequest()).load(raw_token).get()
+
+
+@pytest.fixture
+def app_with_token(app):
+    _, raw_token = AppToken.objects.create(app=app)
+    yield app, raw_token
+    cache.delete(get_app_token_cache_key(raw_token))
+
+
+def test_app_by_token_loader_caches_verified_token(app_with_token):
+    # given
+    app, raw_token = app_with_token
+    assert _load_app(raw_token) == app
+
+    # when
+    with mock.patch(
+        "saleor.graphql.app.dataloaders.check_password"
+    ) as check_password_mock:
+        loaded_app = _load_app(raw_token)
+
+    # then
+    assert loaded_app == app
+    check_password_mock.assert_not_called()
+
+
+def test_app_by_token_loader_cache_key_is_not_raw_token(app_with_token):
+    # given
+    _, raw_token = app_with_token
+
+    # when
+    cache_key = get_app_token_cache_key(raw_token)
+
+    # then
+    assert raw_token not in cache_key
+
+
+def test_app_by_token_loader_rejects_deleted_token(app_with_token):
+    # given
+    app, raw_token = app_with_token
+    assert _load_app(raw_token) == app
+
+    # when
+    app.tokens.all().delete()
+
+    # then
+    assert _load_app(raw_token) is None
+
+
+def test_app_by_token_loader_rejects_deactivated_app(app_with_token):
+    # given
+    app, raw_token = app_with_token
+    assert _load_app(raw_token) == app
+
+    # when
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # then
+    assert _load_app(raw_token) is None
+
+
+def test_app_by_token_loader_without_cache(settings, app_with_token):
+    # given
+    settings.APP_TOKEN_CACHE_TIMEOUT = 0
+    app, raw_token = app_with_token
+    assert _load_app(raw_token) == app
+
+    # when
+    with mock.patch(
+        "saleor.graphql.app.dataloaders.check_password", return_value=True
+    ) as check_password_mock:
+        loaded_app = _load_app(raw_token)
+
+    # then
+    assert loaded_app == app
+    check_password_mock.assert_called()
+    assert cache.get(get_app_token_cache_key(raw_token)) is None
@@ -10,6 +10,7 @@ from ...app.models import App
 
 if TYPE_CHECKING:
     from .dataloaders import DataLoader
+    from .resolver_stats import ResolverStats
 
 
 class SaleorContext(HttpRequest):
@@ -21,6 +22,7 @@ class SaleorContext(HttpRequest):
     user: Optional[User]  # type: ignore[assignment]
     requestor: Union[App, User, None]
     request_time: datetime.datetime
+    resolver_stats: Optional["ResolverStats"]
 
 
 def disallow_replica_in_context(context: SaleorContext) -> None:
@@ -1,3 +1,4 @@
+import time
 from collections import defaultdict
 from typing import DefaultDict, Generic, Iterable, List, Optional, Tuple, TypeVar, Union
 
@@ -46,7 +47,14 @@ class DataLoader(BaseLoader, Generic[K, R]):
         ) as scope:
             span = scope.span
             span.set_tag(opentracing.tags.COMPONENT, "dataloaders")
-            results = self.batch_load(keys)
+            if stats := getattr(self.context, "resolver_stats", None):
+                start = time.perf_counter()
+                results = self.batch_load(keys)
+                stats.record_batch(
+                    self.__class__.__name__, len(keys), time.perf_counter() - start
+                )
+            else:
+                results = self.batch_load(keys)
             if not isinstance(results, Promise):
                 return Promise.resolve(results)
             return results
@@ -0,0 +1,120 @@
+import hashlib
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, FrozenSet, Optional
+
+from django.conf import settings
+from graphql import GraphQLDocument
+from graphql.backend import core as core_backend
+from graphql.execution import ExecutionResult
+from graphql.validation import validate
+
+from ... import __version__ as saleor_version
+from ...core.utils.lru import LRUCache
+from ..schema_printer import print_schema
+from .validators.query_cost import QueryCostCache
+
+if TYPE_CHECKING:
+    from graphql import GraphQLBackend, GraphQLSchema
+
+
+class CachedGraphQLDocument(GraphQLDocument):
+    """Validated document kept in the document cache.
+
+    Holds data derived from the document that can be reused between requests,
+    like the computed query costs, the response cache tags, or whether payloads
+    of a subscription depend on the app receiving them.
+    """
+
+    def __init__(self, schema, document_string, document_ast):
+        super().__init__(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            execute=partial(execute_validated_document, schema, document_ast),
+        )
+        self.query_cost_cache = QueryCostCache()
+        self.response_cache_tags: Optional[FrozenSet[str]] = None
+        self.selects_app: Optional[bool] = None
+
+
+def _get_document_cache_size() -> int:
+    return settings.GRAPHQL_DOCUMENT_CACHE_SIZE
+
+
+# Per-process cache of parsed and validated GraphQL documents.
+document_cache: LRUCache[CachedGraphQLDocument] = LRUCache(_get_document_cache_size)
+
+
+def _get_subscription_document_cache_size() -> int:
+    return settings.WEBHOOK_SUBSCRIPTION_DOCUMENT_CACHE_SIZE
+
+
+# Per-process cache of subscription queries of webhooks, kept apart from
+# `document_cache` so they are not evicted by queries sent to the API.
+subscription_document_cache: LRUCache[CachedGraphQLDocument] = LRUCache(
+    _get_subscription_document_cache_size
+)
+
+
+@lru_cache(maxsize=None)
+def get_schema_version(schema: "GraphQLSchema") -> str:
+    """Return a hash identifying the shape of the given schema."""
+    printed_schema = print_schema(schema)
+    content = f"{saleor_version}:{printed_schema}".encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def get_document_cache_key(schema: "GraphQLSchema", query: str) -> str:
+    query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+    return f"{get_schema_version(schema)}:{query_hash}"
+
+
+def execute_validated_document(schema, document_ast, *args, **kwargs):
+    # The document was validated when it was added to the cache.
+    kwargs["validate"] = False
+    return core_backend.execute_and_validate(schema, document_ast, *args, **kwargs)
+
+
+def return_validation_errors(errors, *args, **kwargs):
+    return ExecutionResult(errors=errors, invalid=True)
+
+
+def cache_validated_document(
+    cache: LRUCache[CachedGraphQLDocument],
+    schema: "GraphQLSchema",
+    query: str,
+    document_ast,
+) -> CachedGraphQLDocument:
+    """Store the document of a query that passed validation in the given cache."""
+    cached_document = CachedGraphQLDocument(schema, query, document_ast)
+    cache.set(get_document_cache_key(schema, query), cached_document)
+    return cached_document
+
+
+def document_from_string(
+    backend: "GraphQLBackend",
+    schema: "GraphQLSchema",
+    query: str,
+    cache: LRUCache[CachedGraphQLDocument] = document_cache,
+) -> GraphQLDocument:
+    """Return a parsed and validated document for the given query string.
+
+    Valid documents are stored in the LRU cache so the following requests
+    with the same query skip both parsing and validation. Documents that
+    fail validation are not cached; executing them returns the validation errors.
+    """
+    if cache.maxsize <= 0:
+        return backend.document_from_string(schema, query)
+
+    key = get_document_cache_key(schema, query)
+    document = cache.get(key)
+    if document is not None:
+        return document
+
+    document = backend.document_from_string(schema, query)
+    validation_errors = validate(schema, document.document_ast)
+    if validation_errors:
+        document.execute = partial(return_validation_errors, validation_errors)
+        return document
+
+    return cache_validated_document(cache, schema, query, document.document_ast)
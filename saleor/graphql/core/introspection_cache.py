@@ -0,0 +1,31 @@
+import hashlib
+import json
+from typing import TYPE_CHECKING, Optional
+
+from django.conf import settings
+
+from ...core.utils.lru import LRUCache
+from .document_cache import get_schema_version
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+
+
+def _get_introspection_cache_size() -> int:
+    return settings.GRAPHQL_INTROSPECTION_CACHE_SIZE
+
+
+# Per-process cache of serialized responses to introspection queries. Responses
+# are served from memory as bytes, without reaching the shared cache.
+introspection_cache: LRUCache[bytes] = LRUCache(_get_introspection_cache_size)
+
+
+def get_introspection_cache_key(
+    schema: "GraphQLSchema",
+    query: str,
+    operation_name: Optional[str],
+    variables: Optional[dict],
+) -> str:
+    content = json.dumps([query, operation_name, variables], sort_keys=True)
+    content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return f"{get_schema_version(schema)}:{content_hash}"
@@ -0,0 +1,183 @@
+"""Support for automatic persisted queries (APQ).
+
+Clients send a SHA-256 hash of the query in `extensions.persistedQuery` instead of
+the full query string. If the hash is unknown, the client retries with both the
+hash and the query, which registers the query for the following requests.
+
+Queries registered upfront with the `register_persisted_queries` management command
+are stored in the database, apart from queries registered by clients in the cache.
+With `GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY` enabled, only they are executed.
+"""
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql.error import GraphQLError
+
+from ...core.models import PersistedQuery
+from ...core.utils.lru import LRUCache
+
+PERSISTED_QUERY_VERSION = 1
+PERSISTED_QUERY_CACHE_KEY_PREFIX = "persisted-query"
+
+
+def _get_local_cache_size() -> int:
+    return settings.GRAPHQL_PERSISTED_QUERIES_LOCAL_CACHE_SIZE
+
+
+# Registered queries never change, so the local copies don't need invalidation.
+local_persisted_queries: LRUCache[str] = LRUCache(_get_local_cache_size)
+local_allowlisted_queries: LRUCache[str] = LRUCache(_get_local_cache_size)
+
+
+class PersistedQueryError(GraphQLError):
+    code = ""
+
+    def __init__(self, message: str):
+        super().__init__(message, extensions={"code": self.code})
+
+
+class PersistedQueryNotFound(PersistedQueryError):
+    code = "PERSISTED_QUERY_NOT_FOUND"
+
+    def __init__(self):
+        super().__init__("PersistedQueryNotFound")
+
+
+class PersistedQueryNotSupported(PersistedQueryError):
+    code = "PERSISTED_QUERY_NOT_SUPPORTED"
+
+    def __init__(self):
+        super().__init__("PersistedQueryNotSupported")
+
+
+class PersistedQueryNotAllowed(PersistedQueryError):
+    code = "PERSISTED_QUERY_NOT_ALLOWED"
+
+    def __init__(self):
+        super().__init__("Only registered persisted queries are allowed.")
+
+
+class PersistedQueryHashMismatch(PersistedQueryError):
+    code = "PERSISTED_QUERY_HASH_MISMATCH"
+
+    def __init__(self):
+        super().__init__("Provided sha256Hash does not match the query.")
+
+
+def hash_query(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def get_persisted_query_cache_key(query_hash: str) -> str:
+    return f"{PERSISTED_QUERY_CACHE_KEY_PREFIX}:{query_hash}"
+
+
+def get_persisted_query_hash(extensions: Any) -> Optional[str]:
+    """Return the query hash from the `extensions` part of the request."""
+    if isinstance(extensions, str):
+        try:
+            extensions = json.loads(extensions)
+        except ValueError:
+            return None
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return None
+    if persisted_query.get("version") != PERSISTED_QUERY_VERSION:
+        raise PersistedQueryNotSupported()
+    query_hash = persisted_query.get("sha256Hash")
+    if not query_hash or not isinstance(query_hash, str):
+        raise PersistedQueryNotFound()
+    return query_hash.lower()
+
+
+def get_persisted_query(query_hash: str) -> Optional[str]:
+    query = local_persisted_queries.get(query_hash)
+    if query is not None:
+        return query
+    query = cache.get(get_persisted_query_cache_key(query_hash))
+    if query is not None:
+        local_persisted_queries.set(query_hash, query)
+    return query
+
+
+def save_persisted_query(query_hash: str, query: str):
+    """Store the query registered by a client for `GRAPHQL_PERSISTED_QUERIES_TIMEOUT`.
+
+    With the timeout set to `0`, the query is kept for as long as the cache backend
+    allows.
+    """
+    timeout = settings.GRAPHQL_PERSISTED_QUERIES_TIMEOUT
+    cache.set(get_persisted_query_cache_key(query_hash), query, timeout or None)
+    local_persisted_queries.set(query_hash, query)
+
+
+def get_allowlisted_query(query_hash: str) -> Optional[str]:
+    """Return the query registered with the `register_persisted_queries` command."""
+    query = local_allowlisted_queries.get(query_hash)
+    if query is not None:
+        return query
+    query = (
+        PersistedQuery.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(query_hash=query_hash)
+        .values_list("query", flat=True)
+        .first()
+    )
+    if query is not None:
+        local_allowlisted_queries.set(query_hash, query)
+    return query
+
+
+def save_allowlisted_queries(queries: Dict[str, str]):
+    """Store queries by their hashes, keeping the ones registered before."""
+    PersistedQuery.objects.bulk_create(
+        [
+            PersistedQuery(query_hash=query_hash, query=query)
+            for query_hash, query in queries.items()
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def resolve_persisted_query(query: Any, extensions: Any) -> Any:
+    """Return the query string that should be executed for the request.
+
+    Raises a `PersistedQueryError` when the request can't be served, the error
+    codes follow the APQ protocol so clients know when to retry with a full query.
+    """
+    if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+        if not query and extensions and get_persisted_query_hash(extensions):
+            raise PersistedQueryNotSupported()
+        return query
+
+    allowlist_only = settings.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY
+    query_hash = get_persisted_query_hash(extensions)
+    if query_hash is None:
+        if allowlist_only and query:
+            raise PersistedQueryNotAllowed()
+        return query
+
+    if not query:
+        persisted_query = None
+        if not allowlist_only:
+            persisted_query = get_persisted_query(query_hash)
+        if persisted_query is None:
+            persisted_query = get_allowlisted_query(query_hash)
+        if persisted_query is None:
+            raise PersistedQueryNotFound()
+        return persisted_query
+
+    if not isinstance(query, str):
+        return query
+    if hash_query(query) != query_hash:
+        raise PersistedQueryHashMismatch()
+    if allowlist_only:
+        if get_allowlisted_query(query_hash) is None:
+            raise PersistedQueryNotAllowed()
+    elif query_hash not in local_persisted_queries:
+        save_persisted_query(query_hash, query)
+    return query
@@ -0,0 +1,121 @@
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from graphql.execution import ExecutionResult
+
+from . import ResolveInfo, SaleorContext
+
+# Number of the slowest fields and data loaders returned in the stats.
+MAX_REPORTED_ENTRIES = 50
+
+
+class ResolverStats:
+    """Call counts and cumulative time of resolvers and data loaders.
+
+    For resolvers returning promises, only the synchronous part is measured;
+    the time spent on loading the data is reported by the data loaders.
+    """
+
+    def __init__(self):
+        self.fields: Dict[str, List[float]] = {}
+        self.dataloaders: Dict[str, List[float]] = {}
+
+    def record_field(self, field: str, elapsed: float):
+        if entry := self.fields.get(field):
+            entry[0] += 1
+            entry[1] += elapsed
+        else:
+            self.fields[field] = [1, elapsed]
+
+    def record_batch(self, loader: str, size: int, elapsed: float):
+        if entry := self.dataloaders.get(loader):
+            entry[0] += 1
+            entry[1] += size
+            entry[2] += elapsed
+        else:
+            self.dataloaders[loader] = [1, size, elapsed]
+
+    def as_dict(self) -> Dict[str, Any]:
+        fields = sorted(self.fields.items(), key=lambda item: -item[1][1])
+        dataloaders = sorted(self.dataloaders.items(), key=lambda item: -item[1][2])
+        return {
+            "fields": [
+                {
+                    "field": field,
+                    "count": int(count),
+                    "totalMs": round(elapsed * 1000, 3),
+                }
+                for field, (count, elapsed) in fields[:MAX_REPORTED_ENTRIES]
+            ],
+            "dataloaders": [
+                {
+                    "loader": loader,
+                    "batches": int(batches),
+                    "keys": int(keys),
+                    "totalMs": round(elapsed * 1000, 3),
+                }
+                for loader, (batches, keys, elapsed) in dataloaders[
+                    :MAX_REPORTED_ENTRIES
+                ]
+            ],
+        }
+
+
+class ResolverStatsMiddleware:
+    """Measure resolvers of the operations selected for collecting the stats.
+
+    Add `saleor.graphql.middleware.ResolverStatsMiddleware` to
+    `GRAPHQL_MIDDLEWARE` to enable it. Operations that aren't sampled only pay
+    for a single attribute lookup per resolved field.
+    """
+
+    @staticmethod
+    def resolve(next_, root, info: ResolveInfo, **kwargs):
+        stats = getattr(info.context, "resolver_stats", None)
+        if stats is None:
+            return next_(root, info, **kwargs)
+        start = time.perf_counter()
+        try:
+            return next_(root, info, **kwargs)
+        finally:
+            stats.record_field(
+                f"{info.parent_type.name}.{info.field_name}",
+                time.perf_counter() - start,
+            )
+
+
+def is_staff_request(context: SaleorContext) -> bool:
+    return bool(getattr(context.user, "is_staff", False))
+
+
+def start_resolver_stats(context: SaleorContext) -> Optional[ResolverStats]:
+    """Select the operation for collecting the stats.
+
+    Stats are always collected in debug mode and for staff users; other
+    operations are sampled with `GRAPHQL_RESOLVER_STATS_SAMPLE_RATE`.
+    """
+    sampled = random.random() < settings.GRAPHQL_RESOLVER_STATS_SAMPLE_RATE
+    if sampled or settings.DEBUG or is_staff_request(context):
+        context.resolver_stats = ResolverStats()
+    else:
+        context.resolver_stats = None
+    return context.resolver_stats
+
+
+def set_resolver_stats_on_result(
+    execution_result: ExecutionResult, context: SaleorContext
+) -> Optional[Dict[str, Any]]:
+    """Add the collected stats to the result visible for staff and in debug mode.
+
+    Return the stats, so they can be reported to observability.
+    """
+    stats = getattr(context, "resolver_stats", None)
+    if stats is None:
+        return None
+    context.resolver_stats = None
+    stats_data = stats.as_dict()
+    if settings.DEBUG or is_staff_request(context):
+        execution_result.extensions["resolverStats"] = stats_data
+    return stats_data
@@ -0,0 +1,219 @@
+import hashlib
+import json
+from typing import TYPE_CHECKING, FrozenSet, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from graphql import GraphQLDocument, get_named_type
+from graphql.execution import ExecutionResult
+from graphql.language.ast import Field, OperationDefinition
+from graphql.validation import validate
+from graphql.validation.rules.base import ValidationRule
+from graphql.validation.validation import ValidationContext
+
+from ... import __version__ as saleor_version
+from ...core.auth import get_token_from_request
+from ...core.utils.cache_version import get_cache_versions, increment_cache_version
+from ...webhook.event_types import WebhookEventAsyncType
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+
+# Root fields of the storefront queries whose responses can be shared
+# between anonymous clients.
+CACHEABLE_ROOT_FIELDS = {
+    "__typename",
+    "categories",
+    "category",
+    "collection",
+    "collections",
+    "menu",
+    "menus",
+    "product",
+    "products",
+}
+
+# Every cached response is tagged with the global tag, which is invalidated
+# by changes affecting all of them, like channel updates or new translations.
+GLOBAL_TAG = "channel"
+
+# Tags assigned to responses based on the names of the GraphQL types they touch,
+# e.g. `ProductVariant` and `ProductCountableConnection` are tagged with `product`.
+TYPE_NAME_PREFIX_TAGS = [
+    ("Attribute", "attribute"),
+    ("Category", "category"),
+    ("Collection", "collection"),
+    ("Menu", "menu"),
+    ("Product", "product"),
+]
+
+# Tags invalidated by the events triggered with the plugins manager, matched by
+# the prefix of the event name.
+EVENT_PREFIX_TAGS = [
+    ("attribute_", {"attribute"}),
+    ("category_", {"category"}),
+    ("channel_", {GLOBAL_TAG}),
+    ("collection_", {"collection"}),
+    ("menu_", {"menu"}),
+    ("product_", {"product"}),
+    ("promotion_", {"product"}),
+    ("sale_", {"product"}),
+    ("translation_", {GLOBAL_TAG}),
+]
+
+# Tags invalidated by each event, other methods of the plugins manager don't
+# invalidate cached responses.
+EVENT_TAGS = {
+    event: frozenset(tags)
+    for event in WebhookEventAsyncType.ALL
+    for prefix, tags in EVENT_PREFIX_TAGS
+    if event.startswith(prefix)
+}
+
+RESPONSE_CACHE_KEY_PREFIX = "graphql-response"
+TAG_VERSION_KEY_PREFIX = "graphql-response-tag"
+
+
+class ResponseCacheTagsCollector(ValidationRule):
+    """Collect cache tags of the types selected in the document."""
+
+    def __init__(self):  # pylint: disable=super-init-not-called
+        self.tags: Set[str] = {GLOBAL_TAG}
+
+    def __call__(self, context: ValidationContext):
+        self.context = context
+        return self
+
+    def enter_field(
+        self, node, key, parent, path, ancestors
+    ):  # pylint: disable=unused-argument
+        field_type = self.context.get_type()
+        if field_type is None:
+            return
+        type_name = get_named_type(field_type).name
+        for prefix, tag in TYPE_NAME_PREFIX_TAGS:
+            if type_name.startswith(prefix):
+                self.tags.add(tag)
+                break
+
+
+def get_response_cache_tags(
+    schema: "GraphQLSchema", document: GraphQLDocument
+) -> FrozenSet[str]:
+    """Return the cache tags of the types the document selects.
+
+    The tags are stored on documents kept in the document cache, so they are
+    computed once per query.
+    """
+    tags = getattr(document, "response_cache_tags", None)
+    if tags is None:
+        collector = ResponseCacheTagsCollector()
+        validate(schema, document.document_ast, [collector])
+        tags = frozenset(collector.tags)
+        if hasattr(document, "response_cache_tags"):
+            document.response_cache_tags = tags
+    return tags
+
+
+def get_operation_definition(
+    document: GraphQLDocument, operation_name: Optional[str]
+) -> Optional[OperationDefinition]:
+    operations = [
+        definition
+        for definition in document.document_ast.definitions
+        if isinstance(definition, OperationDefinition)
+    ]
+    if not operation_name:
+        return operations[0] if len(operations) == 1 else None
+    for operation in operations:
+        if operation.name and operation.name.value == operation_name:
+            return operation
+    return None
+
+
+def is_response_cacheable(
+    request: HttpRequest, document: GraphQLDocument, operation_name: Optional[str]
+) -> bool:
+    """Check if the response can be shared with other anonymous clients."""
+    if not settings.GRAPHQL_RESPONSE_CACHE_ENABLED:
+        return False
+    if get_token_from_request(request) or getattr(request, "app", None):
+        return False
+    operation = get_operation_definition(document, operation_name)
+    if operation is None or operation.operation != "query":
+        return False
+    return all(
+        isinstance(selection, Field) and selection.name.value in CACHEABLE_ROOT_FIELDS
+        for selection in operation.selection_set.selections
+    )
+
+
+def get_tag_version_key(tag: str) -> str:
+    return f"{TAG_VERSION_KEY_PREFIX}:{tag}"
+
+
+def get_tag_versions(tags: Iterable[str]) -> List[int]:
+    tag_keys = [get_tag_version_key(tag) for tag in sorted(tags)]
+    versions = get_cache_versions(tag_keys)
+    return [versions.get(key, 0) for key in tag_keys]
+
+
+def get_response_cache_key(
+    query_fingerprint: str,
+    operation_name: Optional[str],
+    variables: Optional[dict],
+    tags: Iterable[str],
+) -> str:
+    """Return the cache key of the response.
+
+    The channel and the language are passed to the storefront queries as
+    arguments, either inline or with variables, so they are part of the key.
+    The current versions of the tags are included as well, which makes
+    the responses stored before the invalidation unreachable.
+    """
+    variables = variables or {}
+    key_data = {
+        "query": query_fingerprint,
+        "operation_name": operation_name,
+        "variables": variables,
+        "channel": variables.get("channel"),
+        "language": variables.get("languageCode"),
+        "tags": get_tag_versions(tags),
+    }
+    content = json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")
+    key_hash = hashlib.sha256(content).hexdigest()
+    return f"{RESPONSE_CACHE_KEY_PREFIX}:{saleor_version}:{key_hash}"
+
+
+def get_cached_response(key: str) -> Optional[ExecutionResult]:
+    return cache.get(key)
+
+
+def cache_response(key: str, response: ExecutionResult):
+    cache.set(key, response, settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT)
+
+
+def invalidate_response_cache(tags: Iterable[str]):
+    """Make the cached responses tagged with any of the given tags unreachable."""
+    for tag in tags:
+        increment_cache_version(get_tag_version_key(tag))
+
+
+def invalidate_response_cache_for_event(event: str):
+    if not settings.GRAPHQL_RESPONSE_CACHE_ENABLED:
+        return
+    if tags := EVENT_TAGS.get(event):
+        # Responses cached before the transaction is committed contain the previous
+        # data, so they are invalidated after the commit.
+        transaction.on_commit(lambda: invalidate_response_cache(tags))
+
+
+def set_response_cache_headers(response: HttpResponse, tags: Iterable[str]):
+    """Let a CDN cache the response and purge it by its tags."""
+    patch_vary_headers(response, ["Authorization", "Authorization-Bearer"])
+    response["Surrogate-Key"] = " ".join(sorted(tags))
+    if max_age := settings.GRAPHQL_RESPONSE_CACHE_CDN_MAX_AGE:
+        patch_cache_control(response, public=True, max_age=max_age)
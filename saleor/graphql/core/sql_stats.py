@@ -0,0 +1,73 @@
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, Generator, Optional
+
+from django.conf import settings
+from django.db import connections
+from graphql.execution import ExecutionResult
+
+
+class SqlStats:
+    """Number and time of SQL queries executed by a GraphQL operation.
+
+    Statements executed more than once (with any parameters) are counted as
+    duplicates, which usually means that related objects are fetched one by one
+    instead of with a data loader.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        self.statements: Counter = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.time += time.perf_counter() - start
+            self.count += 1
+            self.statements[sql] += 1
+
+    @property
+    def duplicates(self) -> int:
+        return self.count - len(self.statements)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "totalMs": round(self.time * 1000, 3),
+            "duplicates": self.duplicates,
+        }
+
+
+def get_sql_stats() -> Optional[SqlStats]:
+    if settings.GRAPHQL_SQL_STATS_EXTENSION or settings.OBSERVABILITY_ACTIVE:
+        return SqlStats()
+    return None
+
+
+@contextmanager
+def record_sql_stats(sql_stats: Optional[SqlStats]) -> Generator[None, None, None]:
+    """Count queries executed on all database connections of the current thread."""
+    with ExitStack() as stack:
+        if sql_stats is not None:
+            for conn in connections.all():
+                stack.enter_context(conn.execute_wrapper(sql_stats))
+        yield
+
+
+def set_sql_stats_on_result(
+    execution_result: ExecutionResult, sql_stats: Optional[SqlStats]
+) -> Optional[Dict[str, Any]]:
+    """Add the stats to the result when `GRAPHQL_SQL_STATS_EXTENSION` is enabled.
+
+    Return the stats, so they can be reported to observability.
+    """
+    if sql_stats is None:
+        return None
+    stats_data = sql_stats.as_dict()
+    if settings.GRAPHQL_SQL_STATS_EXTENSION:
+        execution_result.extensions["sqlStats"] = stats_data
+    return stats_data
@@ -0,0 +1,66 @@
+import asyncio
+import json
+
+from ...api import schema
+from ...tests.fixtures import API_PATH
+from ...views import AsyncGraphQLView
+
+QUERY_TYPENAME = "query AsyncTypename { __typename }"
+
+
+def test_async_graphql_view_is_async_and_csrf_exempt():
+    # when
+    view = AsyncGraphQLView.as_view(schema=schema)
+
+    # then
+    assert asyncio.iscoroutinefunction(view)
+    assert view.csrf_exempt is True
+    assert view.view_class is AsyncGraphQLView
+
+
+async def test_async_graphql_view_executes_query(async_rf):
+    # given
+    view = AsyncGraphQLView.as_view(schema=schema)
+    request = async_rf.post(
+        API_PATH,
+        data=json.dumps({"query": QUERY_TYPENAME}),
+        content_type="application/json",
+    )
+
+    # when
+    response = await view(request)
+
+    # then
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"data": {"__typename": "Query"}}
+
+
+async def test_async_graphql_view_executes_batch(async_rf):
+    # given
+    view = AsyncGraphQLView.as_view(schema=schema)
+    request = async_rf.post(
+        API_PATH,
+        data=json.dumps([{"query": QUERY_TYPENAME}, {"query": "{ invalid }"}]),
+        content_type="application/json",
+    )
+
+    # when
+    response = await view(request)
+
+    # then
+    assert response.status_code == 400
+    content = json.loads(response.content)
+    assert content[0] == {"data": {"__typename": "Query"}}
+    assert "errors" in content[1]
+
+
+async def test_async_graphql_view_not_allowed_method(async_rf):
+    # given
+    view = AsyncGraphQLView.as_view(schema=schema)
+    request = async_rf.delete(API_PATH)
+
+    # when
+    response = await view(request)
+
+    # then
+    assert response.status_code == 405
@@ -0,0 +1,138 @@
+from unittest import mock
+
+import pytest
+from graphql import get_default_backend
+
+from ...api import schema
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+from ..document_cache import document_cache, document_from_string
+
+QUERY_SHOP = """
+    query DocumentCacheShop {
+        shop {
+            name
+        }
+    }
+"""
+
+
+@pytest.fixture
+def clear_document_cache():
+    document_cache.clear()
+    yield
+    document_cache.clear()
+
+
+def test_document_from_string_caches_valid_document(clear_document_cache, settings):
+    # given
+    settings.GRAPHQL_DOCUMENT_CACHE_SIZE = 10
+    backend = get_default_backend()
+
+    # when
+    first_document = document_from_string(backend, schema, QUERY_SHOP)
+    second_document = document_from_string(backend, schema, QUERY_SHOP)
+
+    # then
+    assert first_document is second_document
+    assert document_cache.misses == 1
+    assert document_cache.hits == 1
+
+
+@mock.patch("saleor.graphql.core.document_cache.validate")
+def test_document_from_string_cache_hit_skips_parsing_and_validation(
+    mocked_validate, clear_document_cache, settings
+):
+    # given
+    settings.GRAPHQL_DOCUMENT_CACHE_SIZE = 10
+    mocked_validate.return_value = []
+    backend = mock.Mock(wraps=get_default_backend())
+    document_from_string(backend, schema, QUERY_SHOP)
+
+    # when
+    document_from_string(backend, schema, QUERY_SHOP)
+
+    # then
+    backend.document_from_string.assert_called_once_with(schema, QUERY_SHOP)
+    mocked_validate.assert_called_once()
+
+
+def test_document_from_string_does_not_cache_invalid_document(
+    clear_document_cache, settings
+):
+    # given
+    settings.GRAPHQL_DOCUMENT_CACHE_SIZE = 10
+    query = "query { shop { invalidField } }"
+
+    # when
+    document = document_from_string(get_default_backend(), schema, query)
+
+    # then
+    assert len(document_cache) == 0
+    result = document.execute()
+    assert result.invalid
+    assert result.errors
+
+
+def test_document_from_string_cache_disabled(clear_document_cache, settings):
+    # given
+    settings.GRAPHQL_DOCUMENT_CACHE_SIZE = 0
+    backend = get_default_backend()
+
+    # when
+    first_document = document_from_string(backend, schema, QUERY_SHOP)
+    second_document = document_from_string(backend, schema, QUERY_SHOP)
+
+    # then
+    assert first_document is not second_document
+    assert len(document_cache) == 0
+
+
+def test_document_cache_evicts_least_recently_used(clear_document_cache, settings):
+    # given
+    settings.GRAPHQL_DOCUMENT_CACHE_SIZE = 2
+    backend = get_default_backend()
+    queries = [
+        "query First { shop { name } }",
+        "query Second { shop { name } }",
+        "query Third { shop { name } }",
+    ]
+
+    # when
+    for query in queries:
+        document_from_string(backend, schema, query)
+
+    # then
+    assert len(document_cache) == 2
+    assert document_cache.evictions == 1
+
+
+def test_cached_document_is_executed_by_view(
+    clear_document_cache, settings, api_client, site_settings
+):
+    # given
+    settings.GRAPHQL_DOCUMENT_CACHE_SIZE = 10
+    api_client.post_graphql(QUERY_SHOP)
+
+    # when
+    response = api_client.post_graphql(QUERY_SHOP)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+    assert document_cache.hits == 1
+
+
+def test_cached_invalid_query_returns_validation_error(
+    clear_document_cache, settings, api_client
+):
+    # given
+    settings.GRAPHQL_DOCUMENT_CACHE_SIZE = 10
+    query = "query { shop { invalidField } }"
+
+    # when
+    response = api_client.post_graphql(query)
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"]
@@ -0,0 +1,248 @@
+import json
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from ....core.models import PersistedQuery
+from ...tests.fixtures import API_PATH
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+from ..persisted_queries import (
+    get_persisted_query,
+    get_persisted_query_cache_key,
+    hash_query,
+    local_allowlisted_queries,
+    local_persisted_queries,
+    save_persisted_query,
+)
+
+QUERY_SHOP = """
+    query PersistedShop {
+        shop {
+            name
+        }
+    }
+"""
+
+MUTATION_TOKEN_CREATE = """
+    mutation PersistedTokenCreate {
+        tokenCreate(email: "user@example.com", password: "password") {
+            token
+        }
+    }
+"""
+
+
+def _persisted_query_extensions(query):
+    return {"persistedQuery": {"version": 1, "sha256Hash": hash_query(query)}}
+
+
+def _clear_persisted_queries():
+    local_persisted_queries.clear()
+    local_allowlisted_queries.clear()
+    cache.delete_many(
+        [
+            get_persisted_query_cache_key(hash_query(query))
+            for query in [QUERY_SHOP, MUTATION_TOKEN_CREATE]
+        ]
+    )
+
+
+@pytest.fixture
+def persisted_queries_enabled(settings):
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = True
+    _clear_persisted_queries()
+    yield settings
+    _clear_persisted_queries()
+
+
+def test_persisted_query_not_found(persisted_queries_enabled, api_client):
+    # given
+    data = {"extensions": _persisted_query_extensions(QUERY_SHOP)}
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_registered_on_miss(
+    persisted_queries_enabled, api_client, site_settings
+):
+    # given
+    extensions = _persisted_query_extensions(QUERY_SHOP)
+    api_client.post({"query": QUERY_SHOP, "extensions": extensions})
+
+    # when
+    response = api_client.post({"extensions": extensions})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+    assert get_persisted_query(hash_query(QUERY_SHOP)) == QUERY_SHOP
+
+
+def test_persisted_query_hash_mismatch(persisted_queries_enabled, api_client):
+    # given
+    extensions = _persisted_query_extensions("query { shop { domain { host } } }")
+
+    # when
+    response = api_client.post({"query": QUERY_SHOP, "extensions": extensions})
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    error = content["errors"][0]
+    assert error["extensions"]["code"] == "PERSISTED_QUERY_HASH_MISMATCH"
+    assert get_persisted_query(hash_query(QUERY_SHOP)) is None
+
+
+def test_persisted_query_not_supported_when_disabled(settings, api_client):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+    data = {"extensions": _persisted_query_extensions(QUERY_SHOP)}
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    error = content["errors"][0]
+    assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_SUPPORTED"
+
+
+def test_persisted_query_sent_with_get(
+    persisted_queries_enabled, api_client, site_settings
+):
+    # given
+    save_persisted_query(hash_query(QUERY_SHOP), QUERY_SHOP)
+    params = {"extensions": json.dumps(_persisted_query_extensions(QUERY_SHOP))}
+
+    # when
+    response = api_client.get(API_PATH, params)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_query_sent_with_get_when_persisted_queries_disabled(settings, api_client):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+    settings.PLAYGROUND_ENABLED = False
+
+    # when
+    response = api_client.get(API_PATH, {"query": QUERY_SHOP})
+
+    # then
+    assert response.status_code == 405
+
+
+def test_mutation_sent_with_get_is_rejected(persisted_queries_enabled, api_client):
+    # given
+    save_persisted_query(hash_query(MUTATION_TOKEN_CREATE), MUTATION_TOKEN_CREATE)
+    extensions = _persisted_query_extensions(MUTATION_TOKEN_CREATE)
+    params = {"extensions": json.dumps(extensions)}
+
+    # when
+    response = api_client.get(API_PATH, params)
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Only query operations can be sent with GET requests."
+    )
+
+
+def test_allowlist_only_rejects_not_registered_query(
+    persisted_queries_enabled, api_client
+):
+    # given
+    persisted_queries_enabled.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY = True
+    extensions = _persisted_query_extensions(QUERY_SHOP)
+
+    # when
+    response = api_client.post({"query": QUERY_SHOP, "extensions": extensions})
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_ALLOWED"
+    assert get_persisted_query(hash_query(QUERY_SHOP)) is None
+
+
+def test_allowlist_only_rejects_raw_query(persisted_queries_enabled, api_client):
+    # given
+    persisted_queries_enabled.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY = True
+
+    # when
+    response = api_client.post_graphql(QUERY_SHOP)
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_ALLOWED"
+
+
+def test_allowlist_only_executes_registered_query(
+    persisted_queries_enabled, api_client, site_settings, tmp_path
+):
+    # given
+    persisted_queries_enabled.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY = True
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({hash_query(QUERY_SHOP): QUERY_SHOP}))
+    call_command("register_persisted_queries", str(manifest))
+
+    # when
+    response = api_client.post({"extensions": _persisted_query_extensions(QUERY_SHOP)})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_allowlist_only_rejects_query_registered_by_client(
+    persisted_queries_enabled, api_client
+):
+    # given
+    save_persisted_query(hash_query(QUERY_SHOP), QUERY_SHOP)
+    persisted_queries_enabled.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY = True
+    extensions = _persisted_query_extensions(QUERY_SHOP)
+
+    # when
+    hash_response = api_client.post({"extensions": extensions})
+    query_response = api_client.post({"query": QUERY_SHOP, "extensions": extensions})
+
+    # then
+    content = get_graphql_content_from_response(hash_response)
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+    content = get_graphql_content_from_response(query_response)
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_ALLOWED"
+
+
+def test_registered_query_stored_in_database(
+    persisted_queries_enabled, api_client, site_settings, tmp_path
+):
+    # given
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({hash_query(QUERY_SHOP): QUERY_SHOP}))
+    call_command("register_persisted_queries", str(manifest))
+    persisted_queries_enabled.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY = True
+    _clear_persisted_queries()
+
+    # when
+    response = api_client.post({"extensions": _persisted_query_extensions(QUERY_SHOP)})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+    assert PersistedQuery.objects.get(query_hash=hash_query(QUERY_SHOP)).query == (
+        QUERY_SHOP
+    )
+    assert get_persisted_query(hash_query(QUERY_SHOP)) is None
@@ -1,6 +1,15 @@
+from unittest import mock
+
 import graphene
 import pytest
+from django.conf import settings
 from django.test import override_settings
+from graphql import get_default_backend
+
+from ...api import schema
+from ...query_cost_map import COST_MAP
+from ..document_cache import document_from_string
+from ..validators.query_cost import QueryCostCache, validate_query_cost
 
 
 @override_settings(GRAPHQL_QUERY_MAX_COMPLEXITY=1)
@@ -241,3 +250,78 @@ def test_query_with_fragments_have_same_multiplied_complexity_cost(
     assert json_response["data"] == expected_data
     query_cost = json_response["extensions"]["cost"]["requestedQueryCost"]
     assert query_cost == 120
+
+
+@override_settings(GRAPHQL_QUERY_MAX_COMPLEXITY=100000)
+def test_query_cost_is_cached_per_multiplier_variables(channel_USD):
+    # given
+    document = document_from_string(get_default_backend(), schema, PRODUCTS_QUERY)
+    document.query_cost_cache = QueryCostCache()
+    variables = {"channel": channel_USD.slug, "first": 10}
+    cost, errors = validate_query_cost(
+        schema, document, variables, COST_MAP, settings.GRAPHQL_QUERY_MAX_COMPLEXITY
+    )
+
+    # when
+    with mock.patch(
+        "saleor.graphql.core.validators.query_cost.validate"
+    ) as mocked_validate:
+        cached_cost, cached_errors = validate_query_cost(
+            schema,
+            document,
+            {"channel": "other-channel", "first": 10},
+            COST_MAP,
+            settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
+        )
+
+    # then
+    mocked_validate.assert_not_called()
+    assert document.query_cost_cache.multiplier_variables == ("first",)
+    assert cached_cost == cost == 120
+    assert cached_errors is errors is None
+
+
+@override_settings(GRAPHQL_QUERY_MAX_COMPLEXITY=100000)
+def test_query_cost_is_recomputed_for_different_multipliers(channel_USD):
+    # given
+    document = document_from_string(get_default_backend(), schema, PRODUCTS_QUERY)
+    document.query_cost_cache = QueryCostCache()
+    validate_query_cost(
+        schema,
+        document,
+        {"channel": channel_USD.slug, "first": 10},
+        COST_MAP,
+        settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
+    )
+
+    # when
+    cost, errors = validate_query_cost(
+        schema,
+        document,
+        {"channel": channel_USD.slug, "first": 5},
+        COST_MAP,
+        settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
+    )
+
+    # then
+    assert cost == 35
+    assert errors is None
+
+
+@override_settings(GRAPHQL_QUERY_MAX_COMPLEXITY=100000)
+def test_cached_query_cost_exceeding_lower_limit_returns_error(channel_USD):
+    # given
+    document = document_from_string(get_default_backend(), schema, PRODUCTS_QUERY)
+    document.query_cost_cache = QueryCostCache()
+    variables = {"channel": channel_USD.slug, "first": 10}
+    validate_query_cost(schema, document, variables, COST_MAP, 100000)
+
+    # when
+    cost, errors = validate_query_cost(schema, document, variables, COST_MAP, 10)
+
+    # then
+    assert cost == 120
+    assert len(errors) == 1
+    assert str(errors[0]) == (
+        "The query exceeds the maximum cost of 10. Actual cost is 120"
+    )
@@ -0,0 +1,202 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from graphql import get_default_backend
+
+from ....core.taxes import zero_taxed_money
+from ....plugins.manager import get_plugins_manager
+from ....product.models import Product
+from ...api import schema
+from ...tests.utils import get_graphql_content
+from ..document_cache import document_from_string
+from ..response_cache import (
+    GLOBAL_TAG,
+    get_response_cache_tags,
+    get_tag_versions,
+    invalidate_response_cache,
+    invalidate_response_cache_for_event,
+)
+
+QUERY_PRODUCTS = """
+    query ResponseCacheProducts($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                    category {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+QUERY_ME = """
+    query ResponseCacheMe {
+        me {
+            email
+        }
+    }
+"""
+
+
+@pytest.fixture
+def response_cache_enabled(settings):
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    cache.clear()
+    yield settings
+    cache.clear()
+
+
+def _get_product_names(response):
+    content = get_graphql_content(response)
+    return [edge["node"]["name"] for edge in content["data"]["products"]["edges"]]
+
+
+def test_response_cache_tags_of_selected_types():
+    # given
+    document = document_from_string(get_default_backend(), schema, QUERY_PRODUCTS)
+
+    # when
+    tags = get_response_cache_tags(schema, document)
+
+    # then
+    assert tags == {GLOBAL_TAG, "product", "category"}
+
+
+def test_anonymous_response_is_cached(
+    response_cache_enabled, api_client, product, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+    assert _get_product_names(response) == [product.name]
+    Product.objects.filter(pk=product.pk).update(name="Changed name")
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert _get_product_names(response) == [product.name]
+    assert response["Surrogate-Key"] == "category channel product"
+    assert "Authorization" in response["Vary"]
+
+
+def test_cached_response_invalidated_by_event(
+    response_cache_enabled,
+    api_client,
+    product,
+    channel_USD,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+    Product.objects.filter(pk=product.pk).update(name="Changed name")
+    product.refresh_from_db()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        get_plugins_manager().product_updated(product)
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert _get_product_names(response) == ["Changed name"]
+
+
+def test_authenticated_response_is_not_cached(
+    response_cache_enabled, user_api_client, product, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    user_api_client.post_graphql(QUERY_PRODUCTS, variables)
+    Product.objects.filter(pk=product.pk).update(name="Changed name")
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert _get_product_names(response) == ["Changed name"]
+    assert not response.has_header("Surrogate-Key")
+
+
+def test_not_storefront_query_is_not_cached(response_cache_enabled, api_client):
+    # when
+    response = api_client.post_graphql(QUERY_ME)
+
+    # then
+    get_graphql_content(response)
+    assert not response.has_header("Surrogate-Key")
+
+
+def test_cdn_cache_control_header(
+    response_cache_enabled, api_client, product, channel_USD
+):
+    # given
+    response_cache_enabled.GRAPHQL_RESPONSE_CACHE_CDN_MAX_AGE = 30
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+
+    # then
+    get_graphql_content(response)
+    cache_control = response["Cache-Control"].split(", ")
+    assert sorted(cache_control) == ["max-age=30", "public"]
+
+
+def test_invalidate_response_cache_bumps_tag_versions(response_cache_enabled):
+    # given
+    versions = get_tag_versions(["menu", "product"])
+
+    # when
+    invalidate_response_cache(["product"])
+
+    # then
+    new_versions = get_tag_versions(["menu", "product"])
+    assert new_versions[0] == versions[0]
+    assert new_versions[1] != versions[1]
+
+
+def test_invalidate_response_cache_for_event_after_commit(
+    response_cache_enabled, django_capture_on_commit_callbacks
+):
+    # given
+    versions = get_tag_versions(["product"])
+
+    # when
+    with django_capture_on_commit_callbacks() as callbacks:
+        invalidate_response_cache_for_event("product_updated")
+
+    # then
+    assert get_tag_versions(["product"]) == versions
+    assert len(callbacks) == 1
+    callbacks[0]()
+    assert get_tag_versions(["product"]) != versions
+
+
+@patch("saleor.plugins.manager.invalidate_response_cache_for_event")
+def test_plugins_manager_invalidates_response_cache_only_for_events(
+    mocked_invalidate, response_cache_enabled, product
+):
+    # given
+    manager = get_plugins_manager()
+
+    # when
+    manager.product_updated(product)
+    manager.get_checkout_line_tax_rate(None, [], None, None, zero_taxed_money("USD"))
+
+    # then
+    mocked_invalidate.assert_called_once_with("product_updated")
+
+
+def test_invalidate_response_cache_for_not_related_event(response_cache_enabled):
+    # given
+    versions = get_tag_versions(["menu", "product", GLOBAL_TAG])
+
+    # when
+    invalidate_response_cache_for_event("order_created")
+
+    # then
+    assert get_tag_versions(["menu", "product", GLOBAL_TAG]) == versions
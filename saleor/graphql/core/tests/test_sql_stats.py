@@ -0,0 +1,67 @@
+from ....product.models import Product
+from ...tests.utils import get_graphql_content
+from ..sql_stats import SqlStats, record_sql_stats
+
+QUERY_PRODUCTS = """
+    query SqlStatsProducts($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+
+def test_sql_stats_count_duplicated_statements(product):
+    # given
+    sql_stats = SqlStats()
+
+    # when
+    with record_sql_stats(sql_stats):
+        list(Product.objects.filter(pk=product.pk))
+        list(Product.objects.filter(pk=product.pk + 1))
+        Product.objects.count()
+
+    # then
+    assert sql_stats.count == 3
+    assert sql_stats.duplicates == 1
+    assert sql_stats.time > 0
+
+
+def test_sql_stats_not_recorded_when_disabled(product):
+    # when
+    with record_sql_stats(None):
+        product_count = Product.objects.count()
+
+    # then
+    assert product_count == 1
+
+
+def test_sql_stats_extension(settings, api_client, product, channel_USD):
+    # given
+    settings.GRAPHQL_SQL_STATS_EXTENSION = True
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+
+    # then
+    content = get_graphql_content(response)
+    sql_stats = content["extensions"]["sqlStats"]
+    assert sql_stats["count"] > 0
+    assert sql_stats["duplicates"] >= 0
+    assert sql_stats["totalMs"] >= 0
+
+
+def test_sql_stats_extension_disabled(settings, api_client, product, channel_USD):
+    # given
+    settings.GRAPHQL_SQL_STATS_EXTENSION = False
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+
+    # then
+    content = get_graphql_content(response)
+    assert "sqlStats" not in content.get("extensions", {})
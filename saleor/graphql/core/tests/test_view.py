@@ -8,9 +8,11 @@ from graphql.execution.base import ExecutionResult
 from .... import __version__ as saleor_version
 from ....demo.views import EXAMPLE_QUERY
 from ....graphql.utils import INTERNAL_ERROR_MESSAGE
+from ....plugins.manager import get_plugins_manager
 from ...tests.fixtures import API_PATH
 from ...tests.utils import get_graphql_content, get_graphql_content_from_response
-from ...views import generate_cache_key
+from ...views import GraphQLView, generate_cache_key
+from ..introspection_cache import introspection_cache
 
 
 def test_batch_queries(category, product, api_client, channel_USD):
@@ -286,6 +288,13 @@ query IntrospectionQuery {
 INTROSPECTION_RESULT = {"__schema": {"queryType": {"name": "Query"}}}
 
 
+@pytest.fixture(autouse=True)
+def clear_introspection_cache():
+    introspection_cache.clear()
+    yield
+    introspection_cache.clear()
+
+
 @mock.patch("saleor.graphql.views.cache.set")
 @mock.patch("saleor.graphql.views.cache.get")
 @override_settings(DEBUG=False, OBSERVABILITY_REPORT_ALL_API_CALLS=False)
@@ -329,6 +338,271 @@ def test_introspection_query_is_not_cached_in_debug_mode(
     cache_set_mock.assert_not_called()
 
 
+@mock.patch("saleor.graphql.views.cache.set")
+@mock.patch("saleor.graphql.views.cache.get")
+@override_settings(DEBUG=False, OBSERVABILITY_REPORT_ALL_API_CALLS=False)
+def test_introspection_response_served_from_memory(
+    cache_get_mock, cache_set_mock, api_client
+):
+    # given
+    cache_get_mock.return_value = None
+    first_response = api_client.post_graphql(INTROSPECTION_QUERY)
+
+    # when
+    response = api_client.post_graphql(INTROSPECTION_QUERY)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"] == INTROSPECTION_RESULT
+    assert response.content == first_response.content
+    cache_get_mock.assert_called_once()
+    cache_set_mock.assert_called_once()
+    assert len(introspection_cache) == 1
+
+
+@override_settings(
+    DEBUG=False,
+    OBSERVABILITY_REPORT_ALL_API_CALLS=False,
+    GRAPHQL_INTROSPECTION_CACHE_SIZE=0,
+)
+def test_introspection_response_not_kept_in_memory_when_disabled(api_client):
+    # when
+    response = api_client.post_graphql(INTROSPECTION_QUERY)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"] == INTROSPECTION_RESULT
+    assert len(introspection_cache) == 0
+
+
+@override_settings(DEBUG=False, OBSERVABILITY_REPORT_ALL_API_CALLS=False)
+def test_invalid_introspection_query_not_kept_in_memory(api_client):
+    # given
+    query = "query { __schema { queryType { name } } shop { name } }"
+
+    # when
+    response = api_client.post_graphql(query)
+
+    # then
+    assert response.status_code == 400
+    assert len(introspection_cache) == 0
+
+
+@override_settings(DEBUG=False, OBSERVABILITY_REPORT_ALL_API_CALLS=False)
+def test_not_introspection_query_parsed_once(api_client):
+    # given
+    query = "query { shop { name } }"
+
+    # when
+    with mock.patch.object(
+        GraphQLView, "parse_query", autospec=True, side_effect=GraphQLView.parse_query
+    ) as parse_query_mock:
+        response = api_client.post_graphql(query)
+
+    # then
+    get_graphql_content(response)
+    parse_query_mock.assert_called_once()
+    assert len(introspection_cache) == 0
+
+
 def test_generate_cache_key_use_saleor_version():
     cache_key = generate_cache_key(INTROSPECTION_QUERY)
     assert saleor_version in cache_key
+
+
+BATCH_TYPENAME_QUERY = "query BatchTypename { __typename }"
+
+BATCH_MUTATION = """
+    mutation BatchTokenVerify {
+        tokenVerify(token: "invalid") {
+            isValid
+        }
+    }
+"""
+
+
+@mock.patch(
+    "saleor.graphql.views.GraphQLView.get_response_in_thread",
+    autospec=True,
+    side_effect=GraphQLView.get_response_in_thread,
+)
+def test_batch_queries_executed_concurrently(
+    mocked_get_response_in_thread, api_client, settings
+):
+    # given
+    settings.GRAPHQL_BATCH_CONCURRENCY = 4
+    data = [{"query": BATCH_TYPENAME_QUERY} for _ in range(3)]
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    batch_content = get_graphql_content(response)
+    assert batch_content == [{"data": {"__typename": "Query"}}] * 3
+    assert mocked_get_response_in_thread.call_count == 3
+
+
+@mock.patch(
+    "saleor.graphql.views.GraphQLView.get_response_in_thread",
+    autospec=True,
+    side_effect=GraphQLView.get_response_in_thread,
+)
+def test_batch_mutations_are_not_executed_concurrently(
+    mocked_get_response_in_thread, api_client, settings
+):
+    # given
+    settings.GRAPHQL_BATCH_CONCURRENCY = 4
+    data = [
+        {"query": BATCH_TYPENAME_QUERY},
+        {"query": BATCH_MUTATION},
+        {"query": BATCH_TYPENAME_QUERY},
+    ]
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    batch_content = get_graphql_content(response)
+    assert batch_content[0] == {"data": {"__typename": "Query"}}
+    assert "tokenVerify" in batch_content[1]["data"]
+    assert batch_content[2] == {"data": {"__typename": "Query"}}
+    assert mocked_get_response_in_thread.call_count == 2
+
+
+def test_batch_concurrent_execution_keeps_status_code(api_client, settings):
+    # given
+    settings.GRAPHQL_BATCH_CONCURRENCY = 4
+    data = [{"query": BATCH_TYPENAME_QUERY}, {"query": "query { invalid }"}]
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    assert response.status_code == 400
+    batch_content = get_graphql_content_from_response(response)
+    assert batch_content[0] == {"data": {"__typename": "Query"}}
+    assert "errors" in batch_content[1]
+
+
+@mock.patch("saleor.graphql.views.get_batch_executor")
+def test_batch_queries_executed_sequentially_by_default(
+    mocked_get_batch_executor, api_client, settings
+):
+    # given
+    settings.GRAPHQL_BATCH_CONCURRENCY = 0
+    data = [{"query": BATCH_TYPENAME_QUERY} for _ in range(2)]
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    batch_content = get_graphql_content(response)
+    assert len(batch_content) == 2
+    mocked_get_batch_executor.assert_not_called()
+
+
+BATCH_PRODUCT_PRICING_QUERY = """
+    query ProductPricing($id: ID!, $channel: String) {
+        shop {
+            availablePaymentGateways(channel: $channel) {
+                id
+            }
+        }
+        product(id: $id, channel: $channel) {
+            name
+            category {
+                name
+            }
+            pricing {
+                priceRange {
+                    start {
+                        gross {
+                            amount
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+# Worker threads use their own database connections, so they see only committed rows.
+@pytest.mark.django_db(transaction=True)
+def test_batch_queries_executed_concurrently_resolve_fields_with_plugins(
+    product, api_client, channel_USD, site_settings, settings
+):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    data = [
+        {"query": BATCH_PRODUCT_PRICING_QUERY, "variables": variables} for _ in range(3)
+    ]
+    settings.GRAPHQL_BATCH_CONCURRENCY = 0
+    expected_content = get_graphql_content(api_client.post(data))
+
+    # when
+    settings.GRAPHQL_BATCH_CONCURRENCY = 4
+    response = api_client.post(data)
+
+    # then
+    batch_content = get_graphql_content(response)
+    assert batch_content == expected_content
+    assert batch_content[0]["data"]["product"]["pricing"]["priceRange"]
+    assert batch_content[0]["data"]["product"]["category"]["name"] == (
+        product.category.name
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+@mock.patch("saleor.graphql.plugins.dataloaders.get_plugins_manager")
+def test_batch_queries_executed_concurrently_use_own_plugins_managers(
+    mocked_get_plugins_manager,
+    product,
+    api_client,
+    channel_USD,
+    site_settings,
+    settings,
+):
+    # given
+    managers = []
+
+    def get_manager(*args, **kwargs):
+        manager = get_plugins_manager(*args, **kwargs)
+        managers.append(manager)
+        return manager
+
+    mocked_get_plugins_manager.side_effect = get_manager
+    settings.GRAPHQL_BATCH_CONCURRENCY = 4
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    data = [
+        {"query": BATCH_PRODUCT_PRICING_QUERY, "variables": variables} for _ in range(3)
+    ]
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    get_graphql_content(response)
+    assert len(managers) == 3
+    assert len({id(manager) for manager in managers}) == 3
+
+
+def test_copy_request_drops_operation_context(rf):
+    # given
+    request = rf.post(API_PATH)
+    request.dataloaders = {"loader": object()}
+    request._cached_user = object()
+
+    # when
+    request_copy = GraphQLView.copy_request(request)
+
+    # then
+    assert not hasattr(request_copy, "dataloaders")
+    assert not hasattr(request_copy, "_cached_user")
+    assert request.dataloaders
@@ -1,6 +1,7 @@
+import json
 from functools import reduce
 from operator import add, mul
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 from graphql import (
     GraphQLError,
@@ -15,13 +16,18 @@ from graphql.language.ast import (
     FragmentDefinition,
     FragmentSpread,
     InlineFragment,
+    ListValue,
+    ObjectValue,
     OperationDefinition,
+    Variable,
 )
 from graphql.type import GraphQLField
 from graphql.validation import validate
 from graphql.validation.rules.base import ValidationRule
 from graphql.validation.validation import ValidationContext
 
+from ....core.utils.lru import LRUCache
+
 CostAwareNode = Union[
     Field,
     FragmentDefinition,
@@ -32,6 +38,10 @@ CostAwareNode = Union[
 
 GraphQLFieldMap = Dict[str, GraphQLField]
 
+# Number of distinct multiplier values for which the cost of a single document
+# is remembered.
+QUERY_COST_CACHE_SIZE = 100
+
 
 class CostValidator(ValidationRule):
     maximum_cost: int
@@ -56,6 +66,7 @@ class CostValidator(ValidationRule):
         self.default_complexity = default_complexity
         self.cost = 0
         self.operation_multipliers: List[Any] = []
+        self.multiplier_variables: Set[str] = set()
 
     def __call__(self, context: ValidationContext):
         self.context = context
@@ -175,11 +186,18 @@ class CostValidator(ValidationRule):
             return None
         cost_args = cost_args.copy()
         if "multipliers" in cost_args:
+            self.collect_multiplier_variables(node, cost_args["multipliers"])
             cost_args["multipliers"] = self.get_multipliers_from_string(
                 cost_args["multipliers"], field_args
             )
         return cost_args
 
+    def collect_multiplier_variables(self, node: Field, multipliers: List[str]):
+        argument_names = {multiplier.split(".")[0] for multiplier in multipliers}
+        for argument in node.arguments or []:
+            if argument.name.value in argument_names:
+                self.multiplier_variables.update(get_variable_names(argument.value))
+
     def get_multipliers_from_string(self, multipliers: List[str], field_args):
         accessors = [s.split(".") for s in multipliers]
         multipliers: Any = []
@@ -256,6 +274,16 @@ def validate_cost_map(cost_map: Dict[str, Dict[str, Any]], schema: GraphQLSchema
                 )
 
 
+def get_variable_names(value_node) -> Set[str]:
+    if isinstance(value_node, Variable):
+        return {value_node.name.value}
+    if isinstance(value_node, ListValue):
+        return set().union(*[get_variable_names(v) for v in value_node.values])
+    if isinstance(value_node, ObjectValue):
+        return set().union(*[get_variable_names(f.value) for f in value_node.fields])
+    return set()
+
+
 def report_error(context: ValidationContext, error: Exception):
     context.report_error(GraphQLError(str(error)))
 
@@ -287,6 +315,38 @@ def cost_validator(
     )
 
 
+class QueryCostCache:
+    """Costs computed for a single document.
+
+    The cost of a document depends only on the values of variables used as
+    multipliers (e.g. `first` or `last`), so these values are the cache key.
+    """
+
+    def __init__(self, maxsize: int = QUERY_COST_CACHE_SIZE):
+        self.multiplier_variables: Optional[Tuple[str, ...]] = None
+        self.costs: LRUCache[int] = LRUCache(maxsize)
+
+    def get_key(self, cost_map, variables) -> Optional[str]:
+        if self.multiplier_variables is None:
+            return None
+        variables = variables if isinstance(variables, dict) else {}
+        values = [variables.get(name) for name in self.multiplier_variables]
+        return f"{id(cost_map)}:{json.dumps(values, sort_keys=True, default=str)}"
+
+    def get(self, cost_map, variables) -> Optional[int]:
+        key = self.get_key(cost_map, variables)
+        if key is None:
+            return None
+        return self.costs.get(key)
+
+    def set(self, cost_map, variables, validator: CostValidator):
+        if self.multiplier_variables is None:
+            self.multiplier_variables = tuple(sorted(validator.multiplier_variables))
+        key = self.get_key(cost_map, variables)
+        if key is not None:
+            self.costs.set(key, validator.cost)
+
+
 def validate_query_cost(
     schema,
     query,
@@ -299,11 +359,24 @@ def validate_query_cost(
         variables=variables,
         cost_map=cost_map,
     )
+    cost_cache: Optional[QueryCostCache] = getattr(query, "query_cost_cache", None)
+    if cost_cache is not None:
+        cost = cost_cache.get(cost_map, variables)
+        if cost is not None:
+            validator.cost = cost
+            if cost > maximum_cost:
+                return cost, [validator.get_cost_exceeded_error()]
+            return cost, None
+
     error = validate(
         schema,
         query.document_ast,
         [validator],  # type: ignore[list-item] # cost validator is an instance that pretends to be a class # noqa: E501
     )
+    # Errors other than exceeding the maximum cost may depend on the values of
+    # other variables, so such results are not cached.
+    if cost_cache is not None and all(isinstance(e, QueryCostError) for e in error):
+        cost_cache.set(cost_map, variables, validator)
     if error:
         return validator.cost, error
     return validator.cost, None
@@ -0,0 +1,42 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...core.persisted_queries import hash_query, save_allowlisted_queries
+
+
+class Command(BaseCommand):
+    help = (
+        "Registers persisted GraphQL queries from a manifest file. Accepts either "
+        "an Apollo persisted query manifest or a JSON object mapping SHA-256 "
+        "hashes to query strings."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("manifest", help="Path to the JSON manifest file.")
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["manifest"]) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Unable to read the manifest: {e}")
+
+        if isinstance(manifest, dict) and "operations" in manifest:
+            queries = {
+                operation["id"]: operation["body"]
+                for operation in manifest["operations"]
+            }
+        elif isinstance(manifest, dict):
+            queries = manifest
+        else:
+            raise CommandError("Unsupported manifest format.")
+
+        for query_hash, query in queries.items():
+            if hash_query(query) != query_hash.lower():
+                raise CommandError(f"Hash {query_hash} does not match its query.")
+
+        save_allowlisted_queries(
+            {query_hash.lower(): query for query_hash, query in queries.items()}
+        )
+        self.stdout.write(f"Registered {len(queries)} persisted queries.")
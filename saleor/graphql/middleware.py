@@ -2,6 +2,7 @@ from django.conf import settings
 
 from ..core.exceptions import ReadOnlyException
 from .core import ResolveInfo
+from .core.resolver_stats import ResolverStatsMiddleware  # noqa: F401
 from .views import GraphQLView
 
 
@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError
 
 from ....channel import models as channel_models
 from ....permission.enums import OrderPermissions
+from ....plugins.manager import invalidate_plugins_manager_prototypes
 from ....site.error_codes import OrderSettingsErrorCode
 from ...channel.types import OrderSettings
 from ...core import ResolveInfo
@@ -74,6 +75,7 @@ class OrderSettingsUpdate(BaseMutation):
 
         if update_fields:
             channel_models.Channel.objects.update(**update_fields)
+            invalidate_plugins_manager_prototypes()
 
         channel.refresh_from_db()
 
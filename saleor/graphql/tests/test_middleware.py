@@ -2,6 +2,7 @@ import pytest
 from django.test import override_settings
 
 from ...core.exceptions import ReadOnlyException
+from ..core.resolver_stats import ResolverStats
 from .utils import get_graphql_content
 
 
@@ -46,3 +47,89 @@ def test_read_only_middleware_allowed_mutation(staff_api_client, customer_user):
 def test_middleware_invalid_name(api_client):
     with pytest.raises(ImportError):
         api_client.post_graphql("")
+
+
+RESOLVER_STATS_MIDDLEWARE = ["saleor.graphql.middleware.ResolverStatsMiddleware"]
+
+QUERY_PRODUCTS_WITH_CATEGORY = """
+    query ProductsWithCategory($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                    category {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@override_settings(GRAPHQL_MIDDLEWARE=RESOLVER_STATS_MIDDLEWARE)
+def test_resolver_stats_middleware_returns_stats_for_staff(
+    staff_api_client, product, channel_USD
+):
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_PRODUCTS_WITH_CATEGORY, {"channel": channel_USD.slug}
+    )
+
+    # then
+    content = get_graphql_content(response)
+    stats = content["extensions"]["resolverStats"]
+    fields = {entry["field"]: entry for entry in stats["fields"]}
+    assert fields["Query.products"]["count"] == 1
+    assert fields["Product.category"]["count"] == 1
+    loaders = {entry["loader"]: entry for entry in stats["dataloaders"]}
+    assert loaders["CategoryByIdLoader"]["batches"] == 1
+    assert loaders["CategoryByIdLoader"]["keys"] == 1
+
+
+@override_settings(
+    GRAPHQL_MIDDLEWARE=RESOLVER_STATS_MIDDLEWARE,
+    GRAPHQL_RESOLVER_STATS_SAMPLE_RATE=1.0,
+)
+def test_resolver_stats_middleware_hides_stats_from_customers(
+    api_client, product, channel_USD
+):
+    # when
+    response = api_client.post_graphql(
+        QUERY_PRODUCTS_WITH_CATEGORY, {"channel": channel_USD.slug}
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert "resolverStats" not in content.get("extensions", {})
+
+
+def test_resolver_stats_not_collected_without_middleware(staff_api_client):
+    # when
+    response = staff_api_client.post_graphql("{ shop { name } }")
+
+    # then
+    content = get_graphql_content(response)
+    assert "resolverStats" not in content.get("extensions", {})
+
+
+def test_resolver_stats_aggregates_calls():
+    # given
+    stats = ResolverStats()
+
+    # when
+    stats.record_field("Product.pricing", 0.002)
+    stats.record_field("Product.pricing", 0.003)
+    stats.record_field("Product.name", 0.001)
+    stats.record_batch("CategoryByIdLoader", 10, 0.004)
+
+    # then
+    assert stats.as_dict() == {
+        "fields": [
+            {"field": "Product.pricing", "count": 2, "totalMs": 5.0},
+            {"field": "Product.name", "count": 1, "totalMs": 1.0},
+        ],
+        "dataloaders": [
+            {"loader": "CategoryByIdLoader", "batches": 1, "keys": 10, "totalMs": 4.0}
+        ],
+    }
@@ -1,17 +1,35 @@
+import asyncio
+import copy
 import hashlib
 import importlib
 import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache, partial, update_wrapper
 from inspect import isclass
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import opentracing
 import opentracing.tags
 from django.conf import settings
 from django.core.cache import cache
-from django.db import connection
+from django.db import close_old_connections, connection
 from django.db.backends.postgresql.base import DatabaseWrapper
-from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
+from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed
 from django.shortcuts import render
+from django.utils.decorators import classonlymethod
+from django.utils.module_loading import import_string
 from django.views.generic import View
 from graphql import GraphQLDocument, get_default_backend
 from graphql.error import GraphQLError, GraphQLSyntaxError
@@ -23,14 +41,42 @@ from .. import __version__ as saleor_version
 from ..core.exceptions import PermissionDenied, ReadOnlyException
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
 from ..webhook import observability
+from ..webhook.transport.asynchronous.transport import batch_deferred_payloads
 from .api import API_PATH, schema
 from .context import get_context_value
+from .core.document_cache import document_from_string
+from .core.introspection_cache import get_introspection_cache_key, introspection_cache
+from .core.persisted_queries import PersistedQueryError, resolve_persisted_query
+from .core.resolver_stats import (
+    ResolverStatsMiddleware,
+    set_resolver_stats_on_result,
+    start_resolver_stats,
+)
+from .core.response_cache import (
+    cache_response,
+    get_cached_response,
+    get_response_cache_key,
+    get_response_cache_tags,
+    is_response_cacheable,
+    set_response_cache_headers,
+)
+from .core.sql_stats import get_sql_stats, record_sql_stats, set_sql_stats_on_result
 from .core.validators.query_cost import validate_query_cost
 from .query_cost_map import COST_MAP
 from .utils import format_error, query_fingerprint, query_identifier
 
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
 
+# Attributes set on the request by `get_context_value` and while resolving fields.
+OPERATION_CONTEXT_ATTRIBUTES = [
+    "app",
+    "dataloaders",
+    "decoded_auth_token",
+    "request_time",
+    "user",
+    "_cached_user",
+]
+
 
 def tracing_wrapper(execute, sql, params, many, context):
     conn: DatabaseWrapper = context["connection"]
@@ -47,6 +93,20 @@ def tracing_wrapper(execute, sql, params, many, context):
         return execute(sql, params, many, context)
 
 
+@lru_cache(maxsize=None)
+def get_response_serializer(path: str) -> Callable[[Any], bytes]:
+    return import_string(path)
+
+
+class GraphQLJsonResponse(HttpResponse):
+    """JSON response serialized with the `GRAPHQL_RESPONSE_SERIALIZER` function."""
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        serializer = get_response_serializer(settings.GRAPHQL_RESPONSE_SERIALIZER)
+        super().__init__(content=serializer(data), **kwargs)
+
+
 class GraphQLView(View):
     # This class is our implementation of `graphene_django.views.GraphQLView`,
     # which was extended to support the following features:
@@ -89,6 +149,10 @@ class GraphQLView(View):
         self.schema = self.schema or schema
         if middleware is not None:
             self.middleware = list(instantiate_middleware(middleware))
+        self.collect_resolver_stats = any(
+            isinstance(instance, ResolverStatsMiddleware)
+            for instance in self.middleware or []
+        )
         self.executor = executor
         self.root_value = root_value
         self.backend = backend
@@ -107,6 +171,8 @@ class GraphQLView(View):
     def dispatch(self, request, *args, **kwargs):
         # Handle options method the GraphQlView restricts it.
         if request.method == "GET":
+            if self.is_graphql_get_request(request):
+                return self.handle_query(request)
             if settings.PLAYGROUND_ENABLED:
                 return self.render_playground(request)
             return HttpResponseNotAllowed(["OPTIONS", "POST"])
@@ -118,6 +184,14 @@ class GraphQLView(View):
             else:
                 return HttpResponseNotAllowed(["OPTIONS", "POST"])
 
+    @staticmethod
+    def is_graphql_get_request(request: HttpRequest) -> bool:
+        # Queries sent with GET (e.g. persisted queries cached by a CDN)
+        # always carry the query or its hash in the query string.
+        if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+            return False
+        return "query" in request.GET or "extensions" in request.GET
+
     def render_playground(self, request):
         return render(
             request,
@@ -128,26 +202,77 @@ class GraphQLView(View):
             },
         )
 
-    def _handle_query(self, request: HttpRequest) -> JsonResponse:
+    def _handle_query(self, request: HttpRequest) -> HttpResponse:
         try:
             data = self.parse_body(request)
         except ValueError:
-            return JsonResponse(
+            return GraphQLJsonResponse(
                 data={"errors": [self.format_error("Unable to parse query.")]},
                 status=400,
             )
 
+        introspection_cache_key = None
+        if isinstance(data, dict):
+            introspection_cache_key = self.get_introspection_cache_key(request, data)
+            if introspection_cache_key:
+                if content := introspection_cache.get(introspection_cache_key):
+                    return HttpResponse(content, content_type="application/json")
+
         if isinstance(data, list):
-            responses = [self.get_response(request, entry) for entry in data]
+            responses = self.get_batch_responses(request, data)
             result: Union[list, Optional[dict]] = [
                 response for response, code in responses
             ]
             status_code = max((code for response, code in responses), default=200)
         else:
             result, status_code = self.get_response(request, data)
-        return JsonResponse(data=result, status=status_code, safe=False)
+        response = GraphQLJsonResponse(data=result, status=status_code)
+        if not isinstance(data, list):
+            if tags := getattr(request, "response_cache_tags", None):
+                set_response_cache_headers(response, tags)
+        if introspection_cache_key and isinstance(result, dict):
+            self.cache_introspection_response(introspection_cache_key, result)
+        return response
+
+    def get_introspection_cache_key(
+        self, request: HttpRequest, data: dict
+    ) -> Optional[str]:
+        """Return the key of the in-memory cache if the request is an introspection."""
+        if settings.DEBUG:
+            return None
+        query, variables, operation_name = self.get_graphql_params(request, data)
+        try:
+            query = resolve_persisted_query(query, data.get("extensions"))
+        except PersistedQueryError:
+            return None
+        # Other queries aren't parsed twice, the normal path parses them anyway.
+        if not query or "__schema" not in query:
+            return None
+        document, error = self.parse_query(query)
+        if error or document is None:
+            return None
+        try:
+            if not self.check_if_query_contains_only_schema(document):
+                return None
+        except GraphQLError:
+            return None
+        return get_introspection_cache_key(
+            self.schema, query, operation_name, variables
+        )
 
-    def handle_query(self, request: HttpRequest) -> JsonResponse:
+    @staticmethod
+    def cache_introspection_response(key: str, result: dict):
+        if result.get("errors") or not result.get("data"):
+            return
+        # Extensions collected for the current request (e.g. SQL or resolver stats)
+        # are not shared with other requests.
+        response: Dict[str, Any] = {"data": result["data"]}
+        if cost := result.get("extensions", {}).get("cost"):
+            response["extensions"] = {"cost": cost}
+        serializer = get_response_serializer(settings.GRAPHQL_RESPONSE_SERIALIZER)
+        introspection_cache.set(key, serializer(response))
+
+    def handle_query(self, request: HttpRequest) -> HttpResponse:
         tracer = opentracing.global_tracer()
 
         # Disable extending spans from header due to:
@@ -186,7 +311,10 @@ class GraphQLView(View):
                 if request_ips := request.META.get(additional_ip_header):
                     span.set_tag(f"ip_{additional_ip_header}", request_ips[:100])
 
-            response = self._handle_query(request)
+            # Deferred webhook payloads of events triggered by the request are
+            # scheduled in batches once it's handled.
+            with batch_deferred_payloads():
+                response = self._handle_query(request)
             span.set_tag(opentracing.tags.HTTP_STATUS_CODE, response.status_code)
 
             # RFC2616: Content-Length is defined in bytes,
@@ -223,6 +351,83 @@ class GraphQLView(View):
             operation.result_invalid = execution_result.invalid
         return result, status_code
 
+    def get_batch_responses(
+        self, request: HttpRequest, data: list
+    ) -> List[Tuple[Optional[Dict[str, List[Any]]], int]]:
+        """Execute all operations of a batch request.
+
+        When `GRAPHQL_BATCH_CONCURRENCY` is set, consecutive query operations are
+        executed concurrently on a thread pool. Any other operation (mutations and
+        operations that can't be parsed) is executed in order, after the preceding
+        queries are completed, so it acts as a barrier for the batch.
+        """
+        if settings.GRAPHQL_BATCH_CONCURRENCY <= 1 or len(data) < 2:
+            return [self.get_response(request, entry) for entry in data]
+
+        executor = get_batch_executor()
+        api_call = observability.get_current_api_call()
+        parent_span = opentracing.global_tracer().active_span
+        responses: List[Tuple[Optional[Dict[str, List[Any]]], int]] = []
+        pending: List[Future] = []
+        for entry in data:
+            if self.get_operation_type(request, entry) == "query":
+                pending.append(
+                    executor.submit(
+                        self.get_response_in_thread,
+                        self.copy_request(request),
+                        entry,
+                        api_call,
+                        parent_span,
+                    )
+                )
+                continue
+            responses.extend(future.result() for future in pending)
+            pending = []
+            responses.append(self.get_response(request, entry))
+        responses.extend(future.result() for future in pending)
+        return responses
+
+    @staticmethod
+    def copy_request(request: HttpRequest) -> HttpRequest:
+        """Return a copy of the request used as the context of one operation.
+
+        State cached on the request while executing operations (dataloaders with
+        the plugins managers, the authenticated user and app) isn't thread-safe,
+        so each copy builds its own.
+        """
+        request_copy = copy.copy(request)
+        for attr in OPERATION_CONTEXT_ATTRIBUTES:
+            request_copy.__dict__.pop(attr, None)
+        return request_copy
+
+    def get_response_in_thread(
+        self, request: HttpRequest, data: dict, api_call, parent_span
+    ) -> Tuple[Optional[Dict[str, List[Any]]], int]:
+        # Each worker thread uses its own database connection, drop the ones that
+        # are no longer usable like Django does at the start and end of a request.
+        close_old_connections()
+        try:
+            scope: ContextManager = nullcontext()
+            if parent_span is not None:
+                scope = opentracing.global_tracer().scope_manager.activate(
+                    parent_span, finish_on_close=False
+                )
+            with scope, observability.report_api_call_from_thread(api_call):
+                return self.get_response(request, data)
+        finally:
+            close_old_connections()
+
+    def get_operation_type(self, request: HttpRequest, data: dict) -> Optional[str]:
+        try:
+            query, _, operation_name = self.get_graphql_params(request, data)
+            query = resolve_persisted_query(query, data.get("extensions"))
+        except (AttributeError, ValueError, PersistedQueryError):
+            return None
+        document, error = self.parse_query(query)
+        if error or document is None:
+            return None
+        return document.get_operation_type(operation_name)
+
     def get_root_value(self):
         return self.root_value
 
@@ -246,7 +451,7 @@ class GraphQLView(View):
         # Attempt to parse the query, if it fails, return the error
         try:
             return (
-                self.backend.document_from_string(self.schema, query),
+                document_from_string(self.backend, self.schema, query),
                 None,
             )
         except (ValueError, GraphQLSyntaxError) as e:
@@ -276,6 +481,10 @@ class GraphQLView(View):
             )
 
             query, variables, operation_name = self.get_graphql_params(request, data)
+            try:
+                query = resolve_persisted_query(query, data.get("extensions"))
+            except PersistedQueryError as e:
+                return ExecutionResult(errors=[e], invalid=True)
 
             document, error = self.parse_query(query)
             with observability.report_gql_operation() as operation:
@@ -285,10 +494,37 @@ class GraphQLView(View):
             if error or document is None:
                 return error
 
+            if request.method == "GET":
+                operation_type = document.get_operation_type(operation_name)
+                if operation_type != "query":
+                    return ExecutionResult(
+                        errors=[
+                            GraphQLError(
+                                "Only query operations can be sent with GET requests."
+                            )
+                        ],
+                        invalid=True,
+                    )
+
             raw_query_string = document.document_string
+            fingerprint = query_fingerprint(document)
             span.set_tag("graphql.query", raw_query_string)
             span.set_tag("graphql.query_identifier", query_identifier(document))
-            span.set_tag("graphql.query_fingerprint", query_fingerprint(document))
+            span.set_tag("graphql.query_fingerprint", fingerprint)
+
+            response_cache_key = None
+            response_cache_tags: FrozenSet[str] = frozenset()
+            if is_response_cacheable(request, document, operation_name):
+                response_cache_tags = get_response_cache_tags(schema, document)
+                response_cache_key = get_response_cache_key(
+                    fingerprint, operation_name, variables, response_cache_tags
+                )
+                cached_response = get_cached_response(response_cache_key)
+                span.set_tag("graphql.response_cache_hit", bool(cached_response))
+                if cached_response:
+                    request.response_cache_tags = response_cache_tags
+                    return cached_response
+
             try:
                 query_contains_schema = self.check_if_query_contains_only_schema(
                     document
@@ -320,8 +556,11 @@ class GraphQLView(View):
                 span.set_tag("app.id", app.id)
                 span.set_tag("app.name", app.name)
 
+            sql_stats = get_sql_stats()
             try:
-                with connection.execute_wrapper(tracing_wrapper):
+                with connection.execute_wrapper(tracing_wrapper), record_sql_stats(
+                    sql_stats
+                ):
                     response = None
                     should_use_cache_for_scheme = query_contains_schema & (
                         not settings.DEBUG
@@ -331,6 +570,8 @@ class GraphQLView(View):
                         response = cache.get(key)
 
                     if not response:
+                        if self.collect_resolver_stats:
+                            start_resolver_stats(context)
                         response = document.execute(
                             root=self.get_root_value(),
                             variables=variables,
@@ -342,7 +583,19 @@ class GraphQLView(View):
                         if should_use_cache_for_scheme:
                             cache.set(key, response)
 
-                    return set_query_cost_on_result(response, query_cost)
+                    response = set_query_cost_on_result(response, query_cost)
+                    if response_cache_key and not response.errors:
+                        cache_response(response_cache_key, response)
+                        request.response_cache_tags = response_cache_tags
+                resolver_stats = set_resolver_stats_on_result(response, context)
+                sql_stats_data = set_sql_stats_on_result(response, sql_stats)
+                if sql_stats_data:
+                    span.set_tag("graphql.sql_count", sql_stats_data["count"])
+                    span.set_tag("graphql.sql_duplicates", sql_stats_data["duplicates"])
+                with observability.report_gql_operation() as operation:
+                    operation.resolver_stats = resolver_stats
+                    operation.sql_stats = sql_stats_data
+                return response
             except Exception as e:
                 span.set_tag(opentracing.tags.ERROR, True)
 
@@ -355,6 +608,12 @@ class GraphQLView(View):
 
     @staticmethod
     def parse_body(request: HttpRequest):
+        if request.method == "GET":
+            data = request.GET.dict()
+            for key in ["variables", "extensions"]:
+                if data.get(key):
+                    data[key] = json.loads(data[key])
+            return data
         content_type = request.content_type
         if content_type == "application/graphql":
             return {"query": request.body.decode("utf-8")}
@@ -390,6 +649,48 @@ class GraphQLView(View):
         return format_error(error, cls.HANDLED_EXCEPTIONS)
 
 
+class AsyncGraphQLView(GraphQLView):
+    """GraphQL view for ASGI deployments.
+
+    Django runs synchronous views on a single thread per ASGI worker, so one slow
+    request (e.g. waiting for a sync webhook) blocks all the others. This view
+    keeps the event loop free and executes GraphQL requests on a bounded thread
+    pool instead, so a worker serves up to `GRAPHQL_ASYNC_VIEW_WORKERS`
+    requests at the same time.
+    """
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+
+        async def async_view(request, *args, **kwargs):
+            return await view(request, *args, **kwargs)
+
+        update_wrapper(async_view, view)
+        # `csrf_exempt` can't be used as it would turn the view into a sync one.
+        async_view.csrf_exempt = True  # type: ignore[attr-defined]
+        return async_view
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method not in ["GET", "POST"] or (
+            request.method == "GET" and not self.is_graphql_get_request(request)
+        ):
+            # Playground and not allowed methods don't touch the database.
+            return super().dispatch(request, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_async_view_executor(),
+            partial(self.dispatch_in_thread, request, *args, **kwargs),
+        )
+
+    def dispatch_in_thread(self, request, *args, **kwargs):
+        close_old_connections()
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            close_old_connections()
+
+
 def get_key(key):
     try:
         int_key = int(key)
@@ -443,6 +744,29 @@ def instantiate_middleware(middlewares):
         yield middleware
 
 
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """Return a process-wide thread pool, created on first use."""
+    if name not in _executors:
+        with _executors_lock:
+            if name not in _executors:
+                _executors[name] = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix=f"graphql-{name}"
+                )
+    return _executors[name]
+
+
+def get_batch_executor() -> ThreadPoolExecutor:
+    return get_executor("batch", settings.GRAPHQL_BATCH_CONCURRENCY)
+
+
+def get_async_view_executor() -> ThreadPoolExecutor:
+    return get_executor("async-view", settings.GRAPHQL_ASYNC_VIEW_WORKERS)
+
+
 def generate_cache_key(raw_query: str) -> str:
     hashed_query = hashlib.sha256(str(raw_query).encode("utf-8")).hexdigest()
     return f"{saleor_version}-{hashed_query}"
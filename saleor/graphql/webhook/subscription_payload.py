@@ -4,7 +4,7 @@ from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
-from graphql import get_default_backend, parse
+from graphql import GraphQLDocument, get_default_backend
 from graphql.error import GraphQLError
 from promise import Promise
 
@@ -12,7 +12,13 @@ from ...app.models import App
 from ...core.exceptions import PermissionDenied
 from ...core.utils import get_domain
 from ..core import SaleorContext
+from ..core.document_cache import (
+    CachedGraphQLDocument,
+    document_from_string,
+    subscription_document_cache,
+)
 from ..utils import format_error
+from .subscription_query import query_selects_app
 
 logger = get_task_logger(__name__)
 
@@ -22,10 +28,13 @@ def initialize_request(
     sync_event=False,
     allow_replica=True,
     event_type: Optional[str] = None,
+    share_dataloaders=False,
 ) -> SaleorContext:
     """Prepare a request object for webhook subscription.
 
-    It creates a dummy request object.
+    It creates a dummy request object. With `share_dataloaders`, the dataloaders
+    are kept between payloads generated with the request, which should be shared
+    only by apps with the same permissions.
 
     return: HttpRequest
     """
@@ -42,6 +51,7 @@ def initialize_request(
 
     setattr(request, "sync_event", sync_event)
     setattr(request, "event_type", event_type)
+    setattr(request, "share_dataloaders", share_dataloaders)
     request.requestor = requestor
     request.request_time = request_time
     request.allow_replica = allow_replica
@@ -57,6 +67,36 @@ def get_event_payload(event):
     return event
 
 
+def get_subscription_document(subscription_query: str) -> GraphQLDocument:
+    from ..api import schema
+
+    # Documents are parsed and validated once per query in each process, later
+    # payloads of the webhook only execute them.
+    return document_from_string(
+        get_default_backend(),
+        schema,
+        subscription_query,
+        cache=subscription_document_cache,
+    )
+
+
+def is_payload_shared_by_apps(subscription_query: str) -> bool:
+    """Return whether apps with the same permissions get the same payload of the query.
+
+    It's not the case when the query selects apps, as they are resolved
+    differently for each app receiving the payload.
+    """
+    from ..api import schema
+
+    document = get_subscription_document(subscription_query)
+    selects_app = getattr(document, "selects_app", None)
+    if selects_app is None:
+        selects_app = query_selects_app(schema, document.document_ast)
+        if isinstance(document, CachedGraphQLDocument):
+            document.selects_app = selects_app
+    return not selects_app
+
+
 def generate_payload_from_subscription(
     event_type: str,
     subscribable_object,
@@ -80,21 +120,19 @@ def generate_payload_from_subscription(
     return: A payload ready to send via webhook. None if the function was not able to
     generate a payload
     """
-    from ..api import schema
     from ..context import get_context_value
 
-    graphql_backend = get_default_backend()
-    ast = parse(subscription_query)  # type: ignore
-    document = graphql_backend.document_from_string(
-        schema,
-        ast,
-    )
+    document = get_subscription_document(subscription_query)  # type: ignore[arg-type]
     app_id = app.pk if app else None
     request.app = app
+    dataloaders = getattr(request, "dataloaders", None)
+    context = get_context_value(request)
+    if getattr(request, "share_dataloaders", False) and dataloaders is not None:
+        context.dataloaders = dataloaders
     results = document.execute(
         allow_subscriptions=True,
         root=(event_type, subscribable_object),
-        context=get_context_value(request),
+        context=context,
     )
     if hasattr(results, "errors"):
         logger.warning(
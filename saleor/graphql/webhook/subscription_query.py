@@ -1,5 +1,5 @@
 from enum import Flag
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from django.core.exceptions import ValidationError
 from graphene.utils.str_converters import to_snake_case
@@ -13,8 +13,15 @@ from graphql.language.ast import (
     InlineFragment,
     OperationDefinition,
 )
+from graphql.language.visitor import TypeInfoVisitor, Visitor, visit
+from graphql.type.definition import get_named_type, is_abstract_type
+from graphql.utils.type_info import TypeInfo
 
 from ...webhook.error_codes import WebhookErrorCode
+from ..core.document_cache import cache_validated_document, subscription_document_cache
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
 
 
 class IsFragment(Flag):
@@ -55,6 +62,11 @@ class SubscriptionQuery:
             return [err]
 
         self.is_valid = True
+        # Queries are validated when webhooks are saved, so their payloads can be
+        # generated from the validated document.
+        cache_validated_document(
+            subscription_document_cache, schema, self.query, self.ast
+        )
         return []
 
     def get_events_from_subscription(self) -> List[str]:
@@ -144,3 +156,35 @@ class SubscriptionQuery:
             if isinstance(definition, FragmentDefinition):
                 fragments[definition.name.value] = definition
         return fragments
+
+
+class AppFieldsVisitor(Visitor):
+    """Find fields of the document which resolve apps."""
+
+    def __init__(self, schema: "GraphQLSchema", type_info: TypeInfo):
+        self.schema = schema
+        self.type_info = type_info
+        self.selects_app = False
+
+    def enter_Field(self, node, key, parent, path, ancestors):
+        named_type = get_named_type(self.type_info.get_type())
+        if named_type is None:
+            return
+        if is_abstract_type(named_type):
+            possible_types = self.schema.get_possible_types(named_type)
+        else:
+            possible_types = [named_type]
+        if any(possible_type.name == "App" for possible_type in possible_types):
+            self.selects_app = True
+
+
+def query_selects_app(schema: "GraphQLSchema", document_ast: Document) -> bool:
+    """Return whether the document has fields which resolve apps.
+
+    Such fields, like `recipient` of events, resolve differently for each app
+    receiving the payload.
+    """
+    type_info = TypeInfo(schema)
+    visitor = AppFieldsVisitor(schema, type_info)
+    visit(document_ast, TypeInfoVisitor(type_info, visitor))
+    return visitor.selects_app
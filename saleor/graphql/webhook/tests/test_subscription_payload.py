@@ -0,0 +1,94 @@
+from unittest import mock
+
+import graphene
+import pytest
+
+from ....webhook.event_types import WebhookEventAsyncType
+from ...core.document_cache import subscription_document_cache
+from ..subscription_payload import (
+    generate_payload_from_subscription,
+    initialize_request,
+)
+from ..subscription_query import SubscriptionQuery
+
+ORDER_CREATED_SUBSCRIPTION = """
+    subscription {
+        event {
+            ... on OrderCreated {
+                order {
+                    id
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def clear_subscription_document_cache():
+    subscription_document_cache.clear()
+    yield
+    subscription_document_cache.clear()
+
+
+def test_subscription_query_validation_caches_document(
+    clear_subscription_document_cache,
+):
+    # when
+    subscription_query = SubscriptionQuery(ORDER_CREATED_SUBSCRIPTION)
+
+    # then
+    assert subscription_query.is_valid
+    assert len(subscription_document_cache) == 1
+
+
+def test_subscription_query_validation_does_not_cache_invalid_document(
+    clear_subscription_document_cache,
+):
+    # when
+    subscription_query = SubscriptionQuery("subscription { event { invalid } }")
+
+    # then
+    assert not subscription_query.is_valid
+    assert len(subscription_document_cache) == 0
+
+
+@mock.patch("saleor.graphql.core.document_cache.validate")
+def test_generate_payload_from_subscription_reuses_validated_document(
+    mocked_validate, clear_subscription_document_cache, order
+):
+    # given
+    mocked_validate.return_value = []
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    generate_payload_from_subscription(
+        event_type, order, ORDER_CREATED_SUBSCRIPTION, initialize_request()
+    )
+
+    # when
+    payload = generate_payload_from_subscription(
+        event_type, order, ORDER_CREATED_SUBSCRIPTION, initialize_request()
+    )
+
+    # then
+    assert payload["order"]["id"] == graphene.Node.to_global_id("Order", order.pk)
+    mocked_validate.assert_called_once()
+    assert subscription_document_cache.hits == 1
+
+
+def test_generate_payload_from_subscription_cache_disabled(
+    clear_subscription_document_cache, settings, order
+):
+    # given
+    settings.WEBHOOK_SUBSCRIPTION_DOCUMENT_CACHE_SIZE = 0
+
+    # when
+    payload = generate_payload_from_subscription(
+        WebhookEventAsyncType.ORDER_CREATED,
+        order,
+        ORDER_CREATED_SUBSCRIPTION,
+        initialize_request(),
+    )
+
+    # then
+    assert payload["order"]["id"] == graphene.Node.to_global_id("Order", order.pk)
+    assert len(subscription_document_cache) == 0
@@ -218,6 +218,12 @@ class AdyenGatewayPlugin(BasePlugin):
         )
         self.adyen = initialize_adyen_client(self.config)
 
+    def clone(self, requestor_getter=None, allow_replica=True):
+        plugin = super().clone(requestor_getter, allow_replica)
+        # The client and its HTTP session aren't shared with other requests.
+        plugin.adyen = initialize_adyen_client(plugin.config)
+        return plugin
+
     def _insert_webhook_endpoint_to_configuration(self, raw_configuration, channel):
         updated = False
         for config in raw_configuration:
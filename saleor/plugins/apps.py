@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, List
 from django.apps import AppConfig
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_delete, post_save
 from django.utils.module_loading import import_string
 
 if TYPE_CHECKING:
@@ -19,6 +20,20 @@ class PluginConfig(AppConfig):
         for plugin_path in plugins:
             self.load_and_check_plugin(plugin_path)
 
+        from ..channel.models import Channel
+        from .models import PluginConfiguration
+        from .signals import invalidate_plugins_manager_prototypes_on_change
+
+        # Plugins are loaded per channel with their configuration, so managers
+        # loaded by other processes have to be reloaded after these changes.
+        for model in [Channel, PluginConfiguration]:
+            for signal in [post_save, post_delete]:
+                signal.connect(
+                    invalidate_plugins_manager_prototypes_on_change,
+                    sender=model,
+                    dispatch_uid=f"invalidate_plugins_manager_{model.__name__}",
+                )
+
     def load_and_check_plugin(self, plugin_path: str):
         try:
             plugin = import_string(plugin_path)
@@ -1,4 +1,4 @@
-from copy import copy
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import (
@@ -6,6 +6,7 @@ from typing import (
     Any,
     Callable,
     DefaultDict,
+    Dict,
     Iterable,
     List,
     Optional,
@@ -161,6 +162,31 @@ class BasePlugin:
     def __str__(self):
         return self.PLUGIN_NAME
 
+    def clone(
+        self,
+        requestor_getter: Optional[Callable[[], "Requestor"]] = None,
+        allow_replica: bool = True,
+    ) -> "BasePlugin":
+        """Return a copy of the plugin bound to the given requestor.
+
+        The configuration, the channel and the database configuration are copied,
+        as they are modified in place while handling requests, e.g. when the
+        configuration is resolved or saved. Plugins keeping clients with a state
+        have to create them again for the copy.
+        """
+        plugin = copy(self)
+        # Copied with a single memo, so the channel of the database configuration
+        # stays the plugin's channel.
+        memo: Dict[int, Any] = {}
+        for name in ["configuration", "channel", "db_config", "config"]:
+            if name in self.__dict__:
+                setattr(plugin, name, deepcopy(self.__dict__[name], memo))
+        plugin.requestor = (
+            SimpleLazyObject(requestor_getter) if requestor_getter else requestor_getter
+        )
+        plugin.allow_replica = allow_replica
+        return plugin
+
     # Trigger when account is confirmed by user.
     #
     # Overwrite this method if you need to trigger specific logic after an account
@@ -29,7 +29,13 @@ from ..core.models import EventDelivery
 from ..core.payments import PaymentInterface
 from ..core.prices import quantize_price
 from ..core.taxes import TaxData, TaxType, zero_money, zero_taxed_money
+from ..core.utils.cache_version import get_cache_version, invalidate_cache_version
+from ..core.utils.lru import LRUCache
 from ..graphql.core import ResolveInfo, SaleorContext
+from ..graphql.core.response_cache import (
+    EVENT_TAGS,
+    invalidate_response_cache_for_event,
+)
 from ..order import base_calculations as base_order_calculations
 from ..order.interface import OrderTaxedPricesData
 from ..payment.interface import (
@@ -94,12 +100,70 @@ if TYPE_CHECKING:
 NotifyEventTypeChoice = str
 
 
+PLUGINS_CONFIGURATION_VERSION_KEY = "plugins-configuration-version"
+
+# Maximum number of plugin lists with a prototype kept by each process.
+MAX_PLUGINS_MANAGER_PROTOTYPES = 8
+
+
+class ClonedPluginsPerChannel(dict):
+    """Plugins of channels, cloned from the manager prototype on first access."""
+
+    def __init__(self, manager: "PluginsManager"):
+        super().__init__()
+        self._manager = manager
+
+    def __missing__(self, channel_slug: str) -> List["BasePlugin"]:
+        prototype = self._manager._prototype
+        assert prototype is not None
+        plugins = [
+            self._manager._clone_plugin(plugin)
+            for plugin in prototype.plugins_per_channel.get(channel_slug, [])
+        ]
+        return self.setdefault(channel_slug, plugins)
+
+    def _clone_all(self):
+        prototype = self._manager._prototype
+        assert prototype is not None
+        for channel_slug in list(prototype.plugins_per_channel):
+            self[channel_slug]
+
+    def keys(self):
+        self._clone_all()
+        return super().keys()
+
+    def values(self):
+        self._clone_all()
+        return super().values()
+
+    def items(self):
+        self._clone_all()
+        return super().items()
+
+    def __iter__(self):
+        self._clone_all()
+        return super().__iter__()
+
+    def __len__(self):
+        self._clone_all()
+        return super().__len__()
+
+    def __contains__(self, channel_slug):
+        self._clone_all()
+        return super().__contains__(channel_slug)
+
+
 class PluginsManager(PaymentInterface):
     """Base manager for handling plugins logic."""
 
     plugins_per_channel: Dict[str, List["BasePlugin"]] = {}
     global_plugins: List["BasePlugin"] = []
-    all_plugins: List["BasePlugin"] = []
+    _all_plugins: Optional[List["BasePlugin"]] = None
+    _prototype: Optional["PluginsManager"] = None
+    _plugin_clones: Dict[int, "BasePlugin"]
+    _requestor_getter: Optional[Callable[[], "Requestor"]]
+    _allow_replica: bool
+    _plugins_by_method: Dict[Tuple[str, Optional[str]], List["BasePlugin"]]
 
     def _load_plugin(
         self,
@@ -128,13 +192,24 @@ class PluginsManager(PaymentInterface):
             allow_replica=allow_replica,
         )
 
-    def __init__(self, plugins: List[str], requestor_getter=None, allow_replica=True):
+    def __init__(
+        self,
+        plugins: List[str],
+        requestor_getter=None,
+        allow_replica=True,
+        prototype=False,
+    ):
         with opentracing.global_tracer().start_active_span("PluginsManager.__init__"):
             self.all_plugins = []
             self.global_plugins = []
             self.plugins_per_channel = defaultdict(list)
+            self._plugins_by_method = {}
 
-            global_db_configs, channel_db_configs = self._get_db_plugin_configs()
+            # Prototypes don't read from the replica, as stale configuration would
+            # be kept until the next change.
+            global_db_configs, channel_db_configs = self._get_db_plugin_configs(
+                allow_replica=not prototype
+            )
             channels = Channel.objects.all()
 
             for plugin_path in plugins:
@@ -165,11 +240,59 @@ class PluginsManager(PaymentInterface):
             for channel in channels:
                 self.plugins_per_channel[channel.slug].extend(self.global_plugins)
 
-    def _get_db_plugin_configs(self):
+    @property
+    def all_plugins(self) -> List["BasePlugin"]:
+        if self._all_plugins is None:
+            prototype = self._prototype
+            plugins = prototype.all_plugins if prototype else []
+            self._all_plugins = [self._clone_plugin(plugin) for plugin in plugins]
+        return self._all_plugins
+
+    @all_plugins.setter
+    def all_plugins(self, value: List["BasePlugin"]):
+        self._all_plugins = value
+
+    def clone(
+        self,
+        requestor_getter: Optional[Callable[[], "Requestor"]] = None,
+        allow_replica=True,
+    ) -> "PluginsManager":
+        """Return a manager with the plugins of this one, bound to the requestor.
+
+        Plugins are cloned on first use, so a request touching a single channel
+        doesn't pay for copying the plugins of all channels. Nothing is loaded from
+        the database and the manager is left unchanged.
+        """
+        manager = self.__class__.__new__(self.__class__)
+        manager._prototype = self
+        manager._requestor_getter = requestor_getter
+        manager._allow_replica = allow_replica
+        manager._plugin_clones = {}
+        manager._plugins_by_method = {}
+        manager.global_plugins = [
+            manager._clone_plugin(plugin) for plugin in self.global_plugins
+        ]
+        manager.plugins_per_channel = ClonedPluginsPerChannel(manager)
+        return manager
+
+    def _clone_plugin(self, plugin: "BasePlugin") -> "BasePlugin":
+        # A plugin is cloned once, so global plugins are the same objects in all
+        # lists of the manager.
+        if clone := self._plugin_clones.get(id(plugin)):
+            return clone
+        clone = plugin.clone(self._requestor_getter, self._allow_replica)
+        return self._plugin_clones.setdefault(id(plugin), clone)
+
+    def _get_db_plugin_configs(self, allow_replica=True):
         with opentracing.global_tracer().start_active_span("_get_db_plugin_configs"):
+            database_connection_name = (
+                settings.DATABASE_CONNECTION_REPLICA_NAME
+                if allow_replica
+                else settings.DATABASE_CONNECTION_DEFAULT_NAME
+            )
             qs = (
                 PluginConfiguration.objects.all()
-                .using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+                .using(database_connection_name)
                 .prefetch_related("channel")
             )
             channel_configs: DefaultDict[Channel, Dict] = defaultdict(dict)
@@ -193,14 +316,39 @@ class PluginsManager(PaymentInterface):
         **kwargs,
     ):
         """Try to run a method with the given name on each declared active plugin."""
+        if method_name in EVENT_TAGS:
+            invalidate_response_cache_for_event(method_name)
         value = default_value
-        plugins = self.get_plugins(channel_slug=channel_slug, active_only=True)
+        plugins = self._get_plugins_implementing(method_name, channel_slug)
         for plugin in plugins:
-            value = self.__run_method_on_single_plugin(
-                plugin, method_name, value, *args, **kwargs
-            )
+            if plugin.active:
+                value = self.__run_method_on_single_plugin(
+                    plugin, method_name, value, *args, **kwargs
+                )
         return value
 
+    def _get_plugins_implementing(
+        self, method_name: str, channel_slug: Optional[str] = None
+    ) -> List["BasePlugin"]:
+        """Return plugins of the channel that implement the method.
+
+        The list is built on the first call for the method and channel and reused by
+        later calls, so hooks called for every line of a checkout or an order don't
+        look up the method on all plugins each time. Plugins are returned whether
+        they are active or not, as activity can change during the request.
+        """
+        key = (method_name, channel_slug)
+        try:
+            return self._plugins_by_method[key]
+        except KeyError:
+            pass
+        plugins = [
+            plugin
+            for plugin in self.get_plugins(channel_slug=channel_slug)
+            if getattr(plugin, method_name, NotImplemented) != NotImplemented
+        ]
+        return self._plugins_by_method.setdefault(key, plugins)
+
     def __run_method_on_single_plugin(
         self,
         plugin: Optional["BasePlugin"],
@@ -2070,9 +2218,47 @@ class PluginsManager(PaymentInterface):
         return any([plugin.is_event_active(event) for plugin in only_active_plugins])
 
 
+# Per-process prototypes of managers, tagged with the configuration version they
+# were loaded at.
+plugins_manager_prototypes: LRUCache[Tuple[int, PluginsManager]] = LRUCache(
+    MAX_PLUGINS_MANAGER_PROTOTYPES
+)
+
+
+def get_plugins_configuration_version() -> Optional[int]:
+    return get_cache_version(PLUGINS_CONFIGURATION_VERSION_KEY)
+
+
+def invalidate_plugins_manager_prototypes():
+    """Reload the plugins in all processes after changes of plugins or channels."""
+    invalidate_cache_version(PLUGINS_CONFIGURATION_VERSION_KEY)
+
+
+def get_plugins_manager_prototype(plugins: List[str]) -> Optional[PluginsManager]:
+    """Return the manager with plugins loaded at the current configuration version.
+
+    The prototype is shared by all requests of the process and must not be
+    modified; use `PluginsManager.clone` to get a manager bound to a requestor.
+    """
+    version = get_plugins_configuration_version()
+    if version is None:
+        return None
+    key = tuple(plugins)
+    if cached := plugins_manager_prototypes.get(key):
+        prototype_version, prototype = cached
+        if prototype_version == version:
+            return prototype
+    prototype = PluginsManager(plugins, allow_replica=False, prototype=True)
+    plugins_manager_prototypes.set(key, (version, prototype))
+    return prototype
+
+
 def get_plugins_manager(
     requestor_getter: Optional[Callable[[], "Requestor"]] = None,
     allow_replica=True,
 ) -> PluginsManager:
     with opentracing.global_tracer().start_active_span("get_plugins_manager"):
+        if settings.PLUGINS_MANAGER_PROTOTYPE_ENABLED:
+            if prototype := get_plugins_manager_prototype(settings.PLUGINS):
+                return prototype.clone(requestor_getter, allow_replica)
         return PluginsManager(settings.PLUGINS, requestor_getter, allow_replica)
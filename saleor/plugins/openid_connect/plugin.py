@@ -200,6 +200,13 @@ class OpenIDConnectPlugin(BasePlugin):
         )
         self.oauth = self._get_oauth_session()
 
+    def clone(self, requestor_getter=None, allow_replica=True):
+        plugin = super().clone(requestor_getter, allow_replica)
+        # The session stores the tokens it fetches, so it isn't shared with other
+        # requests.
+        plugin.oauth = plugin._get_oauth_session()
+        return plugin
+
     @classmethod
     def validate_plugin_configuration(
         cls, plugin_configuration: "PluginConfiguration", **kwargs
@@ -0,0 +1,5 @@
+from .manager import invalidate_plugins_manager_prototypes
+
+
+def invalidate_plugins_manager_prototypes_on_change(sender, instance, **kwargs):
+    invalidate_plugins_manager_prototypes()
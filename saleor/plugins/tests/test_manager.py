@@ -991,7 +991,7 @@ def test_run_method_on_plugins_only_on_active_ones(
     mocked_method, channel_USD, all_plugins_manager
 ):
     all_plugins_manager._PluginsManager__run_method_on_plugins(
-        method_name="test_method_name",
+        method_name="get_supported_currencies",
         default_value="default_value",
     )
     active_plugins_count = len(ACTIVE_PLUGINS)
@@ -1001,14 +1001,53 @@ def test_run_method_on_plugins_only_on_active_ones(
         len([p for p in all_plugins_manager.all_plugins if p.active])
         == active_plugins_count
     )
-    assert mocked_method.call_count == active_plugins_count
 
     called_plugins_id = [arg.args[0].PLUGIN_ID for arg in mocked_method.call_args_list]
-    expected_active_plugins_id = [p.PLUGIN_ID for p in ACTIVE_PLUGINS]
+    expected_active_plugins_id = [
+        p.PLUGIN_ID for p in ACTIVE_PLUGINS if hasattr(p, "get_supported_currencies")
+    ]
 
     assert called_plugins_id == expected_active_plugins_id
 
 
+@mock.patch(
+    "saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_single_plugin"
+)
+def test_run_method_on_plugins_not_implemented_by_any_plugin(
+    mocked_method, channel_USD, all_plugins_manager
+):
+    # when
+    value = all_plugins_manager._PluginsManager__run_method_on_plugins(
+        method_name="test_method_name",
+        default_value="default_value",
+    )
+
+    # then
+    assert value == "default_value"
+    mocked_method.assert_not_called()
+
+
+def test_run_method_on_plugins_with_plugin_deactivated_after_call(
+    channel_USD, all_plugins_manager
+):
+    # given
+    all_plugins_manager._PluginsManager__run_method_on_plugins(
+        method_name="get_supported_currencies",
+        default_value="default_value",
+    )
+    for plugin in all_plugins_manager.all_plugins:
+        plugin.active = False
+
+    # when
+    value = all_plugins_manager._PluginsManager__run_method_on_plugins(
+        method_name="get_supported_currencies",
+        default_value="default_value",
+    )
+
+    # then
+    assert value == "default_value"
+
+
 @mock.patch(
     "saleor.plugins.manager.PluginsManager._PluginsManager__run_method_on_single_plugin"
 )
@@ -1033,7 +1072,7 @@ def test_run_method_on_plugins_only_for_given_channel(
 
     # when
     plugins_manager._PluginsManager__run_method_on_plugins(
-        method_name="test_method",
+        method_name="process_payment",
         default_value=default_value,
         channel_slug=channel_USD.slug,
     )
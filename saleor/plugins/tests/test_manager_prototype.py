@@ -0,0 +1,157 @@
+import pytest
+from django.core.cache import cache
+
+from ...channel.models import Channel
+from ..manager import get_plugins_manager, plugins_manager_prototypes
+from ..models import PluginConfiguration
+from ..openid_connect.plugin import OpenIDConnectPlugin
+from .sample_plugins import ChannelPluginSample, PluginSample
+
+
+@pytest.fixture
+def plugins_manager_prototype_enabled(settings):
+    settings.PLUGINS_MANAGER_PROTOTYPE_ENABLED = True
+    settings.PLUGINS = [
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+        "saleor.plugins.tests.sample_plugins.ChannelPluginSample",
+    ]
+    plugins_manager_prototypes.clear()
+    cache.clear()
+    yield settings
+    plugins_manager_prototypes.clear()
+    cache.clear()
+
+
+def test_plugins_manager_cloned_from_prototype(
+    plugins_manager_prototype_enabled, channel_USD, django_assert_num_queries
+):
+    # given
+    first_manager = get_plugins_manager()
+
+    # when
+    with django_assert_num_queries(0):
+        manager = get_plugins_manager()
+        plugins = manager.get_plugins(channel_USD.slug)
+
+    # then
+    assert [type(plugin) for plugin in plugins] == [ChannelPluginSample, PluginSample]
+    assert plugins[0].channel == channel_USD
+    assert plugins[1] in manager.global_plugins
+    first_plugins = first_manager.get_plugins(channel_USD.slug)
+    assert not set(map(id, plugins)) & set(map(id, first_plugins))
+
+
+def test_plugins_manager_clone_binds_requestor(
+    plugins_manager_prototype_enabled, channel_USD, staff_user
+):
+    # given
+    get_plugins_manager()
+
+    # when
+    manager = get_plugins_manager(lambda: staff_user, allow_replica=False)
+
+    # then
+    for plugin in manager.all_plugins:
+        assert plugin.requestor == staff_user
+        assert plugin.allow_replica is False
+
+
+def test_plugins_manager_clone_changes_dont_affect_other_managers(
+    plugins_manager_prototype_enabled, channel_USD
+):
+    # given
+    manager = get_plugins_manager()
+    plugin = manager.get_plugin(PluginSample.PLUGIN_ID)
+
+    # when
+    plugin.active = False
+    plugin.configuration[0]["value"] = "changed"
+
+    # then
+    plugin = get_plugins_manager().get_plugin(PluginSample.PLUGIN_ID)
+    assert plugin.active is True
+    assert plugin.configuration[0]["value"] == "admin"
+
+
+def test_plugins_manager_reloaded_after_configuration_change(
+    plugins_manager_prototype_enabled, channel_USD
+):
+    # given
+    get_plugins_manager()
+
+    # when
+    PluginConfiguration.objects.create(
+        identifier=PluginSample.PLUGIN_ID,
+        name=PluginSample.PLUGIN_NAME,
+        active=False,
+        configuration=[],
+    )
+
+    # then
+    plugin = get_plugins_manager().get_plugin(PluginSample.PLUGIN_ID)
+    assert plugin.active is False
+
+
+def test_plugins_manager_reloaded_after_channel_created(
+    plugins_manager_prototype_enabled, channel_USD
+):
+    # given
+    get_plugins_manager()
+
+    # when
+    channel = Channel.objects.create(
+        name="New channel",
+        slug="new-channel",
+        currency_code="USD",
+        default_country="US",
+    )
+
+    # then
+    plugins = get_plugins_manager().get_plugins(channel.slug)
+    assert [type(plugin) for plugin in plugins] == [ChannelPluginSample, PluginSample]
+
+
+def test_plugins_manager_clone_copies_channel_and_db_config(
+    plugins_manager_prototype_enabled, channel_USD
+):
+    # given
+    PluginConfiguration.objects.create(
+        identifier=ChannelPluginSample.PLUGIN_ID,
+        name=ChannelPluginSample.PLUGIN_NAME,
+        channel=channel_USD,
+        active=True,
+        configuration=[{"name": "input-per-channel", "value": "value"}],
+    )
+    first_plugin = get_plugins_manager().get_plugin(
+        ChannelPluginSample.PLUGIN_ID, channel_USD.slug
+    )
+
+    # when
+    plugin = get_plugins_manager().get_plugin(
+        ChannelPluginSample.PLUGIN_ID, channel_USD.slug
+    )
+
+    # then
+    assert plugin.channel == first_plugin.channel == channel_USD
+    assert plugin.channel is not first_plugin.channel
+    assert plugin.db_config is not first_plugin.db_config
+    assert plugin.db_config.configuration is not first_plugin.db_config.configuration
+    assert plugin.db_config.channel is plugin.channel
+
+
+def test_plugins_manager_clone_creates_openid_connect_session(
+    plugins_manager_prototype_enabled, channel_USD
+):
+    # given
+    plugins_manager_prototype_enabled.PLUGINS = [
+        "saleor.plugins.openid_connect.plugin.OpenIDConnectPlugin"
+    ]
+    first_plugin = get_plugins_manager().get_plugin(OpenIDConnectPlugin.PLUGIN_ID)
+
+    # when
+    plugin = get_plugins_manager().get_plugin(OpenIDConnectPlugin.PLUGIN_ID)
+
+    # then
+    assert plugin.oauth is not first_plugin.oauth
+    assert plugin.config == first_plugin.config
+    assert plugin.config is not first_plugin.config
@@ -84,7 +84,7 @@ from ...webhook.payloads import (
     generate_translation_payload,
 )
 from ...webhook.transport.asynchronous.transport import (
-    send_webhook_request_async,
+    send_webhook_requests,
     trigger_webhooks_async,
 )
 from ...webhook.transport.list_stored_payment_methods import (
@@ -2154,7 +2154,7 @@ class WebhookPlugin(BasePlugin):
         if not self.active:
             return previous_value
         delivery_update(delivery, status=EventDeliveryStatus.PENDING)
-        send_webhook_request_async.delay(delivery.pk)
+        send_webhook_requests([delivery])
 
     def stored_payment_method_request_delete(
         self,
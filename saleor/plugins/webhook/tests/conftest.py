@@ -12,6 +12,15 @@ from ....plugins.webhook.plugin import WebhookPlugin
 from ....shipping.interface import ShippingMethodData
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.models import Webhook, WebhookEvent
+from ....webhook.transport.utils import clear_webhook_clients
+
+
+@pytest.fixture(autouse=True)
+def clear_cached_webhook_clients():
+    # Clients are mocked by tests, so they can't be reused by other tests.
+    clear_webhook_clients()
+    yield
+    clear_webhook_clients()
 
 
 @pytest.fixture
@@ -6,14 +6,17 @@ import pytest
 from django.core.files import File
 from freezegun import freeze_time
 
+from .....app.models import App
 from .....channel.models import Channel
 from .....giftcard.models import GiftCard
+from .....graphql.webhook.subscription_payload import initialize_request
 from .....graphql.webhook.subscription_query import SubscriptionQuery
 from .....menu.models import Menu, MenuItem
 from .....product.models import Category
 from .....shipping.models import ShippingMethod, ShippingZone
 from .....site.models import SiteSettings
 from .....webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
+from .....webhook.models import Webhook
 from .....webhook.transport.asynchronous.transport import (
     create_deliveries_for_subscriptions,
     logger,
@@ -2993,3 +2996,113 @@ def test_thumbnail_created_user(thumbnail_user, subscription_thumbnail_created_w
     assert deliveries[0].payload.payload == expected_payload
     assert len(deliveries) == len(webhooks)
     assert deliveries[0].webhook == webhooks[0]
+
+
+ORDER_UPDATED_WITH_RECIPIENT = """
+    subscription{
+      event{
+        recipient{
+          name
+        }
+        ...on OrderUpdated{
+          order{
+            id
+          }
+        }
+      }
+    }
+"""
+
+
+@pytest.fixture
+def order_updated_webhook_factory(webhook_app):
+    def create_webhook(query=subscription_queries.ORDER_UPDATED, permissions=None):
+        app = App.objects.create(name="Order app", is_active=True)
+        app.permissions.set(
+            webhook_app.permissions.all() if permissions is None else permissions
+        )
+        webhook = Webhook.objects.create(
+            name="Order updated",
+            app=app,
+            target_url="http://www.example.com/any",
+            subscription_query=query,
+        )
+        webhook.events.create(event_type=WebhookEventAsyncType.ORDER_UPDATED)
+        return webhook
+
+    return create_webhook
+
+
+def test_order_updated_payload_shared_by_apps_with_same_permissions(
+    order, order_updated_webhook_factory
+):
+    # given
+    webhooks = [order_updated_webhook_factory() for _ in range(3)]
+    event_type = WebhookEventAsyncType.ORDER_UPDATED
+
+    # when
+    deliveries = create_deliveries_for_subscriptions(event_type, order, webhooks)
+
+    # then
+    assert [delivery.webhook for delivery in deliveries] == webhooks
+    assert len({delivery.payload_id for delivery in deliveries}) == 1
+    order_id = graphene.Node.to_global_id("Order", order.id)
+    assert deliveries[0].payload.payload == json.dumps({"order": {"id": order_id}})
+
+
+def test_order_updated_payload_not_shared_by_apps_with_different_permissions(
+    order, order_updated_webhook_factory, permission_manage_orders
+):
+    # given
+    webhooks = [
+        order_updated_webhook_factory(),
+        order_updated_webhook_factory(permissions=[permission_manage_orders]),
+    ]
+    event_type = WebhookEventAsyncType.ORDER_UPDATED
+
+    # when
+    deliveries = create_deliveries_for_subscriptions(event_type, order, webhooks)
+
+    # then
+    assert len({delivery.payload_id for delivery in deliveries}) == 2
+
+
+def test_order_updated_payload_with_recipient_not_shared_by_apps(
+    order, order_updated_webhook_factory
+):
+    # given
+    webhooks = [
+        order_updated_webhook_factory(query=ORDER_UPDATED_WITH_RECIPIENT)
+        for _ in range(2)
+    ]
+    event_type = WebhookEventAsyncType.ORDER_UPDATED
+
+    # when
+    deliveries = create_deliveries_for_subscriptions(event_type, order, webhooks)
+
+    # then
+    assert len({delivery.payload_id for delivery in deliveries}) == 2
+    for delivery in deliveries:
+        payload = json.loads(delivery.payload.payload)
+        assert payload["recipient"]["name"] == delivery.webhook.app.name
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.initialize_request",
+    wraps=initialize_request,
+)
+def test_order_updated_context_shared_by_apps_with_same_permissions(
+    mocked_initialize_request, order, order_updated_webhook_factory
+):
+    # given
+    webhooks = [
+        order_updated_webhook_factory(query=ORDER_UPDATED_WITH_RECIPIENT)
+        for _ in range(2)
+    ]
+    event_type = WebhookEventAsyncType.ORDER_UPDATED
+
+    # when
+    create_deliveries_for_subscriptions(event_type, order, webhooks)
+
+    # then
+    mocked_initialize_request.assert_called_once()
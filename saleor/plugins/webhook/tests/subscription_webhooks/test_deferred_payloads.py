@@ -0,0 +1,180 @@
+import json
+from unittest import mock
+
+import graphene
+import pytest
+
+from .....core.models import EventDelivery
+from .....order.models import Order
+from .....tests.utils import flush_post_commit_hooks
+from .....webhook.event_types import WebhookEventAsyncType
+from .....webhook.transport.asynchronous.transport import (
+    batch_deferred_payloads,
+    generate_deferred_payloads_task,
+    is_payload_deferred,
+    trigger_webhooks_async,
+)
+
+
+@pytest.fixture
+def deferred_order_updated(settings):
+    settings.WEBHOOK_DEFERRED_PAYLOAD_EVENTS = [WebhookEventAsyncType.ORDER_UPDATED]
+    return WebhookEventAsyncType.ORDER_UPDATED
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "generate_deferred_payloads_task.delay"
+)
+def test_trigger_webhooks_async_defers_subscription_payloads(
+    mocked_generate_task,
+    deferred_order_updated,
+    order_list,
+    subscription_order_updated_webhook,
+    staff_user,
+):
+    # given
+    event_type = deferred_order_updated
+    webhooks = [subscription_order_updated_webhook]
+
+    # when
+    with batch_deferred_payloads():
+        for order in order_list:
+            trigger_webhooks_async(None, event_type, webhooks, order, staff_user)
+        flush_post_commit_hooks()
+
+    # then
+    assert not EventDelivery.objects.exists()
+    mocked_generate_task.assert_called_once_with(
+        event_type,
+        [
+            {
+                "model": "order.Order",
+                "pk": str(order.pk),
+                "webhooks": [subscription_order_updated_webhook.pk],
+                "requestor": ("user", staff_user.pk),
+            }
+            for order in order_list
+        ],
+    )
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "generate_deferred_payloads_task.delay"
+)
+def test_trigger_webhooks_async_defers_payloads_in_batches(
+    mocked_generate_task,
+    deferred_order_updated,
+    order_list,
+    subscription_order_updated_webhook,
+    settings,
+):
+    # given
+    settings.WEBHOOK_DEFERRED_PAYLOADS_BATCH_SIZE = 2
+    webhooks = [subscription_order_updated_webhook]
+
+    # when
+    with batch_deferred_payloads():
+        for order in order_list:
+            trigger_webhooks_async(None, deferred_order_updated, webhooks, order)
+        flush_post_commit_hooks()
+
+    # then
+    batches = [call.args[1] for call in mocked_generate_task.call_args_list]
+    assert [len(batch) for batch in batches] == [2, len(order_list) - 2]
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport."
+    "generate_deferred_payloads_task.delay"
+)
+def test_trigger_webhooks_async_deferred_payloads_wait_for_commit(
+    mocked_generate_task,
+    deferred_order_updated,
+    order,
+    subscription_order_updated_webhook,
+):
+    # when
+    trigger_webhooks_async(
+        None, deferred_order_updated, [subscription_order_updated_webhook], order
+    )
+
+    # then
+    mocked_generate_task.assert_not_called()
+    flush_post_commit_hooks()
+    mocked_generate_task.assert_called_once()
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
+)
+def test_generate_deferred_payloads_task(
+    mocked_send_webhook_request,
+    order_list,
+    subscription_order_updated_webhook,
+    staff_user,
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_UPDATED
+    references = [
+        {
+            "model": "order.Order",
+            "pk": str(order.pk),
+            "webhooks": [subscription_order_updated_webhook.pk],
+            "requestor": ["user", staff_user.pk],
+        }
+        for order in order_list
+    ]
+
+    # when
+    generate_deferred_payloads_task(event_type, references)
+
+    # then
+    deliveries = EventDelivery.objects.order_by("pk")
+    assert [
+        json.loads(delivery.payload.payload)["order"]["id"] for delivery in deliveries
+    ] == [graphene.Node.to_global_id("Order", order.pk) for order in order_list]
+    mocked_send_webhook_request.assert_called_once_with(
+        [delivery.id for delivery in deliveries]
+    )
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
+)
+def test_generate_deferred_payloads_task_skips_deleted_objects(
+    mocked_send_webhook_request, order, subscription_order_updated_webhook
+):
+    # given
+    reference = {
+        "model": "order.Order",
+        "pk": str(order.pk),
+        "webhooks": [subscription_order_updated_webhook.pk],
+        "requestor": None,
+    }
+    order.delete()
+
+    # when
+    generate_deferred_payloads_task(WebhookEventAsyncType.ORDER_UPDATED, [reference])
+
+    # then
+    assert not EventDelivery.objects.exists()
+    mocked_send_webhook_request.assert_not_called()
+
+
+def test_is_payload_deferred(deferred_order_updated, order, settings):
+    # given
+    settings.WEBHOOK_DEFERRED_PAYLOAD_EVENTS += [
+        WebhookEventAsyncType.DRAFT_ORDER_DELETED,
+        WebhookEventAsyncType.ORDER_CREATED,
+        WebhookEventAsyncType.ORDER_FULLY_PAID,
+    ]
+
+    # then
+    assert is_payload_deferred(deferred_order_updated, order)
+    assert not is_payload_deferred(deferred_order_updated, Order())
+    assert not is_payload_deferred(deferred_order_updated, {"order": order})
+    assert not is_payload_deferred(WebhookEventAsyncType.DRAFT_ORDER_DELETED, order)
+    assert not is_payload_deferred(WebhookEventAsyncType.ORDER_CREATED, order)
+    assert not is_payload_deferred(WebhookEventAsyncType.ORDER_FULLY_PAID, order)
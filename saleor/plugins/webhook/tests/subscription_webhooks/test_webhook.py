@@ -26,7 +26,7 @@ class FakeDelivery:
 
 
 @mock.patch(
-    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.delay"
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
 )
 def test_trigger_webhooks_async(
     mocked_send_webhook_request,
@@ -43,12 +43,13 @@ def test_trigger_webhooks_async(
     assert deliveries.count() == 2
     assert deliveries[0].webhook == subscription_order_created_webhook
     assert deliveries[1].webhook == webhook
-    calls = [mock.call(deliveries[1].id), mock.call(deliveries[0].id)]
-    assert mocked_send_webhook_request.mock_calls == calls
+    mocked_send_webhook_request.assert_called_once_with(
+        [deliveries[1].id, deliveries[0].id]
+    )
 
 
 @mock.patch(
-    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.delay"
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
 )
 @mock.patch(
     "saleor.webhook.transport.asynchronous.transport.create_deliveries_for_subscriptions"
@@ -125,7 +126,7 @@ def test_trigger_webhook_sync_with_subscription_within_mutation_use_default_db(
 
 
 @mock.patch(
-    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async"
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async"
 )
 @mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
 @mock.patch(
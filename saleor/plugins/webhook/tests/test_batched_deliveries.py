@@ -0,0 +1,261 @@
+import threading
+from unittest import mock
+
+import pytest
+from celery.exceptions import MaxRetriesExceededError
+from celery.exceptions import Retry as CeleryTaskRetryError
+
+from ....core import EventDeliveryStatus
+from ....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
+from ....webhook.event_types import WebhookEventAsyncType
+from ....webhook.models import Webhook
+from ....webhook.transport.asynchronous.transport import (
+    get_delivery_executor,
+    send_webhook_requests,
+    send_webhook_requests_async,
+)
+
+FAILING_TARGET_URL = "https://failing.example.com/api/"
+
+
+@pytest.fixture
+def event_deliveries(event_delivery, webhook):
+    failing_webhook = Webhook.objects.create(
+        name="Failing webhook", app=webhook.app, target_url=FAILING_TARGET_URL
+    )
+    failing_delivery = EventDelivery.objects.create(
+        event_type=WebhookEventAsyncType.ANY,
+        payload=EventPayload.objects.create(payload="{}"),
+        webhook=failing_webhook,
+    )
+    return [event_delivery, failing_delivery]
+
+
+@pytest.fixture
+def mocked_send_response(webhook_response, webhook_response_failed):
+    def send_response(target_url, *args):
+        if target_url == FAILING_TARGET_URL:
+            return webhook_response_failed
+        return webhook_response
+
+    with mock.patch(
+        "saleor.webhook.transport.asynchronous.transport."
+        "send_webhook_using_scheme_method",
+        side_effect=send_response,
+    ) as mocked:
+        yield mocked
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.delay"
+)
+def test_send_webhook_requests_in_batches(
+    mocked_send_request, mocked_send_requests, event_deliveries, settings
+):
+    # given
+    settings.WEBHOOK_DELIVERY_BATCH_SIZE = 2
+    deliveries = event_deliveries + [
+        EventDelivery.objects.create(
+            event_type=WebhookEventAsyncType.ANY, webhook=event_deliveries[0].webhook
+        )
+    ]
+
+    # when
+    send_webhook_requests(deliveries)
+
+    # then
+    mocked_send_request.assert_not_called()
+    assert mocked_send_requests.call_args_list == [
+        mock.call([deliveries[0].id, deliveries[1].id]),
+        mock.call([deliveries[2].id]),
+    ]
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.delay"
+)
+def test_send_webhook_requests_batches_disabled(
+    mocked_send_request, mocked_send_requests, event_deliveries, settings
+):
+    # given
+    settings.WEBHOOK_DELIVERY_BATCH_SIZE = 1
+
+    # when
+    send_webhook_requests(event_deliveries)
+
+    # then
+    mocked_send_requests.assert_not_called()
+    assert mocked_send_request.call_args_list == [
+        mock.call(delivery.id) for delivery in event_deliveries
+    ]
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.retry"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.observability."
+    "report_event_delivery_attempt"
+)
+def test_send_webhook_requests_async_retries_failed_deliveries(
+    mocked_observability,
+    mocked_task_retry,
+    mocked_send_response,
+    event_deliveries,
+    django_assert_max_num_queries,
+):
+    # given
+    successful_delivery, failing_delivery = event_deliveries
+    mocked_task_retry.side_effect = CeleryTaskRetryError()
+
+    # when
+    with django_assert_max_num_queries(10):
+        with pytest.raises(CeleryTaskRetryError):
+            send_webhook_requests_async([delivery.id for delivery in event_deliveries])
+
+    # then
+    assert mocked_send_response.call_count == 2
+    assert mocked_task_retry.call_args.kwargs["args"] == ([failing_delivery.id],)
+    assert not EventDelivery.objects.filter(id=successful_delivery.id).exists()
+    failing_delivery.refresh_from_db()
+    assert failing_delivery.status == EventDeliveryStatus.PENDING
+    attempt = EventDeliveryAttempt.objects.get(delivery=failing_delivery)
+    assert attempt.status == EventDeliveryStatus.FAILED
+    assert attempt.response == "example_content_response"
+    assert mocked_observability.call_count == 2
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.retry"
+)
+def test_send_webhook_requests_async_when_max_retries_exceeded(
+    mocked_task_retry, mocked_send_response, event_deliveries
+):
+    # given
+    _, failing_delivery = event_deliveries
+    mocked_task_retry.side_effect = MaxRetriesExceededError()
+
+    # when
+    send_webhook_requests_async([delivery.id for delivery in event_deliveries])
+
+    # then
+    failing_delivery.refresh_from_db()
+    assert failing_delivery.status == EventDeliveryStatus.FAILED
+    assert EventDelivery.objects.count() == 1
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.retry"
+)
+def test_send_webhook_requests_async_does_not_retry_delivery_without_payload(
+    mocked_task_retry, mocked_send_response, event_deliveries
+):
+    # given
+    successful_delivery, failing_delivery = event_deliveries
+    failing_delivery.payload = None
+    failing_delivery.save(update_fields=["payload"])
+
+    # when
+    send_webhook_requests_async([delivery.id for delivery in event_deliveries])
+
+    # then
+    mocked_task_retry.assert_not_called()
+    mocked_send_response.assert_called_once()
+    failing_delivery.refresh_from_db()
+    assert failing_delivery.status == EventDeliveryStatus.FAILED
+
+
+def test_send_webhook_requests_async_when_webhook_is_disabled(
+    mocked_send_response, event_deliveries
+):
+    # given
+    for delivery in event_deliveries:
+        delivery.webhook.is_active = False
+        delivery.webhook.save(update_fields=["is_active"])
+
+    # when
+    send_webhook_requests_async([delivery.id for delivery in event_deliveries])
+
+    # then
+    mocked_send_response.assert_not_called()
+    assert not EventDeliveryAttempt.objects.exists()
+    assert set(EventDelivery.objects.values_list("status", flat=True)) == {
+        EventDeliveryStatus.FAILED
+    }
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
+)
+def test_send_webhook_requests_with_default_batch_size(
+    mocked_send_requests, event_deliveries
+):
+    # when
+    send_webhook_requests(event_deliveries)
+
+    # then
+    mocked_send_requests.assert_called_once_with(
+        [delivery.id for delivery in event_deliveries]
+    )
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.retry"
+)
+def test_send_webhook_requests_async_retries_delivery_raising_error(
+    mocked_task_retry, webhook_response, event_deliveries
+):
+    # given
+    successful_delivery, failing_delivery = event_deliveries
+    mocked_task_retry.side_effect = CeleryTaskRetryError()
+
+    def send_response(target_url, *args):
+        if target_url == FAILING_TARGET_URL:
+            raise ConnectionResetError("Connection reset by peer")
+        return webhook_response
+
+    # when
+    with mock.patch(
+        "saleor.webhook.transport.asynchronous.transport."
+        "send_webhook_using_scheme_method",
+        side_effect=send_response,
+    ):
+        with pytest.raises(CeleryTaskRetryError):
+            send_webhook_requests_async([delivery.id for delivery in event_deliveries])
+
+    # then
+    assert mocked_task_retry.call_args.kwargs["args"] == ([failing_delivery.id],)
+    assert not EventDelivery.objects.filter(id=successful_delivery.id).exists()
+    attempt = EventDeliveryAttempt.objects.get(delivery=failing_delivery)
+    assert attempt.status == EventDeliveryStatus.FAILED
+    assert attempt.response == "Connection reset by peer"
+
+
+def test_send_webhook_requests_async_reuses_delivery_threads(
+    webhook_response, event_deliveries
+):
+    # given
+    threads = []
+
+    def send_response(*args):
+        threads.append(threading.current_thread())
+        return webhook_response
+
+    # when
+    with mock.patch(
+        "saleor.webhook.transport.asynchronous.transport."
+        "send_webhook_using_scheme_method",
+        side_effect=send_response,
+    ):
+        for delivery in event_deliveries:
+            send_webhook_requests_async([delivery.id])
+
+    # then
+    assert len(threads) == 2
+    assert set(threads) <= get_delivery_executor()._threads
@@ -0,0 +1,273 @@
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from unittest import mock
+from urllib.parse import urlparse
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.utils import timezone
+
+from ....core import EventDeliveryStatus
+from ....core.models import EventDelivery, EventDeliveryAttempt
+from ....webhook.event_types import WebhookEventSyncType
+from ....webhook.models import Webhook
+from ....webhook.transport.asynchronous.transport import send_webhook_requests
+from ....webhook.transport.asynchronous.worker import (
+    MAX_RETRIES,
+    ClaimedDelivery,
+    WebhookDeliveryWorker,
+    claim_event_deliveries,
+    record_delivery_attempt,
+)
+
+WORKER_ID = "worker:1"
+
+
+def test_claim_event_deliveries(event_delivery):
+    # when
+    claimed = claim_event_deliveries(10, WORKER_ID)
+
+    # then
+    assert [item.delivery for item in claimed] == [event_delivery]
+    attempt = claimed[0].attempt
+    assert attempt.status == EventDeliveryStatus.PENDING
+    assert attempt.task_id == WORKER_ID
+    assert claimed[0].retries == 0
+    assert claim_event_deliveries(10, WORKER_ID) == []
+
+
+def test_claim_event_deliveries_with_expired_lease(event_delivery, event_attempt):
+    # given
+    event_attempt.status = EventDeliveryStatus.PENDING
+    event_attempt.save(update_fields=["status"])
+    EventDeliveryAttempt.objects.filter(pk=event_attempt.pk).update(
+        created_at=timezone.now() - timedelta(hours=1)
+    )
+
+    # when
+    claimed = claim_event_deliveries(10, WORKER_ID)
+
+    # then
+    assert [item.delivery for item in claimed] == [event_delivery]
+    assert claimed[0].retries == 1
+    event_attempt.refresh_from_db()
+    assert event_attempt.status == EventDeliveryStatus.FAILED
+
+
+def test_claim_event_deliveries_of_disabled_webhook(event_delivery):
+    # given
+    event_delivery.webhook.is_active = False
+    event_delivery.webhook.save(update_fields=["is_active"])
+
+    # when
+    claimed = claim_event_deliveries(10, WORKER_ID)
+
+    # then
+    assert claimed == []
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.FAILED
+    assert not EventDeliveryAttempt.objects.exists()
+
+
+def test_claim_event_deliveries_of_sync_event(event_delivery):
+    # given
+    event_delivery.event_type = WebhookEventSyncType.TRANSACTION_CHARGE_REQUESTED
+    event_delivery.save(update_fields=["event_type"])
+
+    # when
+    claimed = claim_event_deliveries(10, WORKER_ID)
+
+    # then
+    assert claimed == []
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.PENDING
+    assert not EventDeliveryAttempt.objects.exists()
+
+
+def test_record_delivery_attempt_success(event_delivery, webhook_response):
+    # given
+    (claimed,) = claim_event_deliveries(10, WORKER_ID)
+
+    # when
+    next_claimed = record_delivery_attempt(claimed, webhook_response, True, WORKER_ID)
+
+    # then
+    assert next_claimed is None
+    assert not EventDelivery.objects.filter(pk=event_delivery.pk).exists()
+
+
+def test_record_delivery_attempt_retries_failed_request(
+    event_delivery, webhook_response_failed
+):
+    # given
+    (claimed,) = claim_event_deliveries(10, WORKER_ID)
+
+    # when
+    next_claimed = record_delivery_attempt(
+        claimed, webhook_response_failed, True, WORKER_ID
+    )
+
+    # then
+    assert next_claimed.retries == 1
+    assert next_claimed.attempt.status == EventDeliveryStatus.PENDING
+    claimed.attempt.refresh_from_db()
+    assert claimed.attempt.status == EventDeliveryStatus.FAILED
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.PENDING
+    assert claim_event_deliveries(10, WORKER_ID) == []
+
+
+def test_record_delivery_attempt_when_max_retries_exceeded(
+    event_delivery, webhook_response_failed
+):
+    # given
+    (claimed,) = claim_event_deliveries(10, WORKER_ID)
+    claimed = claimed._replace(retries=MAX_RETRIES)
+
+    # when
+    next_claimed = record_delivery_attempt(
+        claimed, webhook_response_failed, True, WORKER_ID
+    )
+
+    # then
+    assert next_claimed is None
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.FAILED
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.delay"
+)
+def test_send_webhook_requests_with_delivery_worker_enabled(
+    mocked_send_request, event_delivery, settings
+):
+    # given
+    settings.WEBHOOK_DELIVERY_WORKER_ENABLED = True
+
+    # when
+    send_webhook_requests([event_delivery])
+
+    # then
+    mocked_send_request.assert_not_called()
+
+
+@mock.patch("saleor.webhook.transport.asynchronous.worker.send_event_delivery")
+async def test_webhook_delivery_worker_limits_requests_per_host(
+    mocked_send, webhook_response
+):
+    # given
+    lock = threading.Lock()
+    in_flight: dict = defaultdict(int)
+    max_in_flight: dict = defaultdict(int)
+
+    def send(delivery, domain):
+        host = urlparse(delivery.webhook.target_url).netloc
+        with lock:
+            in_flight[host] += 1
+            max_in_flight[host] = max(max_in_flight[host], in_flight[host])
+        time.sleep(0.05)
+        with lock:
+            in_flight[host] -= 1
+        return webhook_response, True
+
+    mocked_send.side_effect = send
+    worker = WebhookDeliveryWorker(concurrency=6, host_concurrency=2)
+    claimed = [
+        ClaimedDelivery(
+            EventDelivery(webhook=Webhook(target_url=target_url), payload=None),
+            EventDeliveryAttempt(),
+            0,
+        )
+        for target_url in ["https://first.com/api/", "https://second.com/api/"] * 3
+    ]
+
+    # when
+    await asyncio.gather(*(worker.send(item) for item in claimed))
+
+    # then
+    assert mocked_send.call_count == 6
+    assert max_in_flight == {"first.com": 2, "second.com": 2}
+    worker.send_executor.shutdown()
+
+
+# The worker uses the database from its own thread, so it sees only committed rows.
+@pytest.mark.django_db(transaction=True)
+@mock.patch("saleor.webhook.transport.asynchronous.worker.get_retry_countdown")
+@mock.patch("saleor.webhook.transport.asynchronous.worker.send_event_delivery")
+async def test_webhook_delivery_worker_retries_failed_delivery(
+    mocked_send,
+    mocked_retry_countdown,
+    event_delivery,
+    webhook_response,
+    webhook_response_failed,
+):
+    # given
+    mocked_retry_countdown.return_value = 0
+    mocked_send.side_effect = [
+        (webhook_response_failed, True),
+        (webhook_response, True),
+    ]
+    worker = WebhookDeliveryWorker(concurrency=1, host_concurrency=1)
+    (claimed,) = await worker.run_in_db_thread(claim_event_deliveries, 1, WORKER_ID)
+    worker.sending = 1
+
+    # when
+    with mock.patch(
+        "saleor.webhook.transport.asynchronous.worker.record_delivery_attempt",
+        wraps=record_delivery_attempt,
+    ) as mocked_record:
+        await worker.deliver(claimed)
+
+    # then
+    recorded = [call.args[0] for call in mocked_record.call_args_list]
+    assert [item.retries for item in recorded] == [0, 1]
+    assert recorded[0].attempt.pk != recorded[1].attempt.pk
+    assert recorded[0].attempt.status == EventDeliveryStatus.FAILED
+    assert worker.sending == 0
+    assert not await worker.run_in_db_thread(
+        EventDelivery.objects.filter(pk=event_delivery.pk).exists
+    )
+    worker.send_executor.shutdown()
+    worker.db_executor.shutdown()
+
+
+@pytest.mark.django_db(transaction=True)
+@mock.patch("saleor.webhook.transport.asynchronous.worker.get_retry_countdown")
+@mock.patch("saleor.webhook.transport.asynchronous.worker.send_event_delivery")
+async def test_webhook_delivery_worker_stop_leaves_waiting_deliveries_claimable(
+    mocked_send,
+    mocked_retry_countdown,
+    event_delivery,
+    webhook_response_failed,
+    settings,
+):
+    # given
+    settings.PUBLIC_URL = "https://example.com"
+    mocked_retry_countdown.return_value = 60
+    mocked_send.return_value = (webhook_response_failed, True)
+    worker = WebhookDeliveryWorker(
+        concurrency=2, host_concurrency=1, poll_interval=0.01
+    )
+    run_task = asyncio.create_task(worker.run())
+    for _ in range(500):
+        if worker.waiting_tasks:
+            break
+        await asyncio.sleep(0.01)
+    assert worker.waiting_tasks
+    assert worker.sending == 0
+
+    # when
+    worker.stop()
+    await asyncio.wait_for(run_task, 5)
+
+    # then
+    mocked_send.assert_called_once()
+    assert not worker.tasks
+    settings.WEBHOOK_WORKER_LEASE = timedelta(0)
+    claimed = await sync_to_async(claim_event_deliveries)(10, WORKER_ID)
+    assert [item.delivery.pk for item in claimed] == [event_delivery.pk]
+    # The failed attempt and the attempt of the expired claim.
+    assert claimed[0].retries == 2
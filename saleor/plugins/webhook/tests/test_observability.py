@@ -95,10 +95,10 @@ def test_send_observability_events_when_reposnse_failed(
 
 
 @patch(
-    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_using_scheme_method"
 )
 def test_send_observability_events_to_google_pub_sub(
-    mock_send_webhook_using_scheme_method, observability_webhook_data
+    mock_send_webhooks_using_scheme_method, observability_webhook_data
 ):
     observability_webhook_data.target_url = (
         "gcpubsub://cloud.google.com/projects/saleor/topics/test"
@@ -108,21 +108,20 @@ def test_send_observability_events_to_google_pub_sub(
 
     send_observability_events(webhooks, events)
 
-    assert mock_send_webhook_using_scheme_method.call_count == len(events)
-    mock_send_webhook_using_scheme_method.assert_called_with(
+    mock_send_webhooks_using_scheme_method.assert_called_once_with(
         observability_webhook_data.target_url,
         observability_webhook_data.saleor_domain,
         observability_webhook_data.secret_key,
         WebhookEventAsyncType.OBSERVABILITY,
-        dump_payload(events[-1]),
+        [dump_payload(event) for event in events],
     )
 
 
 @patch(
-    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_using_scheme_method"
 )
 def test_send_observability_events_to_google_pub_sub_when_reposnse_failed(
-    mock_send_webhook_using_scheme_method, observability_webhook_data
+    mock_send_webhooks_using_scheme_method, observability_webhook_data
 ):
     observability_webhook_data.target_url = (
         "gcpubsub://cloud.google.com/projects/saleor/topics/test"
@@ -130,7 +129,7 @@ def test_send_observability_events_to_google_pub_sub_when_reposnse_failed(
     events = [{"event": "data"}, {"event": "data"}]
     response = Mock()
     response.status = EventDeliveryStatus.FAILED
-    mock_send_webhook_using_scheme_method.return_value = response
+    mock_send_webhooks_using_scheme_method.return_value = [response, response]
 
     send_observability_events([observability_webhook_data], events)
-    assert mock_send_webhook_using_scheme_method.call_count == len(events)
+    mock_send_webhooks_using_scheme_method.assert_called_once()
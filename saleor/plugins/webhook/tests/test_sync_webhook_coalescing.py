@@ -0,0 +1,181 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from ....webhook.const import WEBHOOK_CACHE_LOCK_SUFFIX, WEBHOOK_CACHE_LOCK_WAIT_RATIO
+from ....webhook.event_types import WebhookEventSyncType
+from ....webhook.transport.synchronous.transport import (
+    trigger_webhook_sync_if_not_cached,
+)
+from ....webhook.transport.utils import generate_cache_key_for_webhook
+
+CACHE_DATA = {"checkout": {"id": "1"}}
+EVENT_TYPE = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+PAYLOAD = '{"checkout": {"id": "1"}}'
+RESPONSE = [{"id": "method-1", "name": "Standard", "amount": 10}]
+
+
+@pytest.fixture
+def cache_key(webhook):
+    key = generate_cache_key_for_webhook(
+        CACHE_DATA, webhook.target_url, EVENT_TYPE, webhook.app_id
+    )
+    yield key
+    cache.delete_many([key, f"{key}{WEBHOOK_CACHE_LOCK_SUFFIX}"])
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_releases_lock(
+    mocked_trigger, webhook, cache_key
+):
+    # given
+    mocked_trigger.return_value = RESPONSE
+
+    # when
+    response = trigger_webhook_sync_if_not_cached(
+        EVENT_TYPE, PAYLOAD, webhook, CACHE_DATA
+    )
+
+    # then
+    assert response == RESPONSE
+    mocked_trigger.assert_called_once()
+    assert cache.get(cache_key) == RESPONSE
+    assert cache.get(f"{cache_key}{WEBHOOK_CACHE_LOCK_SUFFIX}") is None
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.time.sleep")
+@mock.patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_waits_for_locked_request(
+    mocked_trigger, mocked_sleep, webhook, cache_key
+):
+    # given
+    cache.add(f"{cache_key}{WEBHOOK_CACHE_LOCK_SUFFIX}", True)
+    mocked_sleep.side_effect = lambda _: cache.set(cache_key, RESPONSE)
+
+    # when
+    response = trigger_webhook_sync_if_not_cached(
+        EVENT_TYPE, PAYLOAD, webhook, CACHE_DATA
+    )
+
+    # then
+    assert response == RESPONSE
+    mocked_trigger.assert_not_called()
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.time.sleep")
+@mock.patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_when_locked_request_failed(
+    mocked_trigger, mocked_sleep, webhook, cache_key
+):
+    # given
+    lock_key = f"{cache_key}{WEBHOOK_CACHE_LOCK_SUFFIX}"
+    cache.add(lock_key, True)
+    mocked_sleep.side_effect = lambda _: cache.delete(lock_key)
+    mocked_trigger.return_value = RESPONSE
+
+    # when
+    response = trigger_webhook_sync_if_not_cached(
+        EVENT_TYPE, PAYLOAD, webhook, CACHE_DATA
+    )
+
+    # then
+    assert response == RESPONSE
+    mocked_trigger.assert_called_once()
+    assert cache.get(cache_key) == RESPONSE
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_when_wait_timed_out(
+    mocked_trigger, webhook, cache_key
+):
+    # given
+    lock_key = f"{cache_key}{WEBHOOK_CACHE_LOCK_SUFFIX}"
+    cache.add(lock_key, True)
+    mocked_trigger.return_value = RESPONSE
+
+    # when
+    response = trigger_webhook_sync_if_not_cached(
+        EVENT_TYPE, PAYLOAD, webhook, CACHE_DATA, request_timeout=(0, 0.01)
+    )
+
+    # then
+    assert response == RESPONSE
+    mocked_trigger.assert_called_once()
+    # The lock of the other request isn't released.
+    assert cache.get(lock_key) is True
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.wait_for_cached_response")
+@mock.patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_waits_less_than_request_timeout(
+    mocked_trigger, mocked_wait, webhook, cache_key
+):
+    # given
+    lock_key = f"{cache_key}{WEBHOOK_CACHE_LOCK_SUFFIX}"
+    cache.add(lock_key, True)
+    mocked_wait.return_value = None
+    mocked_trigger.return_value = RESPONSE
+
+    # when
+    trigger_webhook_sync_if_not_cached(
+        EVENT_TYPE, PAYLOAD, webhook, CACHE_DATA, request_timeout=(1, 9)
+    )
+
+    # then
+    mocked_wait.assert_called_once_with(
+        cache_key, lock_key, 10 * WEBHOOK_CACHE_LOCK_WAIT_RATIO
+    )
+    mocked_trigger.assert_called_once()
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.time.sleep")
+@mock.patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_takes_released_lock_once(
+    mocked_trigger, mocked_sleep, webhook, cache_key
+):
+    # given
+    lock_key = f"{cache_key}{WEBHOOK_CACHE_LOCK_SUFFIX}"
+    cache.add(lock_key, True)
+    mocked_sleep.side_effect = lambda _: cache.delete(lock_key)
+    locks = []
+
+    def trigger(*args, **kwargs):
+        locks.append(cache.get(lock_key))
+        return None
+
+    mocked_trigger.side_effect = trigger
+
+    # when
+    response = trigger_webhook_sync_if_not_cached(
+        EVENT_TYPE, PAYLOAD, webhook, CACHE_DATA
+    )
+
+    # then
+    assert response is None
+    mocked_trigger.assert_called_once()
+    # Other requests wait for the request sent after the lock was released.
+    assert locks[0] not in (None, True)
+    mocked_sleep.assert_called_once()
+    assert cache.get(lock_key) is None
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.trigger_webhook_sync")
+def test_trigger_webhook_sync_if_not_cached_keeps_lock_taken_by_other_request(
+    mocked_trigger, webhook, cache_key
+):
+    # given
+    lock_key = f"{cache_key}{WEBHOOK_CACHE_LOCK_SUFFIX}"
+
+    def trigger(*args, **kwargs):
+        # The lock expired during the request and was taken by another one.
+        cache.set(lock_key, "other-token")
+        return RESPONSE
+
+    mocked_trigger.side_effect = trigger
+
+    # when
+    trigger_webhook_sync_if_not_cached(EVENT_TYPE, PAYLOAD, webhook, CACHE_DATA)
+
+    # then
+    assert cache.get(lock_key) == "other-token"
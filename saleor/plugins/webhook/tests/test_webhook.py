@@ -28,7 +28,7 @@ from ....account.notifications import (
 from ....app.models import App
 from ....checkout.fetch import fetch_checkout_lines
 from ....core import EventDeliveryStatus
-from ....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
+from ....core.models import EventDelivery, EventDeliveryAttempt
 from ....core.notification.utils import get_site_context
 from ....core.notify_events import NotifyEventType
 from ....core.utils.url import prepare_url
@@ -75,7 +75,7 @@ third_url = "http://www.example.com/third/"
     ],
 )
 @mock.patch(
-    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.delay"
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
 )
 def test_trigger_webhooks_for_event_calls_expected_events(
     mock_request,
@@ -112,16 +112,17 @@ def test_trigger_webhooks_for_event_calls_expected_events(
         target_url="http://www.example.com/third/"
     )
     third_webhook.events.create(event_type=WebhookEventAsyncType.ANY)
-    event_payload = EventPayload.objects.create()
     trigger_webhooks_async(
-        event_payload, event_name, get_webhooks_for_event(event_name)
+        '{"key": "data"}', event_name, get_webhooks_for_event(event_name)
     )
-    deliveries_called = {
-        EventDelivery.objects.get(id=delivery_id[0][0])
-        for delivery_id in mock_request.call_args_list
-    }
+    delivery_ids = [
+        delivery_id
+        for call in mock_request.call_args_list
+        for delivery_id in call.args[0]
+    ]
+    deliveries_called = EventDelivery.objects.filter(id__in=delivery_ids)
     urls_called = {delivery.webhook.target_url for delivery in deliveries_called}
-    assert mock_request.call_count == total_webhook_calls
+    assert len(delivery_ids) == total_webhook_calls
     assert urls_called == expected_target_urls
 
 
@@ -1600,9 +1601,8 @@ def test_create_event_payload_reference_with_error(
     webhook.target_url = "testy"
     webhook.save()
     expected_data = serialize("json", [order_with_lines])
-    event_payload = EventPayload.objects.create(payload=expected_data)
     trigger_webhooks_async(
-        event_payload, WebhookEventAsyncType.ORDER_CREATED, [webhook]
+        expected_data, WebhookEventAsyncType.ORDER_CREATED, [webhook]
     )
     delivery = EventDelivery.objects.first()
     send_webhook_request_async(delivery.id)
@@ -1741,7 +1741,9 @@ def test_sale_toggle(
     )
 
 
-@mock.patch("saleor.plugins.webhook.plugin.send_webhook_request_async.delay")
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
+)
 def test_event_delivery_retry(mocked_webhook_send, event_delivery, settings):
     # given
     settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
@@ -1751,7 +1753,29 @@ def test_event_delivery_retry(mocked_webhook_send, event_delivery, settings):
     manager.event_delivery_retry(event_delivery)
 
     # then
-    mocked_webhook_send.assert_called_once_with(event_delivery.pk)
+    mocked_webhook_send.assert_called_once_with([event_delivery.pk])
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
+)
+def test_event_delivery_retry_with_delivery_worker_enabled(
+    mocked_webhook_send, event_delivery, settings
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    settings.WEBHOOK_DELIVERY_WORKER_ENABLED = True
+    event_delivery.status = EventDeliveryStatus.FAILED
+    event_delivery.save(update_fields=["status"])
+    manager = get_plugins_manager()
+
+    # when
+    manager.event_delivery_retry(event_delivery)
+
+    # then
+    mocked_webhook_send.assert_not_called()
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.PENDING
 
 
 @mock.patch(
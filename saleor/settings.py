@@ -630,6 +630,11 @@ EVENT_PAYLOAD_DELETE_PERIOD = timedelta(
     seconds=parse(os.environ.get("EVENT_PAYLOAD_DELETE_PERIOD", "14 days"))
 )
 
+# Store event payloads, deliveries and attempts in tables partitioned by the date
+# of creation, dropping partitions older than EVENT_PAYLOAD_DELETE_PERIOD instead
+# of deleting rows. Tables are partitioned by the `event_partitions` command.
+EVENT_PARTITIONING_ENABLED = get_bool_from_env("EVENT_PARTITIONING_ENABLED", False)
+
 # Observability settings
 OBSERVABILITY_BROKER_URL = os.environ.get("OBSERVABILITY_BROKER_URL")
 OBSERVABILITY_ACTIVE = bool(OBSERVABILITY_BROKER_URL)
@@ -704,6 +709,81 @@ GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Fraction of GraphQL operations measured by `ResolverStatsMiddleware` and reported
+# to observability. Operations of staff users and all operations in debug mode are
+# always measured and return the stats in the `resolverStats` extension.
+GRAPHQL_RESOLVER_STATS_SAMPLE_RATE = float(
+    os.environ.get("GRAPHQL_RESOLVER_STATS_SAMPLE_RATE", 0.0)
+)
+
+# Return the number and time of SQL queries executed by GraphQL operations in the
+# `sqlStats` extension. The stats are also reported to observability when it's active.
+GRAPHQL_SQL_STATS_EXTENSION = get_bool_from_env("GRAPHQL_SQL_STATS_EXTENSION", DEBUG)
+
+# Number of parsed and validated GraphQL documents kept in memory by each worker.
+# Set GRAPHQL_DOCUMENT_CACHE_SIZE=0 in env to disable the cache.
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.environ.get("GRAPHQL_DOCUMENT_CACHE_SIZE", 1000))
+
+# Number of parsed and validated subscription queries of webhooks kept in memory by
+# each worker. Set WEBHOOK_SUBSCRIPTION_DOCUMENT_CACHE_SIZE=0 in env to disable it.
+WEBHOOK_SUBSCRIPTION_DOCUMENT_CACHE_SIZE = int(
+    os.environ.get("WEBHOOK_SUBSCRIPTION_DOCUMENT_CACHE_SIZE", 1000)
+)
+
+# Number of threads used to execute query operations of a batch request
+# concurrently. Mutations are always executed in order. Set to 0 to disable.
+GRAPHQL_BATCH_CONCURRENCY = int(os.environ.get("GRAPHQL_BATCH_CONCURRENCY", 0))
+
+# Serve the GraphQL API with an async view when running under ASGI. Requests
+# are executed on a pool of GRAPHQL_ASYNC_VIEW_WORKERS threads per process.
+GRAPHQL_ASYNC_VIEW = get_bool_from_env("GRAPHQL_ASYNC_VIEW", False)
+GRAPHQL_ASYNC_VIEW_WORKERS = int(os.environ.get("GRAPHQL_ASYNC_VIEW_WORKERS", 32))
+
+# Number of serialized responses to introspection queries kept in memory by each
+# worker. Set GRAPHQL_INTROSPECTION_CACHE_SIZE=0 in env to disable the cache.
+GRAPHQL_INTROSPECTION_CACHE_SIZE = int(
+    os.environ.get("GRAPHQL_INTROSPECTION_CACHE_SIZE", 10)
+)
+
+# Function used to serialize GraphQL responses to JSON bytes. The default one uses
+# orjson and falls back to the standard library for data orjson can't serialize.
+GRAPHQL_RESPONSE_SERIALIZER = os.environ.get(
+    "GRAPHQL_RESPONSE_SERIALIZER",
+    "saleor.core.utils.json_serializer.fast_json_dumps",
+)
+
+# Share responses of anonymous storefront queries (products, collections, categories
+# and menus) between clients using the default cache. Responses are invalidated
+# by the events triggered for the changed objects.
+GRAPHQL_RESPONSE_CACHE_ENABLED = get_bool_from_env(
+    "GRAPHQL_RESPONSE_CACHE_ENABLED", False
+)
+GRAPHQL_RESPONSE_CACHE_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_TIMEOUT", "1 minute")
+)
+# When set, cached responses are sent with `Cache-Control: public, max-age=<value>`
+# so a CDN can store them too. Use the `Surrogate-Key` header to purge them by tag.
+GRAPHQL_RESPONSE_CACHE_CDN_MAX_AGE = int(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_CDN_MAX_AGE", 0)
+)
+
+# Automatic persisted queries (APQ): clients can send a SHA-256 hash of a query
+# instead of the full query string, and use GET requests that can be cached by a CDN.
+GRAPHQL_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ENABLED", False
+)
+# Execute only queries stored in the database by the `register_persisted_queries`
+# command, not the ones registered by clients in the cache.
+GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY", False
+)
+GRAPHQL_PERSISTED_QUERIES_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_PERSISTED_QUERIES_TIMEOUT", "7 days")
+)
+GRAPHQL_PERSISTED_QUERIES_LOCAL_CACHE_SIZE = int(
+    os.environ.get("GRAPHQL_PERSISTED_QUERIES_LOCAL_CACHE_SIZE", 1000)
+)
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -741,6 +821,13 @@ for entry_point in installed_plugins:
 
 PLUGINS = BUILTIN_PLUGINS + EXTERNAL_PLUGINS
 
+# Keep plugins loaded with their configuration in memory of each process and clone
+# them for each request, instead of loading them from the database. Changes of
+# plugins and channels are picked up through a version stored in the cache.
+PLUGINS_MANAGER_PROTOTYPE_ENABLED = get_bool_from_env(
+    "PLUGINS_MANAGER_PROTOTYPE_ENABLED", False
+)
+
 # Default timeout (sec) for establishing a connection when performing external requests.
 REQUESTS_CONN_EST_TIMEOUT = 2
 
@@ -752,6 +839,11 @@ COMMON_REQUESTS_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 WEBHOOK_TIMEOUT = 10
 WEBHOOK_SYNC_TIMEOUT = COMMON_REQUESTS_TIMEOUT
 
+# Keep webhook subscriptions of events in memory of each process, so events without
+# subscribers don't query the database. Changes of webhooks, apps and permissions are
+# picked up through a version stored in the cache.
+WEBHOOKS_REGISTRY_ENABLED = get_bool_from_env("WEBHOOKS_REGISTRY_ENABLED", True)
+
 # When `True`, HTTP requests made from arbitrary URLs will be rejected (e.g., webhooks).
 # if they try to access private IP address ranges, and loopback ranges (unless
 # `HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS=False`).
@@ -763,6 +855,15 @@ HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS: bool = get_bool_from_env(
     "HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS", False
 )
 
+# Keep-alive connections of external requests are reused by each thread, pooled by
+# the IP address of the target host. Number of hosts with pooled connections and
+# number of connections kept for each host.
+HTTP_POOL_CONNECTIONS = int(os.environ.get("HTTP_POOL_CONNECTIONS", 10))
+HTTP_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", 10))
+# Pooled connections unused for longer are closed before the next request;
+# `0` disables pooling.
+HTTP_POOL_IDLE_TIMEOUT = parse(os.environ.get("HTTP_POOL_IDLE_TIMEOUT", "30 seconds"))
+
 # Since we split checkout complete logic into two separate transactions, in order to
 # mimic stock lock, we apply short reservation for the stocks. The value represents
 # time of the reservation in seconds.
@@ -799,7 +900,18 @@ if REDIS_URL:
 CACHES = {"default": django_cache_url.config()}
 CACHES["default"]["TIMEOUT"] = parse(os.environ.get("CACHE_TIMEOUT", "7 days"))
 
+# Number of seconds the ids of verified app tokens are cached for, so the token
+# hashes don't have to be checked on every request made by an app. Set to 0 to
+# disable the cache.
+APP_TOKEN_CACHE_TIMEOUT = parse(os.environ.get("APP_TOKEN_CACHE_TIMEOUT", "1 minute"))
+
 JWT_EXPIRE = True
+# Number of verified access token payloads kept in memory by each worker, so the
+# signature of a token is checked once. Set to 0 to disable the cache.
+JWT_DECODED_TOKEN_CACHE_SIZE = int(os.environ.get("JWT_DECODED_TOKEN_CACHE_SIZE", 1000))
+# Number of seconds effective permissions of users resolved from access tokens are
+# cached for. Entries never outlive the token. Set to 0 to disable the cache.
+JWT_USER_CACHE_TIMEOUT = parse(os.environ.get("JWT_USER_CACHE_TIMEOUT", "1 minute"))
 JWT_TTL_ACCESS = timedelta(seconds=parse(os.environ.get("JWT_TTL_ACCESS", "5 minutes")))
 JWT_TTL_APP_ACCESS = timedelta(
     seconds=parse(os.environ.get("JWT_TTL_APP_ACCESS", "5 minutes"))
@@ -846,6 +958,50 @@ UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME = os.environ.get(
 # Queue name for "async webhook" events
 WEBHOOK_CELERY_QUEUE_NAME = os.environ.get("WEBHOOK_CELERY_QUEUE_NAME", None)
 
+# Queue name for generating deferred payloads of "async webhook" events
+WEBHOOK_PAYLOADS_CELERY_QUEUE_NAME = os.environ.get(
+    "WEBHOOK_PAYLOADS_CELERY_QUEUE_NAME", None
+)
+
+# Async update events (`*_updated`) for which payloads of subscription webhooks are
+# generated in Celery tasks instead of the request triggering them. Only a reference
+# to the object is recorded, so the payloads reflect the state of the object when
+# the task runs. Other events always get payloads of the state at the event time.
+WEBHOOK_DEFERRED_PAYLOAD_EVENTS = get_list(
+    os.environ.get("WEBHOOK_DEFERRED_PAYLOAD_EVENTS", "")
+)
+# Maximum number of events of one type whose payloads are generated by one task.
+WEBHOOK_DEFERRED_PAYLOADS_BATCH_SIZE = int(
+    os.environ.get("WEBHOOK_DEFERRED_PAYLOADS_BATCH_SIZE", 100)
+)
+# Maximum number of deliveries of one event sent by one task; `1` sends each
+# delivery in its own task.
+WEBHOOK_DELIVERY_BATCH_SIZE = int(os.environ.get("WEBHOOK_DELIVERY_BATCH_SIZE", 50))
+# Number of deliveries of batches sent at the same time by each worker process.
+WEBHOOK_DELIVERY_CONCURRENCY = int(os.environ.get("WEBHOOK_DELIVERY_CONCURRENCY", 10))
+
+# When `True`, async webhook deliveries aren't sent by Celery tasks, but pulled from
+# the database by the `webhook_delivery_worker` command, which sends them
+# concurrently from an asyncio event loop.
+WEBHOOK_DELIVERY_WORKER_ENABLED = get_bool_from_env(
+    "WEBHOOK_DELIVERY_WORKER_ENABLED", False
+)
+# Maximum number of deliveries sent at the same time by one worker process, and to
+# one host.
+WEBHOOK_WORKER_CONCURRENCY = int(os.environ.get("WEBHOOK_WORKER_CONCURRENCY", 200))
+WEBHOOK_WORKER_HOST_CONCURRENCY = int(
+    os.environ.get("WEBHOOK_WORKER_HOST_CONCURRENCY", 20)
+)
+# Time between queries for pending deliveries when there are none, in seconds.
+WEBHOOK_WORKER_POLL_INTERVAL = parse(
+    os.environ.get("WEBHOOK_WORKER_POLL_INTERVAL", "1 second")
+)
+# Deliveries claimed by a worker that didn't finish them in this time, e.g. after
+# it was killed, are claimed again by other workers.
+WEBHOOK_WORKER_LEASE = timedelta(
+    seconds=parse(os.environ.get("WEBHOOK_WORKER_LEASE", "15 minutes"))
+)
+
 # Lock time for request password reset mutation per user (seconds)
 RESET_PASSWORD_LOCK_TIME = parse(
     os.environ.get("RESET_PASSWORD_LOCK_TIME", "15 minutes")
@@ -26,6 +26,7 @@ from freezegun import freeze_time
 from PIL import Image
 from prices import Money, TaxedMoney, fixed_discount
 
+from ..account.auth_cache import PERMISSION_GROUPS_VERSION_KEY
 from ..account.models import Address, Group, StaffNotificationRecipient, User
 from ..app.models import App, AppExtension, AppInstallation
 from ..app.types import AppExtensionMount, AppType
@@ -42,11 +43,13 @@ from ..checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ..checkout.models import Checkout, CheckoutLine, CheckoutMetadata
 from ..checkout.utils import add_variant_to_checkout, add_voucher_to_checkout
 from ..core import EventDeliveryStatus, JobStatus
+from ..core.jwt import decoded_token_cache
 from ..core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ..core.payments import PaymentInterface
 from ..core.postgres import FlatConcatSearchVector
 from ..core.taxes import zero_money
 from ..core.units import MeasurementUnits
+from ..core.utils.cache_version import increment_cache_version
 from ..core.utils.editorjs import clean_editor_js
 from ..csv.events import ExportEvents
 from ..csv.models import ExportEvent, ExportFile
@@ -152,6 +155,7 @@ from ..warehouse.models import (
 from ..webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..webhook.models import Webhook, WebhookEvent
 from ..webhook.observability import WebhookData
+from ..webhook.registry import clear_webhooks_registry
 from ..webhook.transport.utils import WebhookResponse, to_payment_app_id
 from .utils import dummy_editorjs
 
@@ -249,6 +253,21 @@ def setup_dummy_gateways(settings):
     return settings
 
 
+@pytest.fixture(autouse=True)
+def clear_webhooks_registry_between_tests():
+    # Webhooks of previous tests are rolled back without signals, so they would be
+    # kept in the registry.
+    clear_webhooks_registry()
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_caches_between_tests():
+    # Users and tokens of previous tests are rolled back without signals, so they
+    # would still be resolved from the caches.
+    decoded_token_cache.clear()
+    increment_cache_version(PERMISSION_GROUPS_VERSION_KEY)
+
+
 @pytest.fixture
 def sample_gateway(settings):
     settings.PLUGINS += [
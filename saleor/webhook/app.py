@@ -0,0 +1,35 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class WebhookAppConfig(AppConfig):
+    name = "saleor.webhook"
+
+    def ready(self):
+        from ..app.models import App
+        from ..permission.models import Permission
+        from .models import Webhook, WebhookEvent
+        from .signals import (
+            invalidate_webhooks_registry_on_change,
+            invalidate_webhooks_registry_on_permissions_change,
+        )
+
+        # Subscriptions of events are kept in memory of each process, so they
+        # have to be reloaded after changes of webhooks, apps and permissions.
+        for model in [App, Webhook, WebhookEvent]:
+            for signal in [post_save, post_delete]:
+                signal.connect(
+                    invalidate_webhooks_registry_on_change,
+                    sender=model,
+                    dispatch_uid=f"invalidate_webhooks_registry_{model.__name__}",
+                )
+        post_delete.connect(
+            invalidate_webhooks_registry_on_change,
+            sender=Permission,
+            dispatch_uid="invalidate_webhooks_registry_Permission",
+        )
+        m2m_changed.connect(
+            invalidate_webhooks_registry_on_permissions_change,
+            sender=App.permissions.through,
+            dispatch_uid="invalidate_webhooks_registry_app_permissions",
+        )
@@ -1,4 +1,11 @@
 CACHE_EXCLUDED_SHIPPING_KEY = "webhook_exclude_shipping_id_"
 CACHE_EXCLUDED_SHIPPING_TIME = 60 * 3
 WEBHOOK_CACHE_DEFAULT_TIMEOUT: int = 5 * 60  # 5 minutes
+# Lock held while a cached sync webhook request is sent, so concurrent requests for
+# the same cache key wait for its response.
+WEBHOOK_CACHE_LOCK_SUFFIX = "-lock"
+WEBHOOK_CACHE_LOCK_POLL_INTERVAL = 0.1  # 100 ms
+# Part of the request timeout for which concurrent requests wait for the response,
+# so they still have time to send the request themselves.
+WEBHOOK_CACHE_LOCK_WAIT_RATIO = 0.5
 APP_ID_PREFIX = "app"
@@ -0,0 +1,48 @@
+import asyncio
+import signal
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.core.management.base import CommandParser
+
+from ...transport.asynchronous.worker import WebhookDeliveryWorker
+
+
+class Command(BaseCommand):
+    help = (
+        "Send pending async webhook deliveries concurrently from an asyncio event "
+        "loop. Requires WEBHOOK_DELIVERY_WORKER_ENABLED, so deliveries aren't sent "
+        "by Celery tasks."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            help="Maximum number of deliveries sent at the same time. "
+            "Defaults to WEBHOOK_WORKER_CONCURRENCY.",
+        )
+        parser.add_argument(
+            "--host-concurrency",
+            type=int,
+            help="Maximum number of deliveries sent to one host at the same time. "
+            "Defaults to WEBHOOK_WORKER_HOST_CONCURRENCY.",
+        )
+
+    def handle(self, **options):
+        if not settings.WEBHOOK_DELIVERY_WORKER_ENABLED:
+            raise CommandError(
+                "Deliveries are sent by Celery tasks, "
+                "set WEBHOOK_DELIVERY_WORKER_ENABLED to use the worker."
+            )
+        worker = WebhookDeliveryWorker(
+            concurrency=options["concurrency"],
+            host_concurrency=options["host_concurrency"],
+        )
+        asyncio.run(self.run_worker(worker))
+
+    async def run_worker(self, worker: WebhookDeliveryWorker):
+        loop = asyncio.get_running_loop()
+        for signum in [signal.SIGINT, signal.SIGTERM]:
+            loop.add_signal_handler(signum, worker.stop)
+        await worker.run()
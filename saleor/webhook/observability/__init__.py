@@ -5,9 +5,11 @@ from .tracing import opentracing_trace
 from .utils import (
     WebhookData,
     get_buffer_name,
+    get_current_api_call,
     get_webhooks,
     pop_events_with_remaining_size,
     report_api_call,
+    report_api_call_from_thread,
     report_event_delivery_attempt,
     report_gql_operation,
     report_view,
@@ -21,8 +23,10 @@ __all__ = [
     "dump_payload",
     "WebhookData",
     "get_buffer_name",
+    "get_current_api_call",
     "get_webhooks",
     "report_api_call",
+    "report_api_call_from_thread",
     "report_gql_operation",
     "report_event_delivery_attempt",
     "task_next_retry_date",
@@ -89,6 +89,20 @@ def serialize_headers(headers: Optional[Dict[str, str]]) -> HttpHeaders:
     return []
 
 
+def get_gql_operation_result_with_stats(
+    operation: "GraphQLOperationResponse",
+) -> Optional[Dict]:
+    stats = {}
+    if operation.resolver_stats:
+        stats["resolverStats"] = operation.resolver_stats
+    if operation.sql_stats:
+        stats["sqlStats"] = operation.sql_stats
+    if not stats or not operation.result:
+        return operation.result
+    extensions = operation.result.get("extensions") or {}
+    return {**operation.result, "extensions": {**extensions, **stats}}
+
+
 def serialize_gql_operation_result(
     operation: "GraphQLOperationResponse", bytes_limit: int
 ) -> Tuple[GraphQLOperation, int]:
@@ -118,7 +132,9 @@ def serialize_gql_operation_result(
         ):
             payload["operation_type"] = definition.operation
     if operation.result:
-        result = JsonTruncText.truncate(pretty_json(operation.result), bytes_limit)
+        result = JsonTruncText.truncate(
+            pretty_json(get_gql_operation_result_with_stats(operation)), bytes_limit
+        )
         bytes_limit -= result.byte_size
         payload["result"] = result
     return payload, max(0, bytes_limit)
@@ -94,6 +94,23 @@ def test_serialize_gql_operation_result(gql_operation_factory):
     assert len(dump_payload(payload)) <= bytes_limit
 
 
+def test_serialize_gql_operation_result_with_stats(gql_operation_factory):
+    bytes_limit = 1024
+    query = "query FirstQuery { shop { name } }"
+    result = {"data": "result"}
+    operation_result = gql_operation_factory(query, "FirstQuery", None, result)
+    stats = {"fields": [{"field": "Query.shop", "count": 1, "totalMs": 0.1}]}
+    sql_stats = {"count": 2, "totalMs": 1.5, "duplicates": 0}
+    operation_result.resolver_stats = stats
+    operation_result.sql_stats = sql_stats
+    payload, _ = serialize_gql_operation_result(operation_result, bytes_limit)
+    expected_result = {
+        "data": "result",
+        "extensions": {"resolverStats": stats, "sqlStats": sql_stats},
+    }
+    assert payload["result"] == JsonTruncText(pretty_json(expected_result), False)
+
+
 def test_serialize_gql_operation_result_when_no_operation_data():
     bytes_limit = 1024
     result = GraphQLOperationResponse()
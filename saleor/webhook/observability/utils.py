@@ -120,6 +120,8 @@ class GraphQLOperationResponse:
     variables: Optional[Dict] = None
     result: Optional[Dict] = None
     result_invalid: bool = False
+    resolver_stats: Optional[Dict] = None
+    sql_stats: Optional[Dict] = None
 
 
 class ApiCall:
@@ -163,6 +165,25 @@ def report_api_call(request: "HttpRequest") -> Generator[ApiCall, None, None]:
         del _context.api_call
 
 
+def get_current_api_call() -> Optional[ApiCall]:
+    return getattr(_context, "api_call", None)
+
+
+@contextmanager
+def report_api_call_from_thread(
+    api_call: Optional[ApiCall],
+) -> Generator[None, None, None]:
+    """Attach GraphQL operations reported in a worker thread to the API call."""
+    if api_call is None or hasattr(_context, "api_call"):
+        yield
+        return
+    _context.api_call = api_call
+    try:
+        yield
+    finally:
+        del _context.api_call
+
+
 @contextmanager
 def report_gql_operation() -> Generator[GraphQLOperationResponse, None, None]:
     root = False
@@ -0,0 +1,86 @@
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from ..app.models import App
+from ..core.utils.cache_version import get_cache_version, invalidate_cache_version
+from .models import WebhookEvent
+
+WEBHOOKS_REGISTRY_VERSION_KEY = "webhooks-registry-version"
+
+
+class WebhookSubscription(NamedTuple):
+    webhook_id: int
+    app_id: int
+    app_identifier: Optional[str]
+    app_permissions: FrozenSet[str]
+
+
+WebhooksRegistry = Dict[str, List[WebhookSubscription]]
+
+_registry: Optional[Tuple[int, WebhooksRegistry]] = None
+
+
+def get_webhooks_registry_version() -> Optional[int]:
+    return get_cache_version(WEBHOOKS_REGISTRY_VERSION_KEY)
+
+
+def invalidate_webhooks_registry():
+    """Reload the webhook subscriptions in all processes after changes."""
+    invalidate_cache_version(WEBHOOKS_REGISTRY_VERSION_KEY)
+
+
+def load_webhooks_registry() -> WebhooksRegistry:
+    """Map event types to the active webhooks of active apps subscribed to them."""
+    # Don't read from the replica, as stale subscriptions would be kept until
+    # the next change.
+    app_permissions: Dict[int, set] = defaultdict(set)
+    for app_id, app_label, codename in App.permissions.through.objects.filter(
+        app__is_active=True
+    ).values_list(
+        "app_id", "permission__content_type__app_label", "permission__codename"
+    ):
+        app_permissions[app_id].add(f"{app_label}.{codename}")
+
+    registry: WebhooksRegistry = defaultdict(list)
+    webhook_events = (
+        WebhookEvent.objects.filter(
+            webhook__is_active=True, webhook__app__is_active=True
+        )
+        .order_by("webhook_id")
+        .values_list(
+            "event_type", "webhook_id", "webhook__app_id", "webhook__app__identifier"
+        )
+    )
+    for event_type, webhook_id, app_id, app_identifier in webhook_events:
+        registry[event_type].append(
+            WebhookSubscription(
+                webhook_id=webhook_id,
+                app_id=app_id,
+                app_identifier=app_identifier,
+                app_permissions=frozenset(app_permissions[app_id]),
+            )
+        )
+    return dict(registry)
+
+
+def get_webhooks_registry() -> Optional[WebhooksRegistry]:
+    """Return the registry loaded at the current version of webhook subscriptions.
+
+    Return `None` when the version can't be stored in the cache.
+    """
+    global _registry
+
+    version = get_webhooks_registry_version()
+    if version is None:
+        return None
+    if _registry is not None and _registry[0] == version:
+        return _registry[1]
+    registry = load_webhooks_registry()
+    _registry = (version, registry)
+    return registry
+
+
+def clear_webhooks_registry():
+    global _registry
+
+    _registry = None
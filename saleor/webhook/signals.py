@@ -0,0 +1,10 @@
+from .registry import invalidate_webhooks_registry
+
+
+def invalidate_webhooks_registry_on_change(sender, **kwargs):
+    invalidate_webhooks_registry()
+
+
+def invalidate_webhooks_registry_on_permissions_change(sender, action, **kwargs):
+    if action in ["post_add", "post_remove", "post_clear"]:
+        invalidate_webhooks_registry()
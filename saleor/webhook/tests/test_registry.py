@@ -0,0 +1,135 @@
+import pytest
+from django.core.cache import cache
+
+from ...app.models import App
+from ..event_types import WebhookEventAsyncType, WebhookEventSyncType
+from ..models import Webhook
+from ..registry import clear_webhooks_registry
+from ..utils import get_webhooks_for_event
+
+
+@pytest.fixture
+def webhooks_registry_enabled(settings):
+    settings.WEBHOOKS_REGISTRY_ENABLED = True
+    clear_webhooks_registry()
+    cache.clear()
+    yield settings
+    clear_webhooks_registry()
+    cache.clear()
+
+
+@pytest.fixture
+def order_app_factory(db, permission_manage_orders):
+    def create_app(event_type=WebhookEventAsyncType.ORDER_CREATED, identifier=None):
+        app = App.objects.create(name="Order App", identifier=identifier)
+        app.permissions.add(permission_manage_orders)
+        webhook = Webhook.objects.create(name="order-webhook", app=app)
+        webhook.events.create(event_type=event_type)
+        return app, webhook
+
+    return create_app
+
+
+def test_get_webhooks_for_event_without_subscribers_from_registry(
+    webhooks_registry_enabled, order_app_factory, django_assert_num_queries
+):
+    # given
+    order_app_factory()
+    get_webhooks_for_event(WebhookEventAsyncType.ORDER_CREATED)
+
+    # when
+    with django_assert_num_queries(0):
+        webhooks = get_webhooks_for_event(WebhookEventAsyncType.ORDER_UPDATED)
+        webhooks = list(webhooks)
+
+    # then
+    assert webhooks == []
+
+
+def test_get_webhooks_for_event_from_registry(
+    webhooks_registry_enabled, order_app_factory
+):
+    # given
+    _, webhook = order_app_factory()
+    _, any_webhook = order_app_factory(event_type=WebhookEventAsyncType.ANY)
+    order_app_factory(event_type=WebhookEventAsyncType.ORDER_UPDATED)
+
+    # when
+    webhooks = get_webhooks_for_event(WebhookEventAsyncType.ORDER_CREATED)
+
+    # then
+    assert list(webhooks) == [webhook, any_webhook]
+
+
+def test_get_webhooks_for_event_from_registry_filters_apps(
+    webhooks_registry_enabled, order_app_factory
+):
+    # given
+    app, webhook = order_app_factory(identifier="app.a")
+    _, other_webhook = order_app_factory(identifier="app.b")
+
+    # when
+    by_id = get_webhooks_for_event(
+        WebhookEventAsyncType.ORDER_CREATED, apps_ids=[app.id]
+    )
+    by_identifier = get_webhooks_for_event(
+        WebhookEventAsyncType.ORDER_CREATED, apps_identifier=["app.b"]
+    )
+
+    # then
+    assert list(by_id) == [webhook]
+    assert list(by_identifier) == [other_webhook]
+
+
+def test_get_webhooks_for_event_from_registry_requires_permission(
+    webhooks_registry_enabled, order_app_factory
+):
+    # given
+    order_app_factory(event_type=WebhookEventSyncType.PAYMENT_AUTHORIZE)
+
+    # when
+    webhooks = get_webhooks_for_event(WebhookEventSyncType.PAYMENT_AUTHORIZE)
+
+    # then
+    assert list(webhooks) == []
+
+
+def test_webhooks_registry_reloaded_after_changes(
+    webhooks_registry_enabled, order_app_factory, permission_manage_payments
+):
+    # given
+    app, webhook = order_app_factory()
+    event_type = WebhookEventSyncType.PAYMENT_AUTHORIZE
+    assert list(get_webhooks_for_event(event_type)) == []
+
+    # when
+    webhook.events.create(event_type=event_type)
+    app.permissions.add(permission_manage_payments)
+
+    # then
+    assert list(get_webhooks_for_event(event_type)) == [webhook]
+
+    # when
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # then
+    assert list(get_webhooks_for_event(event_type)) == []
+
+
+def test_get_webhooks_for_event_from_stale_registry(
+    webhooks_registry_enabled, order_app_factory
+):
+    # given
+    _, webhook = order_app_factory()
+    _, other_webhook = order_app_factory()
+    get_webhooks_for_event(WebhookEventAsyncType.ORDER_CREATED)
+
+    # when
+    # Updates don't send signals, so the registry isn't reloaded.
+    Webhook.objects.filter(pk=webhook.pk).update(is_active=False)
+    App.objects.filter(pk=other_webhook.app_id).update(is_active=False)
+    webhooks = get_webhooks_for_event(WebhookEventAsyncType.ORDER_CREATED)
+
+    # then
+    assert list(webhooks) == []
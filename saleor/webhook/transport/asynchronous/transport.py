@@ -1,47 +1,69 @@
 import json
 import logging
-from typing import TYPE_CHECKING, Any, List, Sequence
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 from celery import group
+from celery.exceptions import MaxRetriesExceededError, Retry
 from celery.utils.log import get_task_logger
+from django.apps import apps
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Model
 
+from ....account.models import User
+from ....app.models import App
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
-from ....core.models import EventDelivery, EventPayload
+from ....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ....core.tracing import webhooks_opentracing_trace
 from ....core.utils import get_domain
+from ....core.utils.events import call_event
+from ....graphql.core import SaleorContext
 from ....graphql.webhook.subscription_payload import (
     generate_payload_from_subscription,
     initialize_request,
+    is_payload_shared_by_apps,
 )
 from ....graphql.webhook.subscription_types import WEBHOOK_TYPES_MAP
 from ... import observability
 from ...event_types import WebhookEventAsyncType, WebhookEventSyncType
+from ...models import Webhook
 from ...observability import WebhookData
 from ..utils import (
+    ATTEMPT_RESPONSE_FIELDS,
     WebhookResponse,
     WebhookSchemes,
     attempt_update,
+    clear_successful_deliveries,
     clear_successful_delivery,
     create_attempt,
+    create_attempts,
     delivery_update,
+    get_deliveries_for_webhooks,
     get_delivery_for_webhook,
     handle_webhook_retry,
     send_webhook_using_scheme_method,
+    send_webhooks_using_scheme_method,
+    set_attempt_response,
 )
 
-if TYPE_CHECKING:
-    from ....webhook.models import Webhook
-
-
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(__name__)
 
 
 def create_deliveries_for_subscriptions(
-    event_type, subscribable_object, webhooks, requestor=None
+    event_type,
+    subscribable_object,
+    webhooks,
+    requestor=None,
+    allow_replica=True,
+    requests: Optional[Dict[FrozenSet[int], SaleorContext]] = None,
 ) -> List[EventDelivery]:
     """Create a list of event deliveries with payloads based on subscription query.
 
@@ -52,6 +74,9 @@ def create_deliveries_for_subscriptions(
     :param subscribable_object: subscribable object to process via subscription query.
     :param webhooks: sequence of async webhooks.
     :param requestor: used in subscription webhooks to generate meta data for payload.
+    :param allow_replica: whether payloads can be generated from the replica database.
+    :param requests: contexts by app permissions, to share them between events with
+        the same requestor.
     :return: List of event deliveries to send via webhook tasks.
     """
     if event_type not in WEBHOOK_TYPES_MAP:
@@ -60,38 +85,70 @@ def create_deliveries_for_subscriptions(
         )
         return []
 
-    event_payloads = []
-    event_deliveries = []
+    # Apps with the same permissions share the context, so the data is loaded
+    # once for all of them, and webhooks with the same query share the payload.
+    if requests is None:
+        requests = {}
+    payloads: Dict[Tuple[FrozenSet[int], str, Optional[int]], Optional[str]] = {}
+    webhook_payload_keys = []
     for webhook in webhooks:
-        data = generate_payload_from_subscription(
-            event_type=event_type,
-            subscribable_object=subscribable_object,
-            subscription_query=webhook.subscription_query,
-            request=initialize_request(
-                requestor,
-                event_type in WebhookEventSyncType.ALL,
+        app_permissions = get_app_permissions_key(webhook.app)
+        query = webhook.subscription_query
+        app_id = None if is_payload_shared_by_apps(query) else webhook.app_id
+        payload_key = (app_permissions, query, app_id)
+        if payload_key not in payloads:
+            request = requests.get(app_permissions)
+            if request is None:
+                request = requests[app_permissions] = initialize_request(
+                    requestor,
+                    event_type in WebhookEventSyncType.ALL,
+                    allow_replica,
+                    event_type=event_type,
+                    share_dataloaders=True,
+                )
+            data = generate_payload_from_subscription(
                 event_type=event_type,
-            ),
-            app=webhook.app,
-        )
-        if not data:
+                subscribable_object=subscribable_object,
+                subscription_query=query,
+                request=request,
+                app=webhook.app,
+            )
+            payloads[payload_key] = json.dumps({**data}) if data else None
+        if not payloads[payload_key]:
             logger.info(
                 "No payload was generated with subscription for event: %s" % event_type
             )
             continue
-        event_payload = EventPayload(payload=json.dumps({**data}))
-        event_payloads.append(event_payload)
-        event_deliveries.append(
-            EventDelivery(
-                status=EventDeliveryStatus.PENDING,
-                event_type=event_type,
-                payload=event_payload,
-                webhook=webhook,
+        webhook_payload_keys.append((webhook, payload_key))
+
+    payload_keys = [key for key, payload in payloads.items() if payload]
+    with transaction.atomic():
+        # Payloads with the same content, e.g. generated for apps with other
+        # permissions, are stored once.
+        event_payloads = dict(
+            zip(
+                payload_keys,
+                EventPayload.objects.create_with_payloads(
+                    [payloads[key] for key in payload_keys]  # type: ignore[misc]
+                ),
             )
         )
+        return EventDelivery.objects.bulk_create(
+            [
+                EventDelivery(
+                    status=EventDeliveryStatus.PENDING,
+                    event_type=event_type,
+                    payload=event_payloads[payload_key],
+                    webhook=webhook,
+                )
+                for webhook, payload_key in webhook_payload_keys
+            ]
+        )
+
 
-    EventPayload.objects.bulk_create(event_payloads)
-    return EventDelivery.objects.bulk_create(event_deliveries)
+def get_app_permissions_key(app: "App") -> FrozenSet[int]:
+    # Uses permissions prefetched with webhooks by `get_webhooks_for_event`.
+    return frozenset(permission.pk for permission in app.permissions.all())
 
 
 def group_webhooks_by_subscription(webhooks):
@@ -147,15 +204,20 @@ def trigger_webhooks_async(
         elif data is None:
             raise NotImplementedError("No payload was provided for regular webhooks.")
 
-        payload = EventPayload.objects.create(payload=data)
-        deliveries.extend(
-            create_event_delivery_list_for_webhooks(
-                webhooks=regular_webhooks,
-                event_payload=payload,
-                event_type=event_type,
+        with transaction.atomic():
+            payload = EventPayload.objects.create_with_payload(data)
+            deliveries.extend(
+                create_event_delivery_list_for_webhooks(
+                    webhooks=regular_webhooks,
+                    event_payload=payload,
+                    event_type=event_type,
+                )
             )
+    if subscription_webhooks and is_payload_deferred(event_type, subscribable_object):
+        defer_subscription_payloads(
+            event_type, subscribable_object, subscription_webhooks, requestor
         )
-    if subscription_webhooks:
+    elif subscription_webhooks:
         deliveries.extend(
             create_deliveries_for_subscriptions(
                 event_type=event_type,
@@ -165,8 +227,161 @@ def trigger_webhooks_async(
             )
         )
 
-    for delivery in deliveries:
-        send_webhook_request_async.delay(delivery.id)
+    send_webhook_requests(deliveries)
+
+
+_deferred_payloads = threading.local()
+
+
+def is_payload_deferred(event_type: str, subscribable_object) -> bool:
+    """Return whether subscription payloads of the event are generated by workers.
+
+    Workers load the object again, so payloads reflect its state when the task
+    runs, not at the time of the event. Only update events are deferred, as every
+    later change triggers the event again and the payload of the last one shows
+    the final state. Other events, like creations, status changes or deletions,
+    always get a snapshot generated when the event is triggered.
+    """
+    return (
+        event_type in settings.WEBHOOK_DEFERRED_PAYLOAD_EVENTS
+        and event_type in WebhookEventAsyncType.ALL
+        and event_type.endswith("_updated")
+        and isinstance(subscribable_object, Model)
+        and not subscribable_object._state.adding
+        and subscribable_object.pk is not None
+    )
+
+
+def get_requestor_reference(requestor) -> Optional[Tuple[str, int]]:
+    if isinstance(requestor, App):
+        return ("app", requestor.pk)
+    if isinstance(requestor, User):
+        return ("user", requestor.pk)
+    return None
+
+
+def defer_subscription_payloads(
+    event_type: str, subscribable_object: Model, webhooks, requestor=None
+):
+    """Record a reference to the event, to generate its payloads in a Celery task."""
+    reference = {
+        "model": subscribable_object._meta.label,
+        # Primary keys like UUIDs are sent as strings.
+        "pk": str(subscribable_object.pk),
+        "webhooks": [webhook.pk for webhook in webhooks],
+        "requestor": get_requestor_reference(requestor),
+    }
+    # Events triggered in a transaction are recorded when it's committed, so the
+    # worker can load the object.
+    call_event(record_deferred_payloads, event_type, reference)
+
+
+def record_deferred_payloads(event_type: str, reference: Dict[str, Any]):
+    events = getattr(_deferred_payloads, "events", None)
+    if events is None:
+        schedule_deferred_payloads(event_type, [reference])
+    else:
+        events[event_type].append(reference)
+
+
+@contextmanager
+def batch_deferred_payloads():
+    """Generate deferred payloads of events triggered in the block in batches.
+
+    Events are scheduled when the block exits, with one task per event type and
+    batch of `WEBHOOK_DEFERRED_PAYLOADS_BATCH_SIZE` events.
+    """
+    if getattr(_deferred_payloads, "events", None) is not None:
+        # Events are scheduled by the outermost block.
+        yield
+        return
+    events: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    _deferred_payloads.events = events
+    try:
+        yield
+    finally:
+        _deferred_payloads.events = None
+        for event_type, references in events.items():
+            schedule_deferred_payloads(event_type, references)
+
+
+def schedule_deferred_payloads(event_type: str, references: List[Dict[str, Any]]):
+    batch_size = max(settings.WEBHOOK_DEFERRED_PAYLOADS_BATCH_SIZE, 1)
+    for index in range(0, len(references), batch_size):
+        generate_deferred_payloads_task.delay(
+            event_type, references[index : index + batch_size]
+        )
+
+
+def _load_requestors(references: List[Dict[str, Any]]) -> Dict[Tuple[str, int], Any]:
+    ids: Dict[str, set] = defaultdict(set)
+    for reference in references:
+        if reference["requestor"]:
+            requestor_type, requestor_id = reference["requestor"]
+            ids[requestor_type].add(requestor_id)
+    requestors: Dict[Tuple[str, int], Any] = {}
+    for requestor_type, model in [("app", App), ("user", User)]:
+        if ids[requestor_type]:
+            for pk, requestor in model.objects.in_bulk(ids[requestor_type]).items():
+                requestors[(requestor_type, pk)] = requestor
+    return requestors
+
+
+@app.task(queue=settings.WEBHOOK_PAYLOADS_CELERY_QUEUE_NAME)
+def generate_deferred_payloads_task(event_type: str, references: List[Dict[str, Any]]):
+    """Create deliveries of subscription webhooks for the deferred events."""
+    webhook_ids = {pk for reference in references for pk in reference["webhooks"]}
+    webhooks = (
+        Webhook.objects.filter(id__in=webhook_ids, is_active=True, app__is_active=True)
+        .select_related("app")
+        .prefetch_related("app__permissions__content_type")
+        .in_bulk()
+    )
+    object_ids: Dict[str, set] = defaultdict(set)
+    for reference in references:
+        object_ids[reference["model"]].add(reference["pk"])
+    objects = {
+        label: {
+            str(pk): instance
+            for pk, instance in apps.get_model(label).objects.in_bulk(pks).items()
+        }
+        for label, pks in object_ids.items()
+    }
+    requestors = _load_requestors(references)
+
+    # Events of the same requestor share contexts, so dataloaders are reused.
+    requests: Dict[Any, Dict[FrozenSet[int], SaleorContext]] = defaultdict(dict)
+    deliveries = []
+    for reference in references:
+        subscribable_object = objects[reference["model"]].get(reference["pk"])
+        if subscribable_object is None:
+            task_logger.info(
+                "Skipping deferred payloads of %s. %s %s no longer exists.",
+                event_type,
+                reference["model"],
+                reference["pk"],
+            )
+            continue
+        requestor_key = tuple(reference["requestor"] or ())
+        event_webhooks = [
+            webhooks[pk] for pk in reference["webhooks"] if pk in webhooks
+        ]
+        if not event_webhooks:
+            continue
+        deliveries.extend(
+            create_deliveries_for_subscriptions(
+                event_type,
+                subscribable_object,
+                event_webhooks,
+                requestor=requestors.get(requestor_key),
+                # Changes committed right before the task could be missing on
+                # the replica.
+                allow_replica=False,
+                requests=requests[requestor_key],
+            )
+        )
+
+    send_webhook_requests(deliveries)
 
 
 @app.task(
@@ -221,6 +436,161 @@ def send_webhook_request_async(self, event_delivery_id):
     clear_successful_delivery(delivery)
 
 
+def send_webhook_requests(deliveries: List[EventDelivery]):
+    """Schedule sending the deliveries, in batches of one event when enabled."""
+    if settings.WEBHOOK_DELIVERY_WORKER_ENABLED:
+        # Pending deliveries are pulled by the `webhook_delivery_worker` command.
+        return
+    delivery_ids = [delivery.id for delivery in deliveries]
+    batch_size = settings.WEBHOOK_DELIVERY_BATCH_SIZE
+    if batch_size <= 1:
+        for delivery_id in delivery_ids:
+            send_webhook_request_async.delay(delivery_id)
+        return
+    for index in range(0, len(delivery_ids), batch_size):
+        send_webhook_requests_async.delay(delivery_ids[index : index + batch_size])
+
+
+def send_event_delivery(
+    delivery: EventDelivery, domain: str
+) -> Tuple[WebhookResponse, bool]:
+    """Send the payload of the delivery without touching the database.
+
+    Return the response and whether the delivery can be retried after a failure.
+    """
+    webhook = delivery.webhook
+    try:
+        if not delivery.payload:
+            raise ValueError("Event delivery id: %r has no payload." % delivery.id)
+        with webhooks_opentracing_trace(delivery.event_type, domain, app=webhook.app):
+            response = send_webhook_using_scheme_method(
+                webhook.target_url,
+                domain,
+                webhook.secret_key,
+                delivery.event_type,
+                delivery.payload.payload,
+                webhook.custom_headers,
+            )
+    except ValueError as e:
+        return WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED), False
+    except Exception as e:
+        # An unexpected error of one delivery doesn't abort the rest of the batch,
+        # the delivery is retried as any other failed request.
+        task_logger.exception("Failed to send event delivery id: %r.", delivery.id)
+        return WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED), True
+    return response, True
+
+
+_delivery_executor: Optional[Tuple[int, ThreadPoolExecutor]] = None
+_delivery_executor_lock = threading.Lock()
+
+
+def get_delivery_executor() -> ThreadPoolExecutor:
+    """Return the thread pool sending batched deliveries, shared by the process.
+
+    Its threads are kept between tasks, so each of them reuses its pooled HTTP
+    session. Threads aren't inherited by forked workers, which create their own pool.
+    """
+    global _delivery_executor
+
+    pid = os.getpid()
+    with _delivery_executor_lock:
+        if _delivery_executor is None or _delivery_executor[0] != pid:
+            executor = ThreadPoolExecutor(
+                max_workers=max(settings.WEBHOOK_DELIVERY_CONCURRENCY, 1),
+                thread_name_prefix="webhook-delivery",
+            )
+            _delivery_executor = (pid, executor)
+        return _delivery_executor[1]
+
+
+@app.task(
+    queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
+    bind=True,
+    retry_backoff=10,
+    retry_kwargs={"max_retries": 5},
+)
+def send_webhook_requests_async(self, event_delivery_ids):
+    """Send many deliveries at once, retrying only the failed ones."""
+    deliveries = get_deliveries_for_webhooks(event_delivery_ids)
+    if not deliveries:
+        return None
+
+    domain = get_domain()
+    attempts = create_attempts(deliveries, self.request.id)
+    results = list(
+        get_delivery_executor().map(
+            lambda delivery: send_event_delivery(delivery, domain), deliveries
+        )
+    )
+
+    successful, failed, retried = [], [], []
+    for delivery, attempt, (response, can_retry) in zip(deliveries, attempts, results):
+        set_attempt_response(attempt, response)
+        webhook = delivery.webhook
+        if response.status == EventDeliveryStatus.SUCCESS:
+            task_logger.info(
+                "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+                webhook.id,
+                webhook.target_url,
+                delivery.event_type,
+                delivery.id,
+            )
+            delivery.status = EventDeliveryStatus.SUCCESS
+            successful.append(delivery)
+        elif can_retry:
+            task_logger.info(
+                "[Webhook ID: %r] Failed request to %r: %r for event: %r."
+                " Delivery attempt id: %r",
+                webhook.id,
+                webhook.target_url,
+                response.content,
+                delivery.event_type,
+                attempt.id,
+            )
+            retried.append(delivery)
+        else:
+            failed.append(delivery)
+    EventDeliveryAttempt.objects.bulk_update(attempts, ATTEMPT_RESPONSE_FIELDS)
+
+    retry_error = None
+    next_retry = None
+    if retried:
+        try:
+            countdown = self.retry_backoff * (2**self.request.retries)
+            self.retry(
+                args=([delivery.id for delivery in retried],),
+                countdown=countdown,
+                **self.retry_kwargs,
+            )
+        except Retry as error:
+            retry_error = error
+            next_retry = observability.task_next_retry_date(error)
+        except MaxRetriesExceededError:
+            task_logger.info(
+                "Failed requests exceeded retry limit. Delivery ids: %r",
+                [delivery.id for delivery in retried],
+            )
+            failed.extend(retried)
+            retried = []
+
+    if failed:
+        EventDelivery.objects.filter(
+            id__in=[delivery.id for delivery in failed]
+        ).update(status=EventDeliveryStatus.FAILED)
+        for delivery in failed:
+            delivery.status = EventDeliveryStatus.FAILED
+    retried_ids = {delivery.id for delivery in retried}
+    for attempt in attempts:
+        observability.report_event_delivery_attempt(
+            attempt, next_retry if attempt.delivery_id in retried_ids else None
+        )
+    if successful:
+        clear_successful_deliveries(successful)
+    if retry_error:
+        raise retry_error
+
+
 def send_observability_events(webhooks: List[WebhookData], events: List[Any]):
     event_type = WebhookEventAsyncType.OBSERVABILITY
     for webhook in webhooks:
@@ -233,16 +603,21 @@ def send_observability_events(webhooks: List[WebhookData], events: List[Any]):
         }
         try:
             if scheme in [WebhookSchemes.AWS_SQS, WebhookSchemes.GOOGLE_CLOUD_PUBSUB]:
-                for event in events:
-                    response = send_webhook_using_scheme_method(
-                        webhook.target_url,
-                        webhook.saleor_domain,
-                        webhook.secret_key,
-                        event_type,
-                        observability.dump_payload(event),
-                    )
-                    if response.status == EventDeliveryStatus.FAILED:
-                        failed += 1
+                responses = send_webhooks_using_scheme_method(
+                    webhook.target_url,
+                    webhook.saleor_domain,
+                    webhook.secret_key,
+                    event_type,
+                    [observability.dump_payload(event) for event in events],
+                )
+                failed_responses = [
+                    response
+                    for response in responses
+                    if response.status == EventDeliveryStatus.FAILED
+                ]
+                if failed_responses:
+                    failed = len(failed_responses)
+                    response = failed_responses[-1]
             else:
                 response = send_webhook_using_scheme_method(
                     webhook.target_url,
@@ -0,0 +1,264 @@
+import asyncio
+import logging
+import os
+import socket
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Count, Exists, OuterRef
+from django.utils import timezone
+
+from ....core import EventDeliveryStatus
+from ....core.models import EventDelivery, EventDeliveryAttempt
+from ....core.utils import get_domain
+from ... import observability
+from ...event_types import WebhookEventAsyncType
+from ..utils import (
+    WebhookResponse,
+    attempt_update,
+    clear_successful_delivery,
+    create_attempt,
+    create_attempts,
+    delivery_update,
+    get_deliveries_for_webhooks,
+)
+from .transport import send_event_delivery
+
+logger = logging.getLogger(__name__)
+
+# Same retry policy as `send_webhook_request_async`.
+RETRY_BACKOFF = 10
+MAX_RETRIES = 5
+
+
+class ClaimedDelivery(NamedTuple):
+    delivery: EventDelivery
+    attempt: EventDeliveryAttempt
+    retries: int
+
+
+def get_retry_countdown(retries: int) -> int:
+    return RETRY_BACKOFF * (2**retries)
+
+
+def claim_event_deliveries(limit: int, worker_id: str) -> List[ClaimedDelivery]:
+    """Claim pending deliveries of async events not claimed by other workers.
+
+    Deliveries of sync events, including transaction requests, are sent by the
+    request or task creating them, so they are never claimed. A pending attempt
+    created by the worker marks the delivery as claimed until `WEBHOOK_WORKER_LEASE`
+    passes. Pending attempts of expired claims are failed.
+    """
+    lease_start = timezone.now() - settings.WEBHOOK_WORKER_LEASE
+    claimed_attempts = EventDeliveryAttempt.objects.filter(
+        delivery=OuterRef("pk"),
+        status=EventDeliveryStatus.PENDING,
+        created_at__gt=lease_start,
+    )
+    with transaction.atomic():
+        delivery_ids = list(
+            EventDelivery.objects.select_for_update(skip_locked=True)
+            .filter(
+                ~Exists(claimed_attempts),
+                status=EventDeliveryStatus.PENDING,
+                event_type__in=WebhookEventAsyncType.ALL,
+            )
+            .order_by("created_at")
+            .values_list("id", flat=True)[:limit]
+        )
+        if not delivery_ids:
+            return []
+        deliveries = get_deliveries_for_webhooks(delivery_ids)
+        EventDeliveryAttempt.objects.filter(
+            delivery_id__in=delivery_ids, status=EventDeliveryStatus.PENDING
+        ).update(status=EventDeliveryStatus.FAILED, response="Delivery lease expired.")
+        retries = dict(
+            EventDeliveryAttempt.objects.filter(delivery_id__in=delivery_ids)
+            .order_by()
+            .values_list("delivery_id")
+            .annotate(Count("id"))
+        )
+        attempts = create_attempts(deliveries, worker_id)
+    return [
+        ClaimedDelivery(delivery, attempt, retries.get(delivery.id, 0))
+        for delivery, attempt in zip(deliveries, attempts)
+    ]
+
+
+def record_delivery_attempt(
+    claimed: ClaimedDelivery,
+    response: WebhookResponse,
+    can_retry: bool,
+    worker_id: str,
+) -> Optional[ClaimedDelivery]:
+    """Save the attempt and return the next attempt when the delivery is retried."""
+    delivery, attempt, retries = claimed
+    webhook = delivery.webhook
+    attempt_update(attempt, response)
+    if response.status == EventDeliveryStatus.SUCCESS:
+        logger.info(
+            "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+            webhook.id,
+            webhook.target_url,
+            delivery.event_type,
+            delivery.id,
+        )
+        delivery_update(delivery, EventDeliveryStatus.SUCCESS)
+        observability.report_event_delivery_attempt(attempt)
+        clear_successful_delivery(delivery)
+        return None
+
+    logger.info(
+        "[Webhook ID: %r] Failed request to %r: %r for event: %r."
+        " Delivery attempt id: %r",
+        webhook.id,
+        webhook.target_url,
+        response.content,
+        delivery.event_type,
+        attempt.id,
+    )
+    if can_retry and retries < MAX_RETRIES:
+        next_retry = timezone.now() + timedelta(seconds=get_retry_countdown(retries))
+        observability.report_event_delivery_attempt(attempt, next_retry)
+        # The next attempt keeps the delivery claimed until it is retried.
+        next_attempt = create_attempt(delivery, worker_id)
+        return ClaimedDelivery(delivery, next_attempt, retries + 1)
+
+    delivery_update(delivery, EventDeliveryStatus.FAILED)
+    observability.report_event_delivery_attempt(attempt)
+    return None
+
+
+class WebhookDeliveryWorker:
+    """Send pending webhook deliveries concurrently from an asyncio event loop.
+
+    Requests are sent by the hardened HTTP client on a thread pool, so the IP
+    filter and the timeouts apply as in Celery tasks, while the event loop only
+    waits for them. The database is used by a single thread of the worker.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        host_concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        self.concurrency = concurrency or settings.WEBHOOK_WORKER_CONCURRENCY
+        self.host_concurrency = (
+            host_concurrency or settings.WEBHOOK_WORKER_HOST_CONCURRENCY
+        )
+        self.poll_interval = poll_interval or settings.WEBHOOK_WORKER_POLL_INTERVAL
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.domain = ""
+        self.sending = 0
+        self.tasks: Set[asyncio.Task] = set()
+        self.waiting_tasks: Set[asyncio.Task] = set()
+        self.host_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.host_concurrency)
+        )
+        self.send_executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="webhook-send"
+        )
+        self.db_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="webhook-db"
+        )
+        self.stopping: Optional[asyncio.Event] = None
+
+    async def run_in_db_thread(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.db_executor, partial(self._call_with_connection, func, *args)
+        )
+
+    @staticmethod
+    def _call_with_connection(func, *args):
+        close_old_connections()
+        return func(*args)
+
+    async def send(self, claimed: ClaimedDelivery) -> Tuple[WebhookResponse, bool]:
+        delivery = claimed.delivery
+        host = urlparse(delivery.webhook.target_url).netloc
+        loop = asyncio.get_running_loop()
+        # The request isn't cancelled by the event loop, as it would still be sent
+        # by its thread while the delivery is retried. The HTTP client times it out.
+        async with self.host_semaphores[host]:
+            return await loop.run_in_executor(
+                self.send_executor, send_event_delivery, delivery, self.domain
+            )
+
+    async def deliver(self, claimed: ClaimedDelivery):
+        try:
+            next_claimed: Optional[ClaimedDelivery] = claimed
+            while next_claimed:
+                claimed = next_claimed
+                response, can_retry = await self.send(claimed)
+                next_claimed = await self.run_in_db_thread(
+                    record_delivery_attempt,
+                    claimed,
+                    response,
+                    can_retry,
+                    self.worker_id,
+                )
+                if next_claimed:
+                    await self.wait_for_retry(get_retry_countdown(claimed.retries))
+        finally:
+            self.sending -= 1
+
+    async def wait_for_retry(self, countdown: int):
+        # Waiting deliveries don't count towards the concurrency of the worker.
+        task = asyncio.current_task()
+        self.sending -= 1
+        self.waiting_tasks.add(task)  # type: ignore[arg-type]
+        try:
+            await asyncio.sleep(countdown)
+        finally:
+            self.waiting_tasks.discard(task)  # type: ignore[arg-type]
+            self.sending += 1
+
+    def _task_done(self, task: asyncio.Task):
+        self.tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error("Sending webhook delivery failed.", exc_info=task.exception())
+
+    async def run(self):
+        self.stopping = asyncio.Event()
+        self.domain = await self.run_in_db_thread(get_domain)
+        logger.info("Webhook delivery worker %s started.", self.worker_id)
+        while not self.stopping.is_set():
+            free = self.concurrency - self.sending
+            claimed = []
+            if free > 0:
+                claimed = await self.run_in_db_thread(
+                    claim_event_deliveries, free, self.worker_id
+                )
+            for item in claimed:
+                self.sending += 1
+                task = asyncio.create_task(self.deliver(item))
+                self.tasks.add(task)
+                task.add_done_callback(self._task_done)
+            if len(claimed) < free or free <= 0:
+                try:
+                    await asyncio.wait_for(self.stopping.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        await self.shutdown()
+
+    def stop(self):
+        if self.stopping:
+            self.stopping.set()
+
+    async def shutdown(self):
+        # Deliveries waiting for a retry are claimed again by other workers when
+        # their lease expires.
+        for task in self.waiting_tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.send_executor.shutdown()
+        self.db_executor.shutdown()
+        logger.info("Webhook delivery worker %s stopped.", self.worker_id)
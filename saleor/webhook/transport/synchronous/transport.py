@@ -1,5 +1,8 @@
 import json
 import logging
+import math
+import time
+import uuid
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, TypeVar
 from urllib.parse import urlparse
@@ -7,6 +10,7 @@ from urllib.parse import urlparse
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
 
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
@@ -22,7 +26,12 @@ from ....payment import PaymentError
 from ....payment.models import TransactionEvent
 from ....payment.utils import create_transaction_event_from_request_and_webhook_response
 from ... import observability
-from ...const import WEBHOOK_CACHE_DEFAULT_TIMEOUT
+from ...const import (
+    WEBHOOK_CACHE_DEFAULT_TIMEOUT,
+    WEBHOOK_CACHE_LOCK_POLL_INTERVAL,
+    WEBHOOK_CACHE_LOCK_SUFFIX,
+    WEBHOOK_CACHE_LOCK_WAIT_RATIO,
+)
 from ...event_types import WebhookEventSyncType
 from ...utils import get_webhooks_for_event
 from .. import signature_for_payload
@@ -163,6 +172,38 @@ def send_webhook_request_sync(
     return response_data if response.status == EventDeliveryStatus.SUCCESS else None
 
 
+def get_timeout_seconds(timeout) -> float:
+    """Return the total time of a request timeout, given as a number or a tuple."""
+    if isinstance(timeout, tuple):
+        return sum(timeout)
+    return timeout
+
+
+def wait_for_cached_response(
+    cache_key: str, lock_key: str, timeout: float
+) -> Optional[dict]:
+    """Wait for the response cached by the request holding the lock.
+
+    Return None when the lock is released without caching the response or the
+    timeout passes.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(WEBHOOK_CACHE_LOCK_POLL_INTERVAL)
+        # The response is cached before the lock is released.
+        locked = cache.get(lock_key) is not None
+        response_data = cache.get(cache_key)
+        if response_data is not None or not locked:
+            return response_data
+    return None
+
+
+def release_cache_lock(lock_key: str, token: str):
+    """Release the lock unless it expired and was taken by another request."""
+    if cache.get(lock_key) == token:
+        cache.delete(lock_key)
+
+
 def trigger_webhook_sync_if_not_cached(
     event_type: str,
     payload: str,
@@ -177,13 +218,32 @@ def trigger_webhook_sync_if_not_cached(
 
     - Send a synchronous webhook request if cache is expired.
     - Fetch response from cache if it is still valid.
+    - Wait for the response of the same request sent by another process, instead of
+      sending it again. Send the request once when the response isn't cached in
+      part of the request timeout.
     """
 
     cache_key = generate_cache_key_for_webhook(
         cache_data, webhook.target_url, event_type, webhook.app_id
     )
     response_data = cache.get(cache_key)
-    if response_data is None:
+    if response_data is not None:
+        return response_data
+
+    lock_key = f"{cache_key}{WEBHOOK_CACHE_LOCK_SUFFIX}"
+    lock_timeout = get_timeout_seconds(request_timeout or settings.WEBHOOK_SYNC_TIMEOUT)
+    token = uuid.uuid4().hex
+    locked = cache.add(lock_key, token, timeout=math.ceil(lock_timeout))
+    if not locked:
+        response_data = wait_for_cached_response(
+            cache_key, lock_key, lock_timeout * WEBHOOK_CACHE_LOCK_WAIT_RATIO
+        )
+        if response_data is not None:
+            return response_data
+        # The lock is taken if it was released, so other requests wait for this one,
+        # but the request is sent without waiting again.
+        locked = cache.add(lock_key, token, timeout=math.ceil(lock_timeout))
+    try:
         response_data = trigger_webhook_sync(
             event_type,
             payload,
@@ -198,6 +258,9 @@ def trigger_webhook_sync_if_not_cached(
                 response_data,
                 timeout=cache_timeout or WEBHOOK_CACHE_DEFAULT_TIMEOUT,
             )
+    finally:
+        if locked:
+            release_cache_lock(lock_key, token)
     return response_data
 
 
@@ -240,13 +303,14 @@ def create_delivery_for_subscription_sync_event(
         raise PaymentError(
             f"No payload was generated with subscription for event: {event_type}"
         )
-    event_payload = EventPayload.objects.create(payload=json.dumps({**data}))
-    event_delivery = EventDelivery.objects.create(
-        status=EventDeliveryStatus.PENDING,
-        event_type=event_type,
-        payload=event_payload,
-        webhook=webhook,
-    )
+    with transaction.atomic():
+        event_payload = EventPayload.objects.create_with_payload(json.dumps({**data}))
+        event_delivery = EventDelivery.objects.create(
+            status=EventDeliveryStatus.PENDING,
+            event_type=event_type,
+            payload=event_payload,
+            webhook=webhook,
+        )
     return event_delivery
 
 
@@ -269,13 +333,14 @@ def trigger_webhook_sync(
         if not delivery:
             return None
     else:
-        event_payload = EventPayload.objects.create(payload=payload)
-        delivery = EventDelivery.objects.create(
-            status=EventDeliveryStatus.PENDING,
-            event_type=event_type,
-            payload=event_payload,
-            webhook=webhook,
-        )
+        with transaction.atomic():
+            event_payload = EventPayload.objects.create_with_payload(payload)
+            delivery = EventDelivery.objects.create(
+                status=EventDeliveryStatus.PENDING,
+                event_type=event_type,
+                payload=event_payload,
+                webhook=webhook,
+            )
 
     kwargs = {}
     if timeout:
@@ -302,7 +367,7 @@ def trigger_all_webhooks_sync(
     """
     webhooks = get_webhooks_for_event(event_type)
     request_context = None
-    event_payload = None
+    payload = None
     for webhook in webhooks:
         if webhook.subscription_query:
             if request_context is None:
@@ -323,14 +388,16 @@ def trigger_all_webhooks_sync(
             if not delivery:
                 return None
         else:
-            if event_payload is None:
-                event_payload = EventPayload.objects.create(payload=generate_payload())
-            delivery = EventDelivery.objects.create(
-                status=EventDeliveryStatus.PENDING,
-                event_type=event_type,
-                payload=event_payload,
-                webhook=webhook,
-            )
+            if payload is None:
+                payload = generate_payload()
+            with transaction.atomic():
+                event_payload = EventPayload.objects.create_with_payload(payload)
+                delivery = EventDelivery.objects.create(
+                    status=EventDeliveryStatus.PENDING,
+                    event_type=event_type,
+                    payload=event_payload,
+                    webhook=webhook,
+                )
 
         response_data = send_webhook_request_sync(delivery)
         if parsed_response := parse_response(response_data):
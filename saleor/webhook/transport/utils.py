@@ -2,9 +2,11 @@ import decimal
 import hashlib
 import json
 import logging
+import os
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from time import time
 from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import unquote, urlparse, urlunparse
@@ -14,6 +16,7 @@ from botocore.exceptions import ClientError
 from celery.exceptions import MaxRetriesExceededError, Retry
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.db import transaction
 from django.urls import reverse
 from google.cloud import pubsub_v1
 from requests import RequestException
@@ -172,21 +175,46 @@ def send_webhook_using_http(
     )
 
 
-def send_webhook_using_aws_sqs(
-    target_url, message, domain, signature, event_type, **kwargs
-):
+# Maximum number of messages and total size of messages sent by `SendMessageBatch`.
+SQS_BATCH_MAX_MESSAGES = 10
+SQS_BATCH_MAX_SIZE = 256 * 1024
+
+
+@lru_cache(maxsize=64)
+def _get_sqs_client(pid, region, access_key_id, secret_access_key):
+    return boto3.client(
+        "sqs",
+        region_name=region,
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_pubsub_publisher(pid):
+    return pubsub_v1.PublisherClient()
+
+
+def clear_webhook_clients():
+    _get_sqs_client.cache_clear()
+    _get_pubsub_publisher.cache_clear()
+
+
+def get_sqs_queue(target_url):
+    """Return the client reused for the region and credentials of the queue.
+
+    Clients are not shared between forked processes.
+    """
     parts = urlparse(target_url)
     region = "us-east-1"
     hostname_parts = parts.hostname.split(".")
     if len(hostname_parts) == 4 and hostname_parts[0] == "sqs":
         region = hostname_parts[1]
-    client = boto3.client(
-        "sqs",
-        region_name=region,
-        aws_access_key_id=parts.username,
-        aws_secret_access_key=(
-            unquote(parts.password) if parts.password else parts.password
-        ),
+    client = _get_sqs_client(
+        os.getpid(),
+        region,
+        parts.username,
+        unquote(parts.password) if parts.password else parts.password,
     )
     queue_url = urlunparse(
         (
@@ -199,7 +227,10 @@ def send_webhook_using_aws_sqs(
         )
     )
     is_fifo = parts.path.endswith(".fifo")
+    return client, queue_url, is_fifo
 
+
+def get_sqs_message_kwargs(message, domain, signature, event_type, is_fifo):
     msg_attributes = {
         "SaleorDomain": {"DataType": "String", "StringValue": domain},
         "SaleorApiUrl": {
@@ -215,12 +246,30 @@ def send_webhook_using_aws_sqs(
         }
 
     message_kwargs = {
-        "QueueUrl": queue_url,
         "MessageAttributes": msg_attributes,
         "MessageBody": message.decode("utf-8"),
     }
     if is_fifo:
         message_kwargs["MessageGroupId"] = domain
+    return message_kwargs
+
+
+def get_pubsub_publisher():
+    """Return the publisher reused for all topics.
+
+    It batches messages published to a topic at the same time.
+    """
+    return _get_pubsub_publisher(os.getpid())
+
+
+def send_webhook_using_aws_sqs(
+    target_url, message, domain, signature, event_type, **kwargs
+):
+    client, queue_url, is_fifo = get_sqs_queue(target_url)
+    message_kwargs = {
+        "QueueUrl": queue_url,
+        **get_sqs_message_kwargs(message, domain, signature, event_type, is_fifo),
+    }
     with catch_duration_time() as duration:
         try:
             response = client.send_message(**message_kwargs)
@@ -231,27 +280,129 @@ def send_webhook_using_aws_sqs(
         return WebhookResponse(content=response, duration=duration())
 
 
+def _get_sqs_entry_size(entry: dict) -> int:
+    """Return the size of the message counted against the SQS limit.
+
+    Names, data types and values of message attributes count as the body does.
+    """
+    size = len(entry["MessageBody"].encode("utf-8"))
+    for name, attribute in entry.get("MessageAttributes", {}).items():
+        size += len(name.encode("utf-8"))
+        size += len(attribute["DataType"].encode("utf-8"))
+        size += len(attribute.get("StringValue", "").encode("utf-8"))
+        size += len(attribute.get("BinaryValue", b""))
+    return size
+
+
+def _get_sqs_batches(entries):
+    batch: List[dict] = []
+    batch_size = 0
+    for entry in entries:
+        entry_size = _get_sqs_entry_size(entry)
+        if batch and (
+            len(batch) == SQS_BATCH_MAX_MESSAGES
+            or batch_size + entry_size > SQS_BATCH_MAX_SIZE
+        ):
+            yield batch
+            batch, batch_size = [], 0
+        batch.append(entry)
+        batch_size += entry_size
+    if batch:
+        yield batch
+
+
+def send_webhooks_using_aws_sqs(
+    target_url, messages, domain, signatures, event_type
+) -> List[WebhookResponse]:
+    """Send messages to the queue with `SendMessageBatch` requests."""
+    client, queue_url, is_fifo = get_sqs_queue(target_url)
+    entries = [
+        {
+            "Id": str(index),
+            **get_sqs_message_kwargs(message, domain, signature, event_type, is_fifo),
+        }
+        for index, (message, signature) in enumerate(zip(messages, signatures))
+    ]
+    responses: List[WebhookResponse] = []
+    for batch in _get_sqs_batches(entries):
+        with catch_duration_time() as duration:
+            try:
+                response = client.send_message_batch(QueueUrl=queue_url, Entries=batch)
+            except (ClientError,) as e:
+                responses.extend(
+                    WebhookResponse(
+                        content=str(e),
+                        status=EventDeliveryStatus.FAILED,
+                        duration=duration(),
+                    )
+                    for _ in batch
+                )
+                continue
+            batch_duration = duration()
+        results = {
+            result["Id"]: result
+            for result in response.get("Successful", []) + response.get("Failed", [])
+        }
+        for entry in batch:
+            result = results.get(entry["Id"], {})
+            responses.append(
+                WebhookResponse(
+                    content=result,
+                    duration=batch_duration,
+                    status=(
+                        EventDeliveryStatus.SUCCESS
+                        if "MessageId" in result
+                        else EventDeliveryStatus.FAILED
+                    ),
+                )
+            )
+    return responses
+
+
 def send_webhook_using_google_cloud_pubsub(
     target_url, message, domain, signature, event_type, **kwargs
 ):
+    (response,) = send_webhooks_using_google_cloud_pubsub(
+        target_url, [message], domain, [signature], event_type
+    )
+    return response
+
+
+def send_webhooks_using_google_cloud_pubsub(
+    target_url, messages, domain, signatures, event_type
+) -> List[WebhookResponse]:
+    """Publish messages to the topic at once, so the publisher batches them."""
     parts = urlparse(target_url)
-    client = pubsub_v1.PublisherClient()
+    client = get_pubsub_publisher()
     topic_name = parts.path[1:]  # drop the leading slash
+    api_url = build_absolute_uri(reverse("api"), domain)
+    futures: List[Any] = []
     with catch_duration_time() as duration:
-        try:
-            future = client.publish(
-                topic_name,
-                message,
-                saleorDomain=domain,
-                saleorApiUrl=build_absolute_uri(reverse("api"), domain),
-                eventType=event_type,
-                signature=signature,
-            )
-        except (pubsub_v1.publisher.exceptions.MessageTooLargeError, RuntimeError) as e:
-            return WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
+        for message, signature in zip(messages, signatures):
+            try:
+                future = client.publish(
+                    topic_name,
+                    message,
+                    saleorDomain=domain,
+                    saleorApiUrl=api_url,
+                    eventType=event_type,
+                    signature=signature,
+                )
+            except (
+                pubsub_v1.publisher.exceptions.MessageTooLargeError,
+                RuntimeError,
+            ) as e:
+                future = WebhookResponse(
+                    content=str(e), status=EventDeliveryStatus.FAILED
+                )
+            futures.append(future)
         response_duration = duration()
-        response = future.result()
-        return WebhookResponse(content=response, duration=response_duration)
+    return [
+        future
+        if isinstance(future, WebhookResponse)
+        else WebhookResponse(content=future.result(), duration=response_duration)
+        for future in futures
+    ]
 
 
 def send_webhook_using_scheme_method(
@@ -285,6 +436,29 @@ def send_webhook_using_scheme_method(
     raise ValueError("Unknown webhook scheme: %r" % (parts.scheme,))
 
 
+def send_webhooks_using_scheme_method(
+    target_url,
+    domain,
+    secret,
+    event_type,
+    data_list: List[str],
+) -> List[WebhookResponse]:
+    """Send many messages to the target, batched by queues and topics."""
+    scheme = urlparse(target_url).scheme.lower()
+    batch_scheme_matrix: Dict[WebhookSchemes, Callable] = {
+        WebhookSchemes.AWS_SQS: send_webhooks_using_aws_sqs,
+        WebhookSchemes.GOOGLE_CLOUD_PUBSUB: send_webhooks_using_google_cloud_pubsub,
+    }
+    if send_method := batch_scheme_matrix.get(scheme):
+        messages = [data.encode("utf-8") for data in data_list]
+        signatures = [signature_for_payload(message, secret) for message in messages]
+        return send_method(target_url, messages, domain, signatures, event_type)
+    return [
+        send_webhook_using_scheme_method(target_url, domain, secret, event_type, data)
+        for data in data_list
+    ]
+
+
 def handle_webhook_retry(
     celery_task, webhook, response_content, delivery, delivery_attempt
 ) -> bool:
@@ -322,6 +496,32 @@ def handle_webhook_retry(
     return is_success
 
 
+def get_deliveries_for_webhooks(event_delivery_ids) -> List["EventDelivery"]:
+    """Load deliveries in one query, failing deliveries of disabled webhooks."""
+    deliveries = EventDelivery.objects.select_related("payload", "webhook__app").filter(
+        id__in=event_delivery_ids
+    )
+    deliveries_by_id = {delivery.id: delivery for delivery in deliveries}
+    if missing_ids := set(event_delivery_ids) - deliveries_by_id.keys():
+        logger.error("Event delivery ids: %r not found", sorted(missing_ids))
+
+    disabled_ids = {
+        delivery.id
+        for delivery in deliveries_by_id.values()
+        if not delivery.webhook.is_active
+    }
+    if disabled_ids:
+        EventDelivery.objects.filter(id__in=disabled_ids).update(
+            status=EventDeliveryStatus.FAILED
+        )
+        logger.info("Event delivery ids: %r webhook is disabled.", sorted(disabled_ids))
+    return [
+        deliveries_by_id[delivery_id]
+        for delivery_id in event_delivery_ids
+        if delivery_id in deliveries_by_id and delivery_id not in disabled_ids
+    ]
+
+
 def get_delivery_for_webhook(event_delivery_id) -> Optional["EventDelivery"]:
     try:
         delivery = EventDelivery.objects.select_related("payload", "webhook__app").get(
@@ -360,7 +560,37 @@ def create_attempt(
     return attempt
 
 
-def attempt_update(
+def create_attempts(
+    deliveries: List["EventDelivery"],
+    task_id: Optional[str] = None,
+) -> List["EventDeliveryAttempt"]:
+    return EventDeliveryAttempt.objects.bulk_create(
+        [
+            EventDeliveryAttempt(
+                delivery=delivery,
+                task_id=task_id,
+                duration=None,
+                response=None,
+                request_headers=None,
+                response_headers=None,
+                status=EventDeliveryStatus.PENDING,
+            )
+            for delivery in deliveries
+        ]
+    )
+
+
+ATTEMPT_RESPONSE_FIELDS = [
+    "duration",
+    "response",
+    "response_headers",
+    "response_status_code",
+    "request_headers",
+    "status",
+]
+
+
+def set_attempt_response(
     attempt: "EventDeliveryAttempt",
     webhook_response: "WebhookResponse",
 ):
@@ -370,16 +600,14 @@ def attempt_update(
     attempt.response_status_code = webhook_response.response_status_code
     attempt.request_headers = json.dumps(webhook_response.request_headers)
     attempt.status = webhook_response.status
-    attempt.save(
-        update_fields=[
-            "duration",
-            "response",
-            "response_headers",
-            "response_status_code",
-            "request_headers",
-            "status",
-        ]
-    )
+
+
+def attempt_update(
+    attempt: "EventDeliveryAttempt",
+    webhook_response: "WebhookResponse",
+):
+    set_attempt_response(attempt, webhook_response)
+    attempt.save(update_fields=ATTEMPT_RESPONSE_FIELDS)
 
 
 def clear_successful_delivery(delivery: "EventDelivery"):
@@ -387,7 +615,15 @@ def clear_successful_delivery(delivery: "EventDelivery"):
         payload_id = delivery.payload_id
         delivery.delete()
         if payload_id:
-            EventPayload.objects.filter(pk=payload_id, deliveries__isnull=True).delete()
+            EventPayload.objects.filter(pk=payload_id).delete_unused()
+
+
+def clear_successful_deliveries(deliveries: List["EventDelivery"]):
+    payload_ids = {delivery.payload_id for delivery in deliveries}
+    EventDelivery.objects.filter(
+        id__in=[delivery.id for delivery in deliveries]
+    ).delete()
+    EventPayload.objects.filter(pk__in=payload_ids).delete_unused()
 
 
 def delivery_update(delivery: "EventDelivery", status: str):
@@ -446,13 +682,14 @@ def trigger_transaction_request(
         payload = generate_transaction_action_request_payload(
             transaction_data, requestor
         )
-        event_payload = EventPayload.objects.create(payload=payload)
-        delivery = EventDelivery.objects.create(
-            status=EventDeliveryStatus.PENDING,
-            event_type=event_type,
-            payload=event_payload,
-            webhook=webhook,
-        )
+        with transaction.atomic():
+            event_payload = EventPayload.objects.create_with_payload(payload)
+            delivery = EventDelivery.objects.create(
+                status=EventDeliveryStatus.PENDING,
+                event_type=event_type,
+                payload=event_payload,
+                webhook=webhook,
+            )
     call_event(
         handle_transaction_request_task.delay,
         delivery.id,
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Set
 
 from django.conf import settings
 from django.db.models import Q
@@ -7,6 +7,7 @@ from django.db.models.expressions import Exists, OuterRef
 from ..app.models import App
 from .event_types import WebhookEventAsyncType, WebhookEventSyncType
 from .models import Webhook, WebhookEvent
+from .registry import WebhooksRegistry, get_webhooks_registry
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -23,6 +24,21 @@ def get_webhooks_for_event(
     required_permission = WebhookEventAsyncType.PERMISSIONS.get(
         event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
     )
+    webhook_ids = None
+    if settings.WEBHOOKS_REGISTRY_ENABLED:
+        registry = get_webhooks_registry()
+        if registry is not None:
+            webhook_ids = _get_webhook_ids_from_registry(
+                registry,
+                event_type,
+                required_permission.value if required_permission else None,
+                apps_ids,
+                apps_identifier,
+            )
+            # Events without subscribers are the most common case, so they don't
+            # hit the database at all.
+            if not webhook_ids:
+                return Webhook.objects.none()
     if required_permission:
         app_label, codename = required_permission.value.split(".")
         permissions["permissions__content_type__app_label"] = app_label
@@ -52,12 +68,38 @@ def get_webhooks_for_event(
     webhook_events = WebhookEvent.objects.using(
         settings.DATABASE_CONNECTION_REPLICA_NAME
     ).filter(event_type__in=event_types)
+    webhooks = webhooks.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+    # The registry only narrows down the webhooks, which are still checked against
+    # the database, as it can miss changes made without signals, e.g. updates.
+    if webhook_ids is not None:
+        webhooks = webhooks.filter(id__in=webhook_ids)
     return (
-        webhooks.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(
+        webhooks.filter(
             Q(is_active=True, app__in=apps)
             & Q(Exists(webhook_events.filter(webhook_id=OuterRef("id"))))
         )
         .select_related("app")
         .prefetch_related("app__permissions__content_type")
     )
+
+
+def _get_webhook_ids_from_registry(
+    registry: WebhooksRegistry,
+    event_type: str,
+    required_permission: Optional[str],
+    apps_ids: Optional["list[int]"],
+    apps_identifier: Optional[list[str]],
+) -> Set[int]:
+    subscriptions = registry.get(event_type, [])
+    if event_type in WebhookEventAsyncType.ALL:
+        subscriptions = subscriptions + registry.get(WebhookEventAsyncType.ANY, [])
+    return {
+        subscription.webhook_id
+        for subscription in subscriptions
+        if (
+            not required_permission
+            or required_permission in subscription.app_permissions
+        )
+        and (not apps_ids or subscription.app_id in apps_ids)
+        and (not apps_identifier or subscription.app_identifier in apps_identifier)
+    }
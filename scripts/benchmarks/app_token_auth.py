@@ -0,0 +1,76 @@
+"""Compare latency of app-authenticated requests with and without the token cache.
+
+Creates a temporary app with a token in the configured database, sends the same
+query with the app token through the Django test client, first with
+`APP_TOKEN_CACHE_TIMEOUT=0` and then with the cache enabled, and removes the app:
+
+    python scripts/benchmarks/app_token_auth.py --requests 200
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "saleor.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.cache import cache  # noqa: E402
+from django.test import Client, override_settings  # noqa: E402
+
+from saleor.app.models import App, AppToken  # noqa: E402
+from saleor.graphql.app.dataloaders import get_app_token_cache_key  # noqa: E402
+
+QUERY = "query BenchmarkApp { app { id } }"
+
+
+def run_benchmark(client: Client, raw_token: str, total: int) -> dict:
+    latencies = []
+    for _ in range(total):
+        start = time.perf_counter()
+        response = client.post(
+            "/graphql/",
+            data={"query": QUERY},
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {raw_token}",
+        )
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200, response.content
+    latencies.sort()
+    return {
+        "mean": sum(latencies) / total * 1000,
+        "p50": latencies[total // 2] * 1000,
+        "p99": latencies[int(total * 0.99) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    app = App.objects.create(name="Token cache benchmark", is_active=True)
+    _, raw_token = AppToken.objects.create(app=app)
+    client = Client()
+    try:
+        for timeout in [0, 60]:
+            cache.delete(get_app_token_cache_key(raw_token))
+            with override_settings(
+                ALLOWED_HOSTS=["*"], APP_TOKEN_CACHE_TIMEOUT=timeout
+            ):
+                result = run_benchmark(client, raw_token, args.requests)
+            name = "cache enabled" if timeout else "cache disabled"
+            print(
+                f"{name:>14}: mean {result['mean']:7.1f} ms  "
+                f"p50 {result['p50']:7.1f} ms  p99 {result['p99']:7.1f} ms"
+            )
+    finally:
+        cache.delete(get_app_token_cache_key(raw_token))
+        app.delete()
+
+
+if __name__ == "__main__":
+    main()
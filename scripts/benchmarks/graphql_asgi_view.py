@@ -0,0 +1,121 @@
+"""Compare requests per second of the sync and async GraphQL views under uvicorn.
+
+The script starts uvicorn twice, once with `GRAPHQL_ASYNC_VIEW=False` and once with
+`GRAPHQL_ASYNC_VIEW=True`, and sends the same query from concurrent clients to
+both servers. The environment (database, cache, etc.) is taken from the current
+shell, so run it against a populated development database:
+
+    python scripts/benchmarks/graphql_asgi_view.py --concurrency 32 --requests 2000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+DEFAULT_QUERY = """
+query BenchmarkProducts($channel: String) {
+  products(first: 20, channel: $channel) {
+    edges {
+      node {
+        id
+        name
+        category {
+          name
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def wait_for_server(url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(url, timeout=1)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not start in {timeout} seconds.")
+
+
+def run_benchmark(url: str, payload: dict, concurrency: int, total: int):
+    session = requests.Session()
+
+    def send(_):
+        start = time.perf_counter()
+        response = session.post(url, json=payload, timeout=60)
+        response.raise_for_status()
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(send, range(concurrency)))  # warm up
+        start = time.perf_counter()
+        latencies = sorted(executor.map(send, range(total)))
+        elapsed = time.perf_counter() - start
+    return {
+        "rps": total / elapsed,
+        "p50": latencies[len(latencies) // 2] * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def benchmark_view(async_view: bool, args) -> dict:
+    env = dict(os.environ, GRAPHQL_ASYNC_VIEW=str(async_view), DEBUG="False")
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "saleor.asgi:application",
+            "--port",
+            str(args.port),
+            "--workers",
+            str(args.workers),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+    try:
+        base_url = f"http://127.0.0.1:{args.port}"
+        wait_for_server(f"{base_url}/health/")
+        return run_benchmark(
+            f"{base_url}/graphql/", args.payload, args.concurrency, args.requests
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--channel", default="default-channel")
+    parser.add_argument("--query-file", help="File with the query to send.")
+    args = parser.parse_args()
+    query = DEFAULT_QUERY
+    if args.query_file:
+        with open(args.query_file) as query_file:
+            query = query_file.read()
+    args.payload = {"query": query, "variables": {"channel": args.channel}}
+
+    for async_view in [False, True]:
+        result = benchmark_view(async_view, args)
+        name = "AsyncGraphQLView" if async_view else "GraphQLView"
+        print(
+            f"{name:>16}: {result['rps']:8.1f} req/s  "
+            f"p50 {result['p50']:7.1f} ms  p99 {result['p99']:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
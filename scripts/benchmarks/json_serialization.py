@@ -0,0 +1,145 @@
+"""Compare serializers of GraphQL responses.
+
+Serializes responses shaped like the ones returned by Saleor for product listings
+(with variants, pricing and attributes), checkouts and introspection queries
+with the standard library and with the fast serializer:
+
+    python scripts/benchmarks/json_serialization.py --products 100
+"""
+import argparse
+import datetime
+import os
+import sys
+import timeit
+import uuid
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "saleor.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from prices import Money  # noqa: E402
+
+from saleor.core.utils.json_serializer import fast_json_dumps, json_dumps  # noqa: E402
+
+
+def money(amount: str) -> dict:
+    return {"amount": float(amount), "currency": "USD"}
+
+
+def product_node(index: int) -> dict:
+    created = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+    return {
+        "id": f"UHJvZHVjdDo{index}",
+        "name": f"Product {index}",
+        "slug": f"product-{index}",
+        "created": created + datetime.timedelta(minutes=index),
+        "updatedAt": created.isoformat(),
+        "thumbnail": {"url": f"https://example.com/{index}.png", "alt": ""},
+        "pricing": {
+            "onSale": index % 2 == 0,
+            "priceRange": {
+                "start": {"gross": money("10.00"), "net": money("8.13")},
+                "stop": {"gross": money("25.00"), "net": money("20.33")},
+            },
+        },
+        "attributes": [
+            {
+                "attribute": {"id": str(uuid.uuid4()), "slug": f"attribute-{i}"},
+                "values": [
+                    {"name": f"Value {j}", "slug": f"value-{j}"} for j in range(3)
+                ],
+            }
+            for i in range(5)
+        ],
+        "variants": [
+            {
+                "id": str(uuid.uuid4()),
+                "sku": f"SKU-{index}-{i}",
+                "quantityAvailable": 10 + i,
+                "pricing": {"price": {"gross": money("10.00")}},
+                "weight": Decimal("1.25"),
+            }
+            for i in range(5)
+        ],
+    }
+
+
+def product_listing(products: int) -> dict:
+    return {
+        "data": {
+            "products": {
+                "totalCount": products,
+                "edges": [{"node": product_node(i)} for i in range(products)],
+                "pageInfo": {"hasNextPage": True, "endCursor": "WyIxMDAiXQ=="},
+            }
+        },
+        "extensions": {"cost": {"requestedQueryCost": 1500, "maximumAvailable": 50000}},
+    }
+
+
+def checkout() -> dict:
+    return {
+        "data": {
+            "checkout": {
+                "id": str(uuid.uuid4()),
+                "totalPrice": Money(Decimal("123.45"), "USD"),
+                "lines": [
+                    {"id": str(uuid.uuid4()), "quantity": i, "price": Decimal("9.99")}
+                    for i in range(20)
+                ],
+            }
+        }
+    }
+
+
+def introspection() -> dict:
+    return {
+        "data": {
+            "__schema": {
+                "types": [
+                    {
+                        "kind": "OBJECT",
+                        "name": f"Type{i}",
+                        "description": "A type." * 5,
+                        "fields": [
+                            {"name": f"field{j}", "args": [], "isDeprecated": False}
+                            for j in range(20)
+                        ],
+                    }
+                    for i in range(1000)
+                ]
+            }
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    responses = {
+        f"products (first: {args.products})": product_listing(args.products),
+        "checkout": checkout(),
+        "introspection": introspection(),
+    }
+    for name, response in responses.items():
+        results = {}
+        for serializer in [json_dumps, fast_json_dumps]:
+            elapsed = timeit.timeit(lambda: serializer(response), number=args.number)
+            results[serializer.__name__] = elapsed / args.number * 1000
+        speedup = results["json_dumps"] / results["fast_json_dumps"]
+        print(
+            f"{name:>24}: json_dumps {results['json_dumps']:8.3f} ms  "
+            f"fast_json_dumps {results['fast_json_dumps']:8.3f} ms  "
+            f"({speedup:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
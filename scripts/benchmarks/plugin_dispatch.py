@@ -0,0 +1,98 @@
+"""Compare checkout total calculation with and without plugin dispatch tables.
+
+Creates a checkout with many lines in the first channel of the configured
+database, calculates its subtotal and total with the configured plugins, first
+calling hooks on all plugins of the channel (as before dispatch tables) and then
+only on the plugins implementing them, and rolls the checkout back:
+
+    python scripts/benchmarks/plugin_dispatch.py --lines 100 --repeat 20
+"""
+import argparse
+import os
+import sys
+import timeit
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "saleor.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import transaction  # noqa: E402
+
+from saleor.channel.models import Channel  # noqa: E402
+from saleor.checkout.fetch import (  # noqa: E402
+    fetch_checkout_info,
+    fetch_checkout_lines,
+)
+from saleor.checkout.models import Checkout, CheckoutLine  # noqa: E402
+from saleor.plugins.manager import PluginsManager, get_plugins_manager  # noqa: E402
+from saleor.product.models import ProductVariant  # noqa: E402
+
+
+def get_all_plugins(manager, method_name, channel_slug=None):
+    return manager.get_plugins(channel_slug=channel_slug)
+
+
+def create_checkout(channel: Channel, lines_count: int) -> Checkout:
+    variants = ProductVariant.objects.filter(
+        channel_listings__channel=channel,
+        channel_listings__price_amount__isnull=False,
+    )[:lines_count]
+    if len(variants) < lines_count:
+        raise SystemExit(
+            f"Channel {channel.slug} has only {len(variants)} variants with prices."
+        )
+    checkout = Checkout.objects.create(
+        channel=channel, currency=channel.currency_code, email="bench@example.com"
+    )
+    CheckoutLine.objects.bulk_create(
+        [
+            CheckoutLine(checkout=checkout, variant=variant, quantity=1)
+            for variant in variants
+        ]
+    )
+    return checkout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    channel = Channel.objects.order_by("pk").first()
+    if channel is None:
+        raise SystemExit("Populate the database first.")
+
+    with transaction.atomic():
+        checkout = create_checkout(channel, args.lines)
+        manager = get_plugins_manager()
+        lines, _ = fetch_checkout_lines(checkout)
+        checkout_info = fetch_checkout_info(checkout, lines, manager)
+
+        def calculate():
+            manager.calculate_checkout_subtotal(checkout_info, lines, None)
+            manager.calculate_checkout_total(checkout_info, lines, None)
+
+        print(
+            f"{len(manager.get_plugins(channel.slug))} plugins in channel "
+            f"{channel.slug}, {args.lines} checkout lines"
+        )
+        with mock.patch.object(
+            PluginsManager, "_get_plugins_implementing", get_all_plugins
+        ):
+            all_plugins = min(timeit.repeat(calculate, number=1, repeat=args.repeat))
+        implementing = min(timeit.repeat(calculate, number=1, repeat=args.repeat))
+        for name, elapsed in [
+            ("all plugins", all_plugins),
+            ("dispatch tables", implementing),
+        ]:
+            print(f"{name:>16}: {elapsed * 1000:8.2f} ms")
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Compare deliveries/sec of webhook requests with and without pooled sessions.
+
+Starts a local stub server answering with keep-alive HTTP/1.1 responses and sends
+webhook requests to it with `send_webhook_using_http`:
+
+- with a new session per request, as before pooling them,
+- with sessions pooled by threads of a single executor,
+- in batches, as `send_webhook_requests_async` does, first with a new executor
+  per batch and then with the executor shared by the process, whose threads keep
+  their sessions between tasks.
+
+The IP filter stays enabled, with loopback addresses allowed for the stub server:
+
+    python scripts/benchmarks/webhook_http_pool.py --requests 1000 --threads 10
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "saleor.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+
+from saleor.core.http_client import HTTPClient  # noqa: E402
+from saleor.webhook.event_types import WebhookEventAsyncType  # noqa: E402
+from saleor.webhook.transport.asynchronous.transport import (  # noqa: E402
+    get_delivery_executor,
+)
+from saleor.webhook.transport.utils import send_webhook_using_http  # noqa: E402
+
+PAYLOAD = '{"order": {"id": "T3JkZXI6MQ=="}}'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def send(target_url: str):
+    response = send_webhook_using_http(
+        target_url,
+        PAYLOAD,
+        "localhost:8000",
+        "",
+        WebhookEventAsyncType.ORDER_UPDATED,
+    )
+    if response.response_status_code != 200:
+        raise SystemExit(f"Request failed: {response.content}")
+
+
+def send_requests(target_url: str, count: int, threads: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: send(target_url), range(count)))
+    return count / (time.perf_counter() - start)
+
+
+def send_batches(
+    target_url: str, count: int, threads: int, batch_size: int, shared: bool
+) -> float:
+    start = time.perf_counter()
+    for index in range(0, count, batch_size):
+        batch = range(min(batch_size, count - index))
+        if shared:
+            list(get_delivery_executor().map(lambda _: send(target_url), batch))
+        else:
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                list(executor.map(lambda _: send(target_url), batch))
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=50)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    target_url = f"http://127.0.0.1:{server.server_port}/webhook"
+
+    HTTPClient.config.ip_filter_enable = True
+    HTTPClient.config.ip_filter_allow_loopback_ips = True
+    settings.WEBHOOK_DELIVERY_CONCURRENCY = args.threads
+    idle_timeout = HTTPClient.idle_timeout or 30
+    results = []
+    try:
+        HTTPClient.idle_timeout = 0
+        results.append(
+            ("per request", send_requests(target_url, args.requests, args.threads))
+        )
+        HTTPClient.idle_timeout = idle_timeout
+        results.append(
+            ("pooled", send_requests(target_url, args.requests, args.threads))
+        )
+        for name, shared in [("executor per batch", False), ("shared executor", True)]:
+            rate = send_batches(
+                target_url, args.requests, args.threads, args.batch_size, shared
+            )
+            results.append((name, rate))
+    finally:
+        server.shutdown()
+
+    print(
+        f"{args.requests} requests sent by {args.threads} threads, "
+        f"batches of {args.batch_size}"
+    )
+    for name, rate in results:
+        print(f"{name:>18}: {rate:8.1f} deliveries/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Compare creating subscription deliveries with and without shared payloads.
+
+Creates apps with the same permissions subscribed to `ORDER_UPDATED` with the same
+subscription query, generates deliveries for the first order of the configured
+database, first with a context and a payload per webhook (as before sharing
+them) and then shared by the apps, and rolls the apps back:
+
+    python scripts/benchmarks/webhook_subscriptions.py --apps 10 --repeat 10
+"""
+import argparse
+import os
+import sys
+import timeit
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "saleor.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+from saleor.app.models import App  # noqa: E402
+from saleor.order.models import Order  # noqa: E402
+from saleor.permission.enums import OrderPermissions  # noqa: E402
+from saleor.permission.models import Permission  # noqa: E402
+from saleor.webhook.event_types import WebhookEventAsyncType  # noqa: E402
+from saleor.webhook.models import Webhook  # noqa: E402
+from saleor.webhook.transport.asynchronous import transport  # noqa: E402
+
+ORDER_UPDATED_SUBSCRIPTION = """
+subscription {
+  event {
+    ... on OrderUpdated {
+      order {
+        id
+        number
+        status
+        channel { slug }
+        user { email }
+        total { gross { amount currency } }
+        lines {
+          productName
+          variantName
+          quantity
+          variant { sku product { name category { name } } }
+          unitPrice { gross { amount } }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def create_apps(count: int):
+    permission = Permission.objects.get(
+        codename=OrderPermissions.MANAGE_ORDERS.codename
+    )
+    for index in range(count):
+        app = App.objects.create(name=f"Benchmark app {index}", is_active=True)
+        app.permissions.add(permission)
+        webhook = Webhook.objects.create(
+            name="Order updated",
+            app=app,
+            target_url="https://example.com/webhook",
+            subscription_query=ORDER_UPDATED_SUBSCRIPTION,
+        )
+        webhook.events.create(event_type=WebhookEventAsyncType.ORDER_UPDATED)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--apps", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    order = Order.objects.order_by("pk").first()
+    if order is None:
+        raise SystemExit("Populate the database first.")
+
+    event_type = WebhookEventAsyncType.ORDER_UPDATED
+    with transaction.atomic():
+        create_apps(args.apps)
+        # Apps aren't committed, so they are read like in `get_webhooks_for_event`
+        # but from the default database.
+        webhooks = list(
+            Webhook.objects.filter(app__name__startswith="Benchmark app")
+            .select_related("app")
+            .prefetch_related("app__permissions__content_type")
+        )
+
+        def create_deliveries():
+            transport.create_deliveries_for_subscriptions(event_type, order, webhooks)
+
+        print(f"{len(webhooks)} webhooks subscribed to {event_type}")
+        # Each app gets its own context and payload when their keys differ.
+        with mock.patch.object(
+            transport, "get_app_permissions_key", lambda app: frozenset([-app.pk])
+        ):
+            per_webhook = min(
+                timeit.repeat(create_deliveries, number=1, repeat=args.repeat)
+            )
+            with CaptureQueriesContext(connection) as per_webhook_queries:
+                create_deliveries()
+        shared = min(timeit.repeat(create_deliveries, number=1, repeat=args.repeat))
+        with CaptureQueriesContext(connection) as shared_queries:
+            create_deliveries()
+        for name, elapsed, queries in [
+            ("per webhook", per_webhook, per_webhook_queries),
+            ("shared", shared, shared_queries),
+        ]:
+            print(f"{name:>12}: {elapsed * 1000:8.2f} ms, {len(queries)} queries")
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    main()